@@ -0,0 +1,5458 @@
+#!/usr/bin/env python3
+"""
+apathetic_logging — Small quality-of-life features on top of stdlib.
+This stitched version is auto-generated from modular sources.
+Version: 0.22.0
+Commit: unknown (local build)
+Built: 2026-10-17 13:17:07 UTC
+"""
+# apathetic_logging — Small quality-of-life features on top of stdlib.
+# ============LICENSE=============
+# License: MIT-a-NOAI
+# Full text: https://github.com/apathetic-tools/python-logging/blob/main/LICENSE
+# ================================
+# Version: 0.22.0
+# Commit: unknown (local build)
+# Build Date: 2026-10-17 13:17:07 UTC
+# Repo: https://github.com/apathetic-tools/python-logging
+# Build Tool: serger — 0.22.0 — unknown (local build) — 2026-10-17 13:17:07 UTC
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import copy
+import importlib
+import inspect
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import types
+import weakref
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, suppress
+from types import FrameType
+from typing import TYPE_CHECKING, Any, ClassVar, TextIO, TypeAlias, TypeVar, cast
+
+
+__version__ = "0.22.0"
+__commit__ = "unknown (local build)"
+__build_date__ = "2026-10-17 13:17:07 UTC"
+__STITCHED__ = True
+__STITCH_SOURCE__ = "serger"
+__package__ = "apathetic_logging"
+
+
+# === apathetic_logging.constants ===
+# src/apathetic_logging/constants.py
+"""Constants for Apathetic Logging."""
+
+
+class ApatheticLogging_Internal_Constants:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Constants for apathetic logging functionality.
+
+    This class contains all constant values used by apathetic_logging.
+    It's kept separate for organizational purposes.
+    """
+
+    DEFAULT_APATHETIC_LOG_LEVEL: str = "detail"
+    """Default log level when no other source is found."""
+
+    DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS: ClassVar[list[str]] = ["LOG_LEVEL"]
+    """Default environment variable names to check for log level."""
+
+    INHERIT_LEVEL: int = logging.NOTSET
+    """INHERIT level (0) - logger inherits level from parent.
+
+    This is the preferred constant name. Use INHERIT_LEVEL in new code.
+    Equivalent to stdlib logging.NOTSET.
+    """
+
+    NOTSET_LEVEL: int = INHERIT_LEVEL
+    """NOTSET level (0) - logger inherits level from parent.
+
+    Alias for INHERIT_LEVEL, kept for compatibility with stdlib
+    logging.NOTSET terminology. Use INHERIT_LEVEL in new code for clarity.
+    """
+
+    ROOT_ALLOW_ALL_LEVEL: int = logging.NOTSET
+    """Root logger accepts all messages level (0).
+
+    When the root logger is set to this level, it accepts all messages
+    without filtering, regardless of severity. This is stdlib logging behavior:
+    a logger set to NOTSET (0) processes all messages (unlike child loggers
+    which inherit from parent when NOTSET).
+
+    Note: Use ROOT_ALLOW_ALL_LEVEL when explicitly setting root to accept
+    all messages for clarity. Equivalent to logging.NOTSET.
+    """
+
+    # levels must be careful not to equal 0 to avoid INHERIT_LEVEL (i.e. NOTSET)
+    TEST_LEVEL: int = logging.DEBUG - 8
+    """Most verbose level, bypasses capture."""
+
+    TRACE_LEVEL: int = logging.DEBUG - 5
+    """More verbose than DEBUG."""
+
+    DETAIL_LEVEL: int = logging.INFO - 5
+    """More detailed than INFO."""
+
+    BRIEF_LEVEL: int = logging.INFO + 5
+    """Less detailed than INFO."""
+
+    SILENT_LEVEL: int = logging.CRITICAL + 1
+    """Disables all logging (one above the highest builtin level)."""
+
+    # Standard library logging levels (exposed for convenience and consistency)
+    DEBUG_LEVEL: int = logging.DEBUG
+    """Standard library DEBUG level (10)."""
+
+    INFO_LEVEL: int = logging.INFO
+    """Standard library INFO level (20)."""
+
+    WARNING_LEVEL: int = logging.WARNING
+    """Standard library WARNING level (30)."""
+
+    ERROR_LEVEL: int = logging.ERROR
+    """Standard library ERROR level (40)."""
+
+    CRITICAL_LEVEL: int = logging.CRITICAL
+    """Standard library CRITICAL level (50)."""
+
+    LEVEL_ORDER: ClassVar[list[str]] = [
+        "test",  # most verbose, bypasses capture for debugging tests
+        "trace",
+        "debug",
+        "detail",
+        "info",
+        "brief",
+        "warning",
+        "error",
+        "critical",
+        "silent",  # disables all logging
+    ]
+    """Ordered list of log level names from most to least verbose."""
+
+    class ANSIColors:
+        """A selection of ANSI color code constants.
+
+        For a comprehensive reference on ANSI escape codes and color support,
+        see: https://en.wikipedia.org/wiki/ANSI_escape_code#Colors
+        """
+
+        RESET: str = "\033[0m"
+        """Reset ANSI color codes."""
+
+        CYAN: str = "\033[36m"
+        """Cyan ANSI color code."""
+
+        YELLOW: str = "\033[93m"  # or \033[33m
+        """Yellow ANSI color code."""
+
+        RED: str = "\033[91m"  # or \033[31m # or background \033[41m
+        """Red ANSI color code."""
+
+        GREEN: str = "\033[92m"  # or \033[32m
+        """Green ANSI color code."""
+
+        GRAY: str = "\033[90m"
+        """Gray ANSI color code."""
+
+    TAG_STYLES: ClassVar[dict[str, tuple[str, str]]] = {
+        "TEST": (ANSIColors.GRAY, "[TEST]"),
+        "TRACE": (ANSIColors.GRAY, "[TRACE]"),
+        "DEBUG": (ANSIColors.CYAN, "[DEBUG]"),
+        "WARNING": ("", "⚠️ "),
+        "ERROR": ("", "❌ "),
+        "CRITICAL": ("", "💥 "),
+    }
+    """Mapping of level names to (color_code, tag_text) tuples."""
+
+    TARGET_PYTHON_VERSION: tuple[int, int] | None = None
+    """Target Python version (major, minor).
+
+    If None, target version checks are disabled by default.
+    """
+
+    DEFAULT_PROPAGATE: bool = True
+    """Default propagate setting for loggers.
+
+    When True, loggers propagate messages to parent loggers, allowing
+    centralized control via root logger. Only root logger has handlers
+    to avoid duplicate messages.
+    """
+
+    DEFAULT_MANAGE_HANDLERS: bool = True
+    """Default value for manage_handlers parameter in setPropagate().
+
+    When True (default), setPropagate() automatically manages apathetic
+    handlers based on propagate setting. When False, only sets propagate
+    without managing handlers. In compat_mode, this may default to False.
+    """
+
+    ROOT_LOGGER_KEY: str = ""
+    """Key used to retrieve the root logger via logging.getLogger("").
+
+    The root logger is retrieved using an empty string as the logger name.
+    """
+
+    ROOT_LOGGER_NAME: str = "root"
+    """Name attribute of the root logger instance.
+
+    Note: logging.getLogger("") returns the root logger, but its .name
+    attribute is "root" (not ""). This constant represents the actual
+    name attribute value of the root logger instance.
+    """
+
+    DEFAULT_REPLACE_ROOT_LOGGER: bool = True
+    """Default value for whether to replace root logger if it's not the correct type.
+
+    When True (default), extendLoggingModule() will replace the root logger
+    if it's not an instance of the apathetic logger class, ensuring the root
+    logger has apathetic logger methods like manageHandlers(), trace(), etc.
+    When False, the root logger will not be replaced, allowing applications
+    to use their own custom logger class for the root logger.
+    """
+
+    DEFAULT_PORT_HANDLERS: bool = True
+    """Default value for whether to port handlers when replacing a logger.
+
+    When True (default), handlers from the old logger are ported to the new logger,
+    preserving existing configuration. When False, the new apathetic logger manages
+    its own handlers via manageHandlers() (may conflict with ported handlers).
+    """
+
+    DEFAULT_PORT_LEVEL: bool = True
+    """Default value for whether to port level when replacing a logger.
+
+    When True (default), the log level is ported from the old logger to the new
+    logger, preserving existing configuration. When False, the new logger uses
+    apathetic defaults (determineLogLevel() for root logger, INHERIT_LEVEL for
+    leaf loggers). Note: User-provided level parameters in getLogger/getLoggerOfType
+    take precedence over ported level.
+    """
+
+
+# === apathetic_logging.registry_data ===
+# src/apathetic_logging/registry_data.py
+"""Registry for configurable log level settings."""
+
+
+class ApatheticLogging_Internal_RegistryData:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides registry storage for configurable settings.
+
+    This class contains class-level attributes for storing registered configuration
+    values. When mixed into apathetic_logging, it provides centralized storage for
+    log level environment variables, default log level, logger name, target
+    Python version, and propagate setting.
+
+    Other mixins access these registries via direct class reference:
+    ``ApatheticLogging_Internal_RegistryData.registered_internal_*``
+    """
+
+    # Registry for configurable log level settings
+    # These are class-level attributes to avoid module-level namespace pollution
+    # Public but marked with _internal_ to indicate internal use by other mixins
+    registered_internal_log_level_env_vars: list[str] | None = None
+    """Environment variable names to check for log level configuration.
+
+    If None, falls back to DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS from constants.py.
+    The environment variables are checked in order, and the first non-empty value
+    found is used. Set via registerLogLevelEnvVars() or register_log_level_env_vars().
+    """
+    registered_internal_default_log_level: str | None = None
+    """Default log level to use when no other source is found.
+
+    If None, falls back to DEFAULT_APATHETIC_LOG_LEVEL from constants.py.
+    Used when no environment variable is set and no root log level is provided.
+    Set via registerDefaultLogLevel() or register_default_log_level().
+    """
+    registered_internal_logger_name: str | None = None
+    """Registered logger name to use for logger name inference.
+
+    If None, logger names are inferred from the calling module's __package__
+    attribute. When set, this value is returned by getDefaultLoggerName() instead
+    of inferring from the call stack. Set via registerLogger() or register_logger().
+    """
+    registered_internal_target_python_version: tuple[int, int] | None = None
+    """Target Python version (major, minor) for compatibility checking.
+
+    If None, falls back to TARGET_PYTHON_VERSION from constants.py.
+    Used to validate function calls against target version, not just runtime version.
+    """
+    registered_internal_propagate: bool | None = None
+    """Propagate setting for loggers.
+
+    If None, falls back to DEFAULT_PROPAGATE from constants.py.
+    When True, loggers propagate messages to parent loggers, allowing
+    centralized control via root logger.
+    """
+    registered_internal_compatibility_mode: bool | None = None
+    """Compatibility mode setting for stdlib drop-in replacement.
+
+    If None, defaults to False (current improved behavior).
+    When True, restores stdlib-compatible behavior where possible
+    (e.g., getLogger(None) returns root logger).
+    Set via registerCompatibilityMode() or register_compatibility_mode().
+    """
+    registered_internal_replace_root_logger: bool | None = None
+    """Whether to replace root logger if it's not the correct type.
+
+    If None, defaults to DEFAULT_REPLACE_ROOT_LOGGER from constants.py
+    (True by default - replace root logger to ensure it's an apathetic logger).
+    When False, extendLoggingModule() will not replace the root logger, allowing
+    applications to use their own custom logger class for the root logger.
+    Set via registerReplaceRootLogger() or register_replace_root_logger().
+    """
+    registered_internal_port_handlers: bool | None = None
+    """Whether to port handlers when replacing a logger.
+
+    If None, defaults to DEFAULT_PORT_HANDLERS from constants.py
+    (True by default - port handlers to preserve existing configuration).
+    When False, new logger manages its own handlers via manageHandlers().
+    Set via registerPortHandlers() or register_port_handlers().
+    """
+    registered_internal_port_level: bool | None = None
+    """Whether to port level when replacing a logger.
+
+    If None, defaults to DEFAULT_PORT_LEVEL from constants.py
+    (True by default - port level to preserve existing configuration).
+    When False, the new logger uses apathetic defaults (determineLogLevel()
+    for root, INHERIT_LEVEL for leaf loggers). Note: User-provided level
+    parameters in getLogger/getLoggerOfType take precedence over ported level.
+    Set via registerPortLevel() or register_port_level().
+    """
+
+
+# === apathetic_logging.logging_utils ===
+# src/apathetic_logging/logging_utils.py
+"""Logging utilities for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides helper functions for the standard logging module.
+
+    This class contains utility functions that operate directly on or replace
+    standard library `logging.*` utilities and functions. These helpers extend
+    or wrap the built-in logging module functionality to provide enhanced
+    capabilities or safer alternatives.
+
+    When mixed into apathetic_logging, it provides utility functions that
+    interact with Python's standard logging module.
+    """
+
+    _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
+
+    @staticmethod
+    def _getCompatibilityMode() -> bool:
+        """Get the compatibility mode setting from registry.
+
+        Returns the registered compatibility mode setting, or False (improved
+        behavior) if not registered. This is an internal helper to avoid
+        circular imports (registry.py imports from logging_utils.py).
+
+        Returns:
+            Compatibility mode setting (True or False).
+            Defaults to False if not registered.
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        return (
+            _registry_data.registered_internal_compatibility_mode
+            if _registry_data.registered_internal_compatibility_mode is not None
+            else False
+        )
+
+    @staticmethod
+    def getLevelName(
+        level: int | str, *args: Any, strict: bool = False, **kwargs: Any
+    ) -> str | int:
+        """Return the textual or numeric representation of a logging level.
+
+        Behavior depends on compatibility mode (set via `registerCompatibilityMode()`):
+
+        - Value-add: Uppercases string inputs before processing
+
+        **Compatibility mode disabled (`compat_mode=False`, default):**
+        - Accepts both integer and string input
+        - For string input: validates level exists and returns canonical
+          level name string
+        - For integer input: returns level name as string (never returns `int`)
+        - Optional strict mode to raise `ValueError` for unknown integer levels
+
+        For string→int conversion, use `getLevelNumber()` instead.
+
+        **Compatibility mode enabled (`compat_mode=True`):**
+        - Behaves like stdlib `logging.getLevelName()` (bidirectional)
+        - Returns `str` for integer input, `int` for string input (known levels)
+        - Returns `"Level {level}"` string for unknown levels
+
+        Args:
+            level: Log level as integer or string name
+            *args: Additional positional arguments (for future-proofing)
+            strict: If True, raise ValueError for unknown levels. If False (default),
+                returns "Level {level}" format for unknown integer levels (matching
+                stdlib behavior). Only used when compatibility mode is disabled and
+                level is an integer.
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            - Compatibility mode enabled: `str | int` (bidirectional like stdlib)
+            - Compatibility mode disabled: `str` (always string; string input
+              is validated and returns canonical name, int input is converted
+              to name)
+
+        Raises:
+            ValueError: If string level cannot be resolved to a known level
+                (non-compat mode), or if strict=True and level is an integer
+                that cannot be resolved to a known level name
+
+        Example:
+            >>> # Compatibility mode enabled (stdlib-like behavior):
+            >>> from apathetic_logging import registerCompatibilityMode
+            >>> registerCompatibilityMode(compat_mode=True)
+            >>> getLevelName(10)  # int input
+            "DEBUG"
+            >>> getLevelName("DEBUG")  # string input
+            10
+            >>> getLevelName("debug")  # case-insensitive, uppercased
+            10
+
+            >>> # Compatibility mode disabled (improved behavior):
+            >>> registerCompatibilityMode(compat_mode=False)
+            >>> getLevelName(10)
+            "DEBUG"
+            >>> getLevelName("DEBUG")  # Validates and returns canonical name
+            "DEBUG"
+            >>> getLevelName("debug")  # Validates and returns canonical name
+            "DEBUG"
+            >>> getLevelName("UNKNOWN")  # Unknown string raises ValueError
+            ValueError: Unknown log level: 'UNKNOWN'
+
+        See Also:
+            getLevelNumber() - Convert string to int (when compat mode disabled)
+            registerCompatibilityMode() - Enable/disable compatibility mode
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLevelName
+        """
+        # Check compatibility mode from registry
+        compat_mode = ApatheticLogging_Internal_LoggingUtils._getCompatibilityMode()
+
+        # Use unidirectional functions to avoid duplication
+        if compat_mode and isinstance(level, str):
+            # Compatibility mode with string input → return int (like stdlib)
+            return ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+
+        # All other cases: return string (compat mode with int, or non-compat mode)
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(
+            level, *args, strict=strict, **kwargs
+        )
+
+    @staticmethod
+    def getLevelNumber(level: str | int) -> int:
+        """Convert a log level name to its numeric value.
+
+        Recommended way to convert string level names to integers. This function
+        explicitly performs string->int conversion, unlike `getLevelName()` which
+        has bidirectional behavior for backward compatibility.
+
+        Handles all levels registered via logging.addLevelName() (including
+        standard library levels, custom apathetic levels, and user-registered levels).
+
+        Args:
+            level: Log level as string name (case-insensitive) or integer
+
+        Returns:
+            Integer level value
+
+        Raises:
+            ValueError: If level cannot be resolved to a known level
+
+        Example:
+            >>> getLevelNumber("DEBUG")
+            10
+            >>> getLevelNumber("TRACE")
+            5
+            >>> getLevelNumber(20)
+            20
+            >>> getLevelNumber("UNKNOWN")
+            ValueError: Unknown log level: 'UNKNOWN'
+
+        See Also:
+            getLevelName() - Convert int to string (intended use)
+        """
+        if isinstance(level, int):
+            return level
+
+        level_str = level.upper()
+
+        # Use getattr() to find level constants registered via logging.addLevelName():
+        # - Standard library levels (DEBUG, INFO, etc.) - registered by default
+        # - Custom apathetic levels (TEST, TRACE, etc.)
+        #   registered via extendLoggingModule()
+        # - User-registered levels via our addLevelName() method
+        #   (but not stdlib's logging.addLevelName() which doesn't set attribute)
+        # - User-registered levels via setattr(logging, level_str, value)
+        resolved = getattr(logging, level_str, None)
+        if isinstance(resolved, int):
+            return resolved
+
+        # Unknown level: always raise
+        msg = f"Unknown log level: {level_str!r}"
+        raise ValueError(msg)
+
+    @staticmethod
+    def getLevelNameStr(
+        level: int | str, *args: Any, strict: bool = False, **kwargs: Any
+    ) -> str:
+        """Convert a log level to its string name representation.
+
+        Unidirectional function that always returns a string. This is the recommended
+        way to convert log levels to strings when you want guaranteed string output
+        without compatibility mode behavior.
+
+        Unlike `getLevelName()` which has compatibility mode and bidirectional
+        behavior, this function always returns a string:
+        - Integer input: converts to level name string (returns "Level {level}"
+          for unknown levels unless strict=True)
+        - String input: validates level exists, then returns uppercased string
+
+        Handles all levels registered via logging.addLevelName() (including
+        standard library levels, custom apathetic levels, and user-registered levels).
+
+        Args:
+            level: Log level as integer or string name (case-insensitive)
+            *args: Additional positional arguments (for future-proofing)
+            strict: If True, raise ValueError for unknown integer levels.
+                If False (default), returns "Level {level}" format for unknown
+                integer levels (matching stdlib behavior).
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            Level name as uppercase string
+
+        Raises:
+            ValueError: If string level cannot be resolved to a known level,
+                or if strict=True and integer level cannot be resolved to a
+                known level
+
+        Example:
+            >>> getLevelNameStr(10)
+            "DEBUG"
+            >>> getLevelNameStr(5)
+            "TRACE"
+            >>> getLevelNameStr("DEBUG")
+            "DEBUG"
+            >>> getLevelNameStr("debug")
+            "DEBUG"
+            >>> getLevelNameStr(999)  # Unknown integer, strict=False (default)
+            "Level 999"
+            >>> getLevelNameStr(999, strict=True)  # Unknown integer, strict=True
+            ValueError: Unknown log level: 999
+            >>> getLevelNameStr("UNKNOWN")
+            ValueError: Unknown log level: 'UNKNOWN'
+
+        See Also:
+            getLevelNumber() - Convert string to int (complementary function)
+            getLevelName() - Bidirectional conversion with compatibility mode
+        """
+        # If string input, validate it exists and return canonical name
+        if isinstance(level, str):
+            # Validate level exists (raises ValueError if not)
+            ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+            return level.upper()
+
+        # Integer input: convert to level name string
+        result = logging.getLevelName(level, *args, **kwargs)
+        # logging.getLevelName always returns str for int input
+
+        # If input was int and result is "Level {level}" format and strict is on, raise
+        if result.startswith("Level ") and strict:
+            msg = f"Unknown log level: {level}"
+            raise ValueError(msg)
+
+        # level name or (strict=False) "Level {int}"
+        return result
+
+    @staticmethod
+    def hasLogger(logger_name: str) -> bool:
+        """Check if a logger exists in the logging manager's registry.
+
+        Args:
+            logger_name: The name of the logger to check.
+
+        Returns:
+            True if the logger exists in the registry, False otherwise.
+        """
+        return logger_name in logging.Logger.manager.loggerDict
+
+    @staticmethod
+    def isRootLoggerInstantiated() -> bool:
+        """Check if the root logger has been instantiated/accessed yet.
+
+        The root logger is created lazily by Python's logging module. This function
+        checks if it has been instantiated without creating it as a side effect.
+
+        This is useful to distinguish between:
+        - Fresh root logger: Never accessed, ready to be configured with defaults
+        - Existing root logger: Already created/accessed, should preserve its state
+
+        Returns:
+            True if the root logger has been instantiated (exists in manager registry),
+            False if it's fresh and ready for configuration with defaults.
+
+        Note:
+            This function queries the **current state** of the logging registry, not
+            user intent. It returns True if ANY code (user, third-party library, or
+            stdlib) has accessed the root logger. To check if the USER explicitly
+            configured the root logger via ensureRootLogger(), use the module-level
+            flag _root_logger_user_configured instead.
+
+            Calling logging.getLogger("") after this returns False will instantiate
+            the root logger, so timing matters. This check should be done before any
+            code that accesses the root logger.
+
+        Example:
+            >>> if not isRootLoggerInstantiated():
+            ...     # Root logger is fresh, apply our defaults
+            ...     root.setLevel(determineLogLevel())
+            ... else:
+            ...     # Root logger already exists, port its state
+            ...     portLoggerState(old_root, new_root, port_level=True)
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        return ApatheticLogging_Internal_LoggingUtils.hasLogger(
+            _constants.ROOT_LOGGER_KEY
+        )
+
+    @staticmethod
+    def reconnectChildLoggers(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Reconnect child loggers from old logger to new logger.
+
+        When a logger is replaced, child loggers maintain a direct reference
+        to their parent. This function updates all child loggers to point to
+        the new logger instance.
+
+        Args:
+            old_logger: The logger being replaced.
+            new_logger: The new logger that should become the parent.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        for logger_name, logger in logging.Logger.manager.loggerDict.items():
+            # Skip if not a Logger instance
+            if not isinstance(logger, logging.Logger):
+                continue
+
+            # Skip the new logger itself
+            if logger is new_logger:
+                continue
+
+            # For root logger replacement, skip if logger name is root logger
+            # key/name (shouldn't happen, but be safe)
+            old_logger_name = old_logger.name
+            root_names = {_constants.ROOT_LOGGER_KEY, _constants.ROOT_LOGGER_NAME}
+            if old_logger_name in root_names and logger_name in root_names:
+                continue
+
+            # Check if this logger's parent is the old logger
+            # For root logger, any logger with a name is a child
+            # For named loggers, children have names starting with parent_name + "."
+            is_child = False
+            if old_logger_name in root_names:
+                # Root logger - any logger with a name is a child
+                is_child = logger_name not in root_names
+            else:
+                # Named logger - child names start with parent_name + "."
+                is_child = logger_name.startswith(old_logger_name + ".")
+
+            if is_child and logger.parent is old_logger:
+                logger.parent = new_logger
+
+    @staticmethod
+    def _portPropagateAndDisabled(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Port propagate and disabled state from old logger to new logger."""
+        # Use setPropagate() if available to set the _propagate_explicit flag
+        # (prevents _applyPropagateSetting() from overriding ported value)
+        if hasattr(new_logger, "setPropagate"):
+            new_logger.setPropagate(old_logger.propagate)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        else:
+            new_logger.propagate = old_logger.propagate
+        new_logger.disabled = old_logger.disabled
+
+    @staticmethod
+    def _portHandlers(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Port handlers from old logger to new logger."""
+        old_handlers = list(old_logger.handlers)  # Copy list
+        for handler in old_handlers:
+            new_logger.addHandler(handler)
+
+    @staticmethod
+    def _portLevel(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+    ) -> None:
+        """Port level from old logger to new logger."""
+        old_level = old_logger.level
+        # Validate level if it's an apathetic logger (has validateLevel)
+        if hasattr(new_logger, "validateLevel"):
+            try:
+                new_logger.validateLevel(old_level)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+            except ValueError:
+                # Invalid level - fall back to apathetic default
+                return
+
+        # Set the level - NOTSET/INHERIT_LEVEL (0) is always allowed
+        if hasattr(new_logger, "setLevel"):
+            new_logger.setLevel(old_level)
+        else:
+            new_logger.level = old_level
+
+    @staticmethod
+    def _setApatheticDefaults(
+        new_logger: logging.Logger,
+    ) -> None:
+        """Set apathetic defaults for logger level."""
+        _constants = ApatheticLogging_Internal_Constants
+        root_names = {_constants.ROOT_LOGGER_KEY, _constants.ROOT_LOGGER_NAME}
+        is_root = new_logger.name in root_names
+        if is_root:
+            # Root logger: use determineLogLevel() if available
+            if hasattr(new_logger, "determineLogLevel"):
+                level_name = new_logger.determineLogLevel()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownVariableType]
+                new_logger.setLevel(level_name)  # pyright: ignore[reportUnknownArgumentType]
+            else:
+                # Fallback: use INHERIT_LEVEL (though root has no parent)
+                new_logger.setLevel(_constants.INHERIT_LEVEL)
+        # Leaf logger: use INHERIT_LEVEL to inherit from parent
+        elif hasattr(new_logger, "setLevel"):
+            new_logger.setLevel(_constants.INHERIT_LEVEL)
+        else:
+            new_logger.level = _constants.INHERIT_LEVEL
+
+    @staticmethod
+    def portLoggerState(
+        old_logger: logging.Logger,
+        new_logger: logging.Logger,
+        *,
+        port_handlers: bool | None = None,
+        port_level: bool | None = None,
+    ) -> None:
+        """Port state from old logger to new logger.
+
+        Ports propagate and disabled state always. Optionally ports handlers
+        and level based on parameters. When not porting level, uses apathetic
+        defaults: determineLogLevel() for root logger, INHERIT_LEVEL for leaf loggers.
+
+        After porting (or not porting) handlers, calls manageHandlers() if the new
+        logger supports it, to ensure apathetic handlers are set up appropriately
+        based on propagate setting. This ensures root logger always has a handler,
+        and child loggers with propagate=False get handlers as needed. manageHandlers()
+        only manages the DualStreamHandler instances it created, so it won't touch
+        ported user handlers.
+
+        Finally, reconnects child loggers from the old logger to the new logger,
+        ensuring child loggers point to the new logger instance after replacement.
+
+        Args:
+            old_logger: The logger being replaced.
+            new_logger: The new logger to port state to.
+            port_handlers: Whether to port handlers. If None, checks registry setting
+                or defaults to True. When True, handlers from old logger are ported.
+                When False, new logger manages its own handlers via manageHandlers().
+                In both cases, manageHandlers() is called to ensure apathetic handlers
+                are set up if needed.
+            port_level: Whether to port level. If None, checks registry setting or
+                defaults to True. When True, level from old logger is ported.
+                When False, uses apathetic defaults (determineLogLevel() for root,
+                INHERIT_LEVEL for leaf loggers). Note: User-provided level parameters
+                in getLogger/getLoggerOfType take precedence over ported level.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        # Always port propagate and disabled
+        ApatheticLogging_Internal_LoggingUtils._portPropagateAndDisabled(
+            old_logger, new_logger
+        )
+
+        # Resolve port_handlers parameter
+        if port_handlers is None:
+            port_handlers = (
+                _registry_data.registered_internal_port_handlers
+                if _registry_data.registered_internal_port_handlers is not None
+                else _constants.DEFAULT_PORT_HANDLERS
+            )
+
+        # Port handlers if requested
+        if port_handlers:
+            ApatheticLogging_Internal_LoggingUtils._portHandlers(old_logger, new_logger)
+
+        # After porting (or not porting) handlers, ensure apathetic handlers are set up
+        # if it is an apathetic logger (IS_APATHETIC, so it has manageHandlers()).
+        # This ensures root logger always has a handler, and child loggers with
+        # propagate=False get handlers as needed. manageHandlers() only manages
+        # the DualStreamHandler instances it created, so it won't touch ported user
+        # handlers.
+        if getattr(new_logger, "IS_APATHETIC", False):
+            new_logger.manageHandlers()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+        # Resolve port_level parameter
+        if port_level is None:
+            port_level = (
+                _registry_data.registered_internal_port_level
+                if _registry_data.registered_internal_port_level is not None
+                else _constants.DEFAULT_PORT_LEVEL
+            )
+
+        # Port level if requested, otherwise use apathetic defaults
+        if port_level:
+            ApatheticLogging_Internal_LoggingUtils._portLevel(old_logger, new_logger)
+        else:
+            ApatheticLogging_Internal_LoggingUtils._setApatheticDefaults(new_logger)
+
+        # Reconnect child loggers from old logger to new logger
+        # This ensures child loggers point to the new logger instance after replacement
+        ApatheticLogging_Internal_LoggingUtils.reconnectChildLoggers(
+            old_logger, new_logger
+        )
+
+    @staticmethod
+    def removeLogger(logger_name: str) -> None:
+        """Remove a logger from the logging manager's registry.
+
+        Args:
+            logger_name: The name of the logger to remove.
+        """
+        logging.Logger.manager.loggerDict.pop(logger_name, None)
+
+    @staticmethod
+    def _extractTopLevelPackage(package: str | None) -> str | None:
+        """Extract top-level package name from package string.
+
+        Args:
+            package: Package string (e.g., "myapp.submodule") or None
+
+        Returns:
+            Top-level package name (e.g., "myapp") or None if package is None
+        """
+        if package is None:
+            return None
+        if "." in package:
+            return package.split(".", 1)[0]
+        return package
+
+    @staticmethod
+    def _inferFromFrame(skip_frames: int, frame: FrameType | None) -> str | None:
+        """Infer logger name from caller's frame.
+
+        Args:
+            skip_frames: Number of frames to skip to get to actual caller
+            frame: Frame to start from, or None
+
+        Returns:
+            Inferred logger name or None if cannot be inferred
+        """
+        if frame is None:
+            return None
+        try:
+            # Skip the specified number of frames to get to the actual caller
+            caller_frame = frame.f_back
+            for _ in range(skip_frames):
+                if caller_frame is None:
+                    break
+                caller_frame = caller_frame.f_back
+            if caller_frame is None:
+                return None
+            caller_package = caller_frame.f_globals.get("__package__")
+            return ApatheticLogging_Internal_LoggingUtils._extractTopLevelPackage(
+                caller_package
+            )
+        finally:
+            del frame
+
+    @staticmethod
+    def getDefaultLoggerName(
+        logger_name: str | None = None,
+        *,
+        check_registry: bool = True,
+        skip_frames: int = 1,
+        raise_on_error: bool = False,
+        infer: bool = True,
+        register: bool = False,
+    ) -> str | None:
+        """Get default logger name with optional inference from caller's frame.
+
+        This function handles the common pattern of:
+        1. Using explicit name if provided
+        2. Checking registry if requested
+        3. Inferring from caller's frame if needed (when infer=True)
+        4. Storing inferred name in registry (when register=True)
+        5. Returning None or raising error if still unresolved
+
+        Args:
+            logger_name: Explicit logger name, or None to infer.
+            check_registry: If True, check registry before inferring. Use False
+                when the caller should actively determine the name from current
+                context (e.g., registerLogger() which should re-infer even
+                if a name is already registered). Use True when the caller should
+                use a previously registered name if available (e.g., getLogger()
+                which should use the registered name).
+            skip_frames: Number of frames to skip from this function to get to
+                the actual caller. Default is 1 (skips this function's frame).
+            raise_on_error: If True, raise RuntimeError if logger name cannot be
+                resolved. If False (default), return None instead. Use True when
+                a logger name is required (e.g., when creating a logger).
+            infer: If True (default), attempt to infer logger name from caller's
+                frame when not found in registry. If False, skip inference and
+                return None if not found in registry.
+            register: If True, store inferred name in registry. If False (default),
+                do not modify registry. Note: Explicit names are never stored regardless
+                of this parameter.
+
+        Returns:
+            Resolved logger name, or None if cannot be resolved and
+            raise_on_error=False.
+
+        Raises:
+            RuntimeError: If logger name cannot be resolved and raise_on_error=True.
+        """
+        # Import locally to avoid circular import
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        # If explicit name provided, return it (never store explicit names)
+        # Note: Empty string ("") is a special case - it represents the root logger
+        # and is returned as-is to match standard library behavior.
+        if logger_name is not None:
+            return logger_name
+
+        # Check registry if requested
+        if check_registry:
+            registered_name = _registry_data.registered_internal_logger_name
+            if registered_name is not None:
+                return registered_name
+
+        # Try to infer from caller's frame if inference is enabled
+        if not infer:
+            # Inference disabled - return None or raise error
+            if raise_on_error:
+                error_msg = (
+                    "Cannot resolve logger name: not in registry and inference "
+                    "is disabled. Please call registerLogger() with an "
+                    "explicit logger name or enable inference."
+                )
+                raise RuntimeError(error_msg)
+            return None
+
+        # Get current frame (this function's frame) and skip to caller
+        frame = inspect.currentframe()
+        inferred_name = ApatheticLogging_Internal_LoggingUtils._inferFromFrame(
+            skip_frames, frame
+        )
+
+        # Store inferred name in registry if requested
+        if inferred_name is not None and register:
+            _registry_data.registered_internal_logger_name = inferred_name
+
+        # Return inferred name or handle error
+        if inferred_name is not None:
+            return inferred_name
+
+        # Handle error case
+        if raise_on_error:
+            error_msg = (
+                "Cannot auto-infer logger name: __package__ is not set in the "
+                "calling module. Please call registerLogger() with an "
+                "explicit logger name."
+            )
+            raise RuntimeError(error_msg)
+
+        return None
+
+    @staticmethod
+    def checkPythonVersionRequirement(
+        required_version: tuple[int, int],
+        function_name: str,
+    ) -> None:
+        """Check if the target or runtime Python version meets the requirement.
+
+        This method validates that a function requiring a specific Python version
+        can be called safely. It checks:
+        1. Target version (if set via registerTargetPythonVersion), otherwise
+           falls back to TARGET_PYTHON_VERSION from constants
+        2. Runtime version (as a safety net to catch actual runtime issues)
+
+        This allows developers to catch version incompatibilities during development
+        even when running on a newer Python version than their target.
+
+        Args:
+            required_version: Target Python version required (major, minor) tuple
+            function_name: Name of the function being checked (for error messages)
+
+        Raises:
+            NotImplementedError: If target version or runtime version doesn't meet
+                the requirement. Error message includes guidance on raising target
+                version if applicable.
+
+        Example:
+            >>> checkPythonVersionRequirement((3, 11), "get_level_names_mapping")
+            # Raises if target version < 3.11 or runtime version < 3.11
+        """
+        # Import locally to avoid circular imports
+
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        # Determine effective target version
+        # If target version is set, use it; otherwise fall back to TARGET_PYTHON_VERSION
+        target_version = _registry_data.registered_internal_target_python_version
+        if target_version is None:
+            target_version = _constants.TARGET_PYTHON_VERSION
+
+        # Check target version first (primary check)
+        # Skip check if target_version is None (checks disabled)
+        if target_version is not None and target_version < required_version:
+            req_major, req_minor = required_version
+            tgt_major, tgt_minor = target_version
+            msg = (
+                f"{function_name} requires Python {req_major}.{req_minor}+, "
+                f"but target version is {tgt_major}.{tgt_minor}. "
+                f"To use this function, call "
+                f"registerTargetPythonVersion(({req_major}, {req_minor})) "
+                f"or raise your target version to at least {req_major}.{req_minor}."
+            )
+            raise NotImplementedError(msg)
+
+        # Check runtime version as safety net
+        runtime_version = (sys.version_info.major, sys.version_info.minor)
+        if runtime_version < required_version:
+            req_major, req_minor = required_version
+            rt_major, rt_minor = runtime_version
+            msg = (
+                f"{function_name} requires Python {req_major}.{req_minor}+, "
+                f"but runtime version is {rt_major}.{rt_minor}. "
+                f"This function is not available in your Python version."
+            )
+            raise NotImplementedError(msg)
+
+
+# === apathetic_logging.logging_std_camel ===
+# src/apathetic_logging/logging_std_camel.py
+"""Camel case convenience functions for standard logging module.
+
+This module provides direct wrappers for stdlib logging.* namespace functions
+with no additional logic or "smarts". These are simple pass-through functions
+that maintain camelCase naming for compatibility.
+
+For utility functions with additional logic (e.g., setRootLevel), see
+logging_utils.py instead.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_StdCamelCase:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides camelCase convenience functions for logging.*.
+
+    This class contains camelCase wrapper functions for standard library
+    `logging.*` functions that use camelCase naming. These wrappers provide
+    direct compatibility with the standard logging module interface while
+    maintaining full compatibility with the underlying logging module functions.
+
+    When mixed into apathetic_logging, it provides camelCase functions
+    that match the standard logging module functions (e.g., `basicConfig`,
+    `addLevelName`, `setLoggerClass`, `getLogger`).
+    """
+
+    # --- Configuration Functions ---
+
+    @staticmethod
+    def basicConfig(*args: Any, **kwargs: Any) -> None:
+        """Do basic configuration for the logging system.
+
+        This function does nothing if the root logger already has handlers
+        configured, unless the keyword argument *force* is set to ``True``.
+        It is a convenience method intended for use by simple scripts
+        to do one-shot configuration of the logging package.
+
+        The default behaviour is to create a StreamHandler which writes to
+        sys.stderr, set a formatter using the BASIC_FORMAT format string, and
+        add the handler to the root logger.
+
+        A number of optional keyword arguments may be specified, which can alter
+        the default behaviour.
+
+        Wrapper for logging.basicConfig with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.basicConfig
+        """
+        logging.basicConfig(*args, **kwargs)
+
+    @staticmethod
+    def captureWarnings(
+        capture: bool,  # noqa: FBT001
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Redirect warnings to the logging package.
+
+        If capture is true, redirect all warnings to the logging package.
+        If capture is False, ensure that warnings are not redirected to logging
+        but to their original destinations.
+
+        Wrapper for logging.captureWarnings with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.captureWarnings
+        """
+        logging.captureWarnings(capture, *args, **kwargs)
+
+    @staticmethod
+    def shutdown(*args: Any, **kwargs: Any) -> None:
+        """Perform any cleanup actions in the logging system.
+
+        Perform any cleanup actions in the logging system (e.g. flushing
+        buffers). Should be called at application exit.
+
+        Wrapper for logging.shutdown with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.shutdown
+        """
+        logging.shutdown(*args, **kwargs)
+
+    # --- Level Management Functions ---
+
+    @staticmethod
+    def addLevelName(level: int, level_name: str, *args: Any, **kwargs: Any) -> None:
+        """Associate a level name with a numeric level.
+
+        Associate 'level_name' with 'level'. This is used when converting
+        levels to text during message formatting.
+
+        Wrapper for logging.addLevelName with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.addLevelName
+        """
+        logging.addLevelName(level, level_name, *args, **kwargs)
+
+    @staticmethod
+    def getLevelName(level: int, *args: Any, **kwargs: Any) -> str | int:
+        """Return the textual or numeric representation of a logging level.
+
+        If the level is one of the predefined levels (CRITICAL, ERROR, WARNING,
+        INFO, DEBUG) then you get the corresponding string. If you have
+        associated levels with names using addLevelName then the name you have
+        associated with 'level' is returned.
+
+        If a numeric value corresponding to one of the defined levels is passed
+        in, the corresponding string representation is returned.
+
+        If a string representation of the level is passed in, the corresponding
+        numeric value is returned.
+
+        If no matching numeric or string value is passed in, the string
+        'Level %s' % level is returned.
+
+        Wrapper for logging.getLevelName with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLevelName
+        """
+        return logging.getLevelName(level, *args, **kwargs)
+
+    @staticmethod
+    def getLevelNamesMapping(*args: Any, **kwargs: Any) -> dict[int, str]:
+        """Return a mapping of all level names to their numeric values.
+
+        **Requires Python 3.11+**
+
+        Wrapper for logging.getLevelNamesMapping with camelCase naming.
+
+        https://docs.python.org/3.11/library/logging.html#logging.getLevelNamesMapping
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _logging_utils.checkPythonVersionRequirement((3, 11), "getLevelNamesMapping")
+        return logging.getLevelNamesMapping(*args, **kwargs)  # type: ignore[attr-defined,no-any-return]
+
+    @staticmethod
+    def disable(level: int = 50, *args: Any, **kwargs: Any) -> None:
+        """Disable all logging calls of severity 'level' and below.
+
+        Wrapper for logging.disable with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.disable
+        """
+        logging.disable(level, *args, **kwargs)
+
+    # --- Logger Management Functions ---
+
+    @staticmethod
+    def getLogger(
+        name: str | None = None, *_args: Any, **_kwargs: Any
+    ) -> logging.Logger:
+        """Return a logger with the specified name, creating it if necessary.
+
+        If no name is specified, return the root logger.
+
+        Returns an logging.Logger instance.
+
+        Wrapper for logging.getLogger with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogger
+        """
+        return logging.getLogger(name)
+
+    @staticmethod
+    def getLoggerClass(*args: Any, **kwargs: Any) -> type[logging.Logger]:
+        """Return the class to be used when instantiating a logger.
+
+        Wrapper for logging.getLoggerClass with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLoggerClass
+        """
+        return logging.getLoggerClass(*args, **kwargs)
+
+    @staticmethod
+    def setLoggerClass(klass: type[logging.Logger], *args: Any, **kwargs: Any) -> None:
+        """Set the class to be used when instantiating a logger.
+
+        The class should define __init__() such that only a name argument is
+        required, and the __init__() should call Logger.__init__().
+
+        Args:
+            klass (logger class): The logger class to use.
+            *args: Additional positional arguments (for future-proofing).
+            **kwargs: Additional keyword arguments (for future-proofing).
+
+        Wrapper for logging.setLoggerClass with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.setLoggerClass
+        """
+        logging.setLoggerClass(klass, *args, **kwargs)
+
+    # --- Handler Management Functions ---
+
+    @staticmethod
+    def getHandlerByName(
+        name: str, *args: Any, **kwargs: Any
+    ) -> logging.Handler | None:
+        """Get a handler with the specified name, or None if there isn't one.
+
+        **Requires Python 3.12+**
+
+        Wrapper for logging.getHandlerByName with camelCase naming.
+
+        https://docs.python.org/3.12/library/logging.html#logging.getHandlerByName
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _logging_utils.checkPythonVersionRequirement((3, 12), "getHandlerByName")
+        return logging.getHandlerByName(name, *args, **kwargs)  # type: ignore[attr-defined,no-any-return]
+
+    @staticmethod
+    def getHandlerNames(*args: Any, **kwargs: Any) -> list[str]:
+        """Return all known handler names as an immutable set.
+
+        **Requires Python 3.12+**
+
+        Wrapper for logging.getHandlerNames with camelCase naming.
+
+        https://docs.python.org/3.12/library/logging.html#logging.getHandlerNames
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _logging_utils.checkPythonVersionRequirement((3, 12), "getHandlerNames")
+        return logging.getHandlerNames(*args, **kwargs)  # type: ignore[attr-defined,no-any-return]
+
+    # --- Factory Functions ---
+
+    @staticmethod
+    def getLogRecordFactory(
+        *args: Any, **kwargs: Any
+    ) -> Callable[..., logging.LogRecord]:
+        """Return the factory to be used when instantiating a log record.
+
+        Wrapper for logging.getLogRecordFactory with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogRecordFactory
+        """
+        return logging.getLogRecordFactory(*args, **kwargs)
+
+    @staticmethod
+    def setLogRecordFactory(
+        factory: Callable[..., logging.LogRecord], *args: Any, **kwargs: Any
+    ) -> None:
+        """Set the factory to be used when instantiating a log record.
+
+        :param factory: A callable which will be called to instantiate
+        a log record.
+
+        Wrapper for logging.setLogRecordFactory with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.setLogRecordFactory
+        """
+        logging.setLogRecordFactory(factory, *args, **kwargs)
+
+    @staticmethod
+    def makeLogRecord(
+        dict: dict[str, Any],  # noqa: A002  # Required to match stdlib logging.makeLogRecord signature
+        *args: Any,
+        **kwargs: Any,
+    ) -> logging.LogRecord:
+        """Make a LogRecord whose attributes are defined by a dictionary.
+
+        This function is useful for converting a logging event received over
+        a socket connection (which is sent as a dictionary) into a LogRecord
+        instance.
+
+        Wrapper for logging.makeLogRecord with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.makeLogRecord
+        """
+        return logging.makeLogRecord(dict, *args, **kwargs)
+
+    # --- Logging Functions ---
+
+    @staticmethod
+    def critical(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'CRITICAL' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.critical with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.critical
+        """
+        logging.critical(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def debug(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'DEBUG' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.debug with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.debug
+        """
+        logging.debug(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def error(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'ERROR' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.error with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.error
+        """
+        logging.error(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def exception(msg: str, *args: Any, exc_info: bool = True, **kwargs: Any) -> None:
+        """Log a message with severity 'ERROR' on the root logger, with exception info.
+
+        If the logger has no handlers, basicConfig() is called to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.exception with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.exception
+        """
+        logging.exception(msg, *args, exc_info=exc_info, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def fatal(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'CRITICAL' on the root logger.
+
+        Don't use this function, use critical() instead.
+
+        Wrapper for logging.fatal with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.fatal
+        """
+        logging.fatal(msg, *args, **kwargs)
+
+    @staticmethod
+    def info(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'INFO' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.info with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.info
+        """
+        logging.info(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def log(level: int, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log 'msg % args' with the integer severity 'level' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.log with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.log
+        """
+        logging.log(level, msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def warn(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'WARNING' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.warn with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.warn
+        """
+        logging.warning(msg, *args, **kwargs)  # noqa: LOG015
+
+    @staticmethod
+    def warning(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'WARNING' on the root logger.
+
+        If the logger has no handlers, call basicConfig() to add a console
+        handler with a pre-defined format.
+
+        Wrapper for logging.warning with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.warning
+        """
+        logging.warning(msg, *args, **kwargs)  # noqa: LOG015
+
+    # --- Utility Functions ---
+
+    @staticmethod
+    def currentframe(*args: Any, **kwargs: Any) -> FrameType | None:
+        """Return the frame object for the caller's stack frame.
+
+        Wrapper for logging.currentframe with camelCase naming.
+
+        https://docs.python.org/3.10/library/logging.html#logging.currentframe
+        """
+        return logging.currentframe(*args, **kwargs)
+
+
+# === apathetic_logging.safe_logging ===
+# src/apathetic_logging/safe_logging.py
+"""Safe logging utilities for Apathetic Logging."""
+
+
+# Lazy, safe import — avoids patched time modules
+#   in environments like pytest or eventlet
+_apatheticlogging_internal_real_time = importlib.import_module("time")
+
+
+class ApatheticLogging_Internal_SafeLogging:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides safe logging utilities.
+
+    This class contains both safeLog and safeTrace implementations as static
+    methods. When mixed into apathetic_logging, it provides:
+    - apathetic_logging.safeLog
+    - apathetic_logging.safeTrace
+    - apathetic_logging.makeSafeTrace
+    """
+
+    @staticmethod
+    def isSafeTraceEnabled() -> bool:  # noqa: PLR0911
+        """Check if safe trace should be enabled.
+
+        Safe trace is enabled when:
+        1. SAFE_TRACE env var is set to "1", "true", or "yes"
+        2. LOG_LEVEL env var (case insensitive) is "TRACE" or "TEST"
+        3. LOG_LEVEL numeric value <= TRACE_LEVEL numeric value
+
+        Returns:
+            True if safe trace should be enabled, False otherwise.
+        """
+        # Check SAFE_TRACE env var
+        safe_trace_env = os.getenv("SAFE_TRACE", "").lower()
+        if safe_trace_env in {"1", "true", "yes"}:
+            return True
+
+        # Check LOG_LEVEL env var
+        log_level_env = os.getenv("LOG_LEVEL", "")
+        if not log_level_env:
+            return False
+
+        log_level_upper = log_level_env.upper()
+
+        # Check if LOG_LEVEL is "TRACE" or "TEST" (case insensitive)
+        if log_level_upper in {"TRACE", "TEST"}:
+            return True
+
+        # Check if LOG_LEVEL numeric value <= TRACE_LEVEL
+        # First try to parse as integer directly
+        try:
+            log_level_numeric = int(log_level_env)
+            if log_level_numeric <= ApatheticLogging_Internal_Constants.TRACE_LEVEL:
+                return True
+        except ValueError:
+            # Not a numeric string, try to look up in logging module
+            # This handles cases like "DEBUG", "INFO", etc.
+            try:
+                level_attr = getattr(logging, log_level_upper, None)
+                if (
+                    isinstance(level_attr, int)
+                    and level_attr <= ApatheticLogging_Internal_Constants.TRACE_LEVEL
+                ):
+                    return True
+            except Exception:  # noqa: BLE001, S110
+                # If anything goes wrong, just ignore this check
+                pass
+
+        return False
+
+    SAFE_TRACE_ENABLED: ClassVar[bool] = isSafeTraceEnabled()
+    """Enable safe trace diagnostics.
+
+    Controlled by:
+    - SAFE_TRACE env var (set to "1", "true", or "yes")
+    - LOG_LEVEL env var (case insensitive) set to "TRACE" or "TEST"
+    - LOG_LEVEL numeric value <= TRACE_LEVEL numeric value
+
+    This can be overridden by tests by assigning directly to this class attribute.
+    """
+
+    @staticmethod
+    def safeLog(msg: str) -> None:
+        """Emergency logger that never fails."""
+        stream = cast("TextIO", sys.__stderr__)
+        try:
+            print(msg, file=stream)
+        except Exception:  # noqa: BLE001
+            # As final guardrail — never crash during crash reporting
+            with suppress(Exception):
+                stream.write(f"[INTERNAL] {msg}\n")
+
+    @staticmethod
+    def makeSafeTrace(icon: str = "🧪") -> Callable[..., Any]:
+        """Create a trace function with a custom icon. Assign it to a variable.
+
+        Args:
+            icon: Emoji prefix/suffix for easier visual scanning
+
+        Returns:
+            A callable trace function
+        """
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        def localTrace(label: str, *args: Any) -> Any:
+            return _safe_logging.safeTrace(label, *args, icon=icon)
+
+        return localTrace
+
+    @staticmethod
+    def safeTrace(label: str, *args: Any, icon: str = "🧪") -> None:
+        """Emit a synchronized, flush-safe diagnostic line.
+
+        Mainly for troubleshooting and tests, avoids the
+        logging framework and capture systems, can work even
+        pre-logging framework initialization.
+
+        Args:
+            label: Short identifier or context string.
+            *args: Optional values to append.
+            icon: Emoji prefix/suffix for easier visual scanning.
+
+        """
+        # Check class attribute to allow tests to override it
+        if not ApatheticLogging_Internal_SafeLogging.SAFE_TRACE_ENABLED:
+            return
+
+        ts = _apatheticlogging_internal_real_time.monotonic()
+        # builtins.print more reliable than sys.stdout.write + sys.stdout.flush
+        builtins.print(
+            f"{icon} [SAFE TRACE {ts:.6f}] {label}",
+            *args,
+            file=sys.__stderr__,
+            flush=True,
+        )
+
+
+# === apathetic_logging.registry ===
+# src/apathetic_logging/registry.py
+"""Registry functionality for Apathetic Logging."""
+
+
+class ApatheticLogging_Internal_Registry:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides registration methods.
+
+    This class contains static methods for registering configuration values.
+    When mixed into apathetic_logging, it provides registration methods for
+    log level environment variables, default log level, logger name, and
+    target Python version.
+
+    Registry storage is provided by ``ApatheticLogging_Internal_RegistryData``.
+
+    **Static Methods:**
+    - ``registerDefaultLogLevel()``: Register the default log level
+    - ``registerLogLevelEnvVars()``: Register environment variable names
+    - ``registerLogger()``: Register a logger (public API)
+    - ``registerTargetPythonVersion()``: Register target Python version
+    - ``registerPropagate()``: Register propagate setting
+    - ``registerCompatibilityMode()``: Register compatibility mode setting
+    """
+
+    _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
+
+    @staticmethod
+    def registerDefaultLogLevel(default_level: str | None) -> None:
+        """Register the default log level to use when no other source is found.
+
+        Args:
+            default_level: Default log level name (e.g., "info", "warning").
+                If None, returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import ApatheticLogging
+            >>> apathetic_logging.registerDefaultLogLevel("warning")
+        """
+        if default_level is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_default_log_level = default_level
+        _safe_logging.safeTrace(
+            "registerDefaultLogLevel() called",
+            f"default_level={default_level}",
+        )
+
+    @staticmethod
+    def registerLogLevelEnvVars(env_vars: list[str] | None) -> None:
+        """Register environment variable names to check for log level.
+
+        The environment variables will be checked in order, and the first
+        non-empty value found will be used.
+
+        Args:
+            env_vars: List of environment variable names to check
+                (e.g., ["SERGER_LOG_LEVEL", "LOG_LEVEL"]).
+                If None, returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import ApatheticLogging
+            >>> apathetic_logging.registerLogLevelEnvVars(
+            ...     ["MYAPP_LOG_LEVEL", "LOG_LEVEL"]
+            ... )
+        """
+        if env_vars is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_log_level_env_vars = env_vars
+        _safe_logging.safeTrace(
+            "registerLogLevelEnvVars() called",
+            f"env_vars={env_vars}",
+        )
+
+    @staticmethod
+    def registerLogger(
+        logger_name: str | None = None,
+        logger_class: type[ApatheticLogging_Internal_Registry._LoggerType]
+        | None = None,
+        *,
+        target_python_version: tuple[int, int] | None = None,
+        log_level_env_vars: list[str] | None = None,
+        default_log_level: str | None = None,
+        propagate: bool | None = None,
+        compat_mode: bool | None = None,
+        replace_root: bool | None = None,
+    ) -> None:
+        """Register a logger for use by getLogger().
+
+        This is the public API for registering a logger. It registers the logger
+        name and extends the logging module with custom levels if needed.
+
+        If logger_name is not provided, the top-level package is automatically
+        extracted from the calling module's __package__ attribute.
+
+        If logger_class is provided and has an ``extendLoggingModule()``
+        method, it will be called to extend the logging module with custom
+        levels and set the logger class. If logger_class is provided but does
+        not have ``extendLoggingModule()``, ``logging.setLoggerClass()``
+        will be called directly to set the logger class. If logger_class is not
+        provided, nothing is done with the logger class (the default ``Logger``
+        is already extended at import time).
+
+        **Important**: If you're using a custom logger class that has
+        ``extendLoggingModule()``, do not call ``logging.setLoggerClass()``
+        directly. Instead, pass the class to ``registerLogger()`` and let
+        ``extendLoggingModule()`` handle setting the logger class. This
+        ensures consistent behavior and avoids class identity issues in
+        stitched mode.
+
+        Args:
+            logger_name: The name of the logger to retrieve (e.g., "myapp").
+                If None, extracts the top-level package from __package__.
+            logger_class: Optional logger class to use. If provided and the class
+                has an ``extendLoggingModule()`` method, it will be called.
+                If the class doesn't have that method, ``logging.setLoggerClass()``
+                will be called directly. If None, nothing is done (default Logger
+                is already set up at import time).
+            target_python_version: Optional target Python version (major, minor)
+                tuple. If provided, sets the target Python version in the registry
+                permanently. Defaults to None (no change).
+            log_level_env_vars: Optional list of environment variable names to
+                check for log level. If provided, sets the log level environment
+                variables in the registry permanently. Defaults to None (no change).
+            default_log_level: Optional default log level name. If provided, sets
+                the default log level in the registry permanently. Defaults to None
+                (no change).
+            propagate: Optional propagate setting. If provided, sets the propagate
+                value in the registry permanently. If None, uses registered propagate
+                setting or falls back to DEFAULT_PROPAGATE from constants.py.
+                Defaults to None (no change).
+            compat_mode: Optional compatibility mode setting. If provided, sets
+                the compatibility mode in the registry permanently. When True, restores
+                stdlib-compatible behavior where possible (e.g., getLogger(None) returns
+                root logger). If None, uses registered compatibility mode setting or
+                defaults to False (improved behavior). Defaults to None (no change).
+            replace_root: Optional setting for whether to replace root logger.
+                If provided, passes this value to extendLoggingModule() when extending
+                the logging module. If None, uses registry setting or constant default.
+                Only used when logger_class has an extendLoggingModule() method.
+
+        Example:
+            >>> # Explicit registration with default Logger (already extended)
+            >>> from apathetic_logging import registerLogger
+            >>> registerLogger("myapp")
+
+            >>> # Auto-infer from __package__
+            >>> registerLogger()
+            ...     # Uses top-level package from __package__
+
+            >>> # Register with custom logger class (has extendLoggingModule)
+            >>> from apathetic_logging import Logger
+            >>> class AppLogger(Logger):
+            ...     pass
+            >>> # Don't call AppLogger.extendLoggingModule() or
+            >>> # logging.setLoggerClass() directly - registerLogger() handles it
+            >>> registerLogger("myapp", AppLogger)
+
+            >>> # Register with any logger class (no extendLoggingModule)
+            >>> import logging
+            >>> class SimpleLogger(logging.Logger):
+            ...     pass
+            >>> registerLogger("myapp", SimpleLogger)  # Sets logger class directly
+        """
+        _registry = ApatheticLogging_Internal_Registry
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        # Handle convenience parameters that set registry values
+        _registry.registerTargetPythonVersion(target_python_version)
+        _registry.registerLogLevelEnvVars(log_level_env_vars)
+        _registry.registerDefaultLogLevel(default_log_level)
+        _registry.registerPropagate(propagate=propagate)
+        _registry.registerCompatibilityMode(compat_mode=compat_mode)
+        _registry.registerReplaceRootLogger(replace_root=replace_root)
+
+        # Import Logger locally to avoid circular import
+
+        # Track if name was auto-inferred
+        was_explicit = logger_name is not None
+
+        # Resolve logger name (with inference if needed)
+        # skip_frames=1 because: registerLogger -> getDefaultLoggerName -> caller
+        # check_registry=False because registerLogger() should actively determine
+        # the name from the current context, not return an old registered name. This
+        # allows re-inferring from __package__ if the package context has changed.
+        # raise_on_error=True because registerLogger() requires a logger name.
+        # register=True because registerLogger() should store the resolved name.
+        resolved_name = _logging_utils.getDefaultLoggerName(
+            logger_name,
+            check_registry=False,
+            skip_frames=1,
+            raise_on_error=True,
+            infer=True,
+            register=True,
+        )
+
+        if logger_class is not None:
+            # extendLoggingModule will call setLoggerClass for those that support it
+            if hasattr(logger_class, "extendLoggingModule"):
+                logger_class.extendLoggingModule(replace_root=replace_root)  # type: ignore[attr-defined]
+            else:
+                # stdlib unwrapped
+                logging.setLoggerClass(logger_class)
+
+        # registerLogger always stores the result (explicit or inferred)
+        _registry_data.registered_internal_logger_name = resolved_name
+
+        _safe_logging.safeTrace(
+            "registerLogger() called",
+            f"name={resolved_name}",
+            f"auto_inferred={not was_explicit}",
+            f"logger_class={logger_class.__name__ if logger_class else None}",
+        )
+
+    @staticmethod
+    def registerTargetPythonVersion(version: tuple[int, int] | None) -> None:
+        """Register the target Python version for compatibility checking.
+
+        This sets the target Python version that will be used to validate
+        function calls. If a function requires a Python version newer than
+        the target version, it will raise a NotImplementedError even if
+        the runtime version is sufficient.
+
+        If not set, the library defaults to TARGET_PYTHON_VERSION (3, 10) from
+        constants.py. This allows developers to catch version incompatibilities
+        during development even when running on a newer Python version than
+        their target.
+
+        Args:
+            version: Target Python version as (major, minor) tuple
+                (e.g., (3, 10) or (3, 11)). If None, returns immediately
+                without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerTargetPythonVersion
+            >>> registerTargetPythonVersion((3, 10))
+            >>> # Now functions requiring 3.11+ will raise if called
+
+        Note:
+            The runtime version is still checked as a safety net. If the
+            runtime version is older than required, the function will still
+            raise an error even if the target version is sufficient.
+        """
+        if version is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_target_python_version = version
+        _safe_logging.safeTrace(
+            "registerTargetPythonVersion() called",
+            f"version={version[0]}.{version[1]}",
+        )
+
+    @staticmethod
+    def registerPropagate(*, propagate: bool | None) -> None:
+        """Register the propagate setting for loggers.
+
+        This sets the default propagate value that will be used when creating
+        loggers. If not set, the library defaults to DEFAULT_PROPAGATE (True)
+        from constants.py.
+
+        When propagate is True, loggers propagate messages to parent loggers,
+        allowing centralized control via root logger.
+
+        Args:
+            propagate: Propagate setting (True or False). If None, returns
+                immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerPropagate
+            >>> registerPropagate(propagate=True)
+            >>> # Now new loggers will propagate by default
+        """
+        if propagate is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_propagate = propagate
+        _safe_logging.safeTrace(
+            "registerPropagate() called",
+            f"propagate={propagate}",
+        )
+
+    @staticmethod
+    def registerCompatibilityMode(*, compat_mode: bool | None) -> None:
+        """Register the compatibility mode setting for stdlib drop-in replacement.
+
+        This sets the compatibility mode that will be used when creating loggers.
+        If not set, the library defaults to False (improved behavior).
+
+        When compat_mode is True, restores stdlib-compatible behavior where
+        possible (e.g., getLogger(None) returns root logger instead of auto-inferring).
+
+        Args:
+            compat_mode: Compatibility mode setting (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerCompatibilityMode
+            >>> registerCompatibilityMode(compat_mode=True)
+            >>> # Now getLogger(None) returns root logger (stdlib behavior)
+        """
+        if compat_mode is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_compatibility_mode = compat_mode
+        _safe_logging.safeTrace(
+            "registerCompatibilityMode() called",
+            f"compat_mode={compat_mode}",
+        )
+
+    @staticmethod
+    def registerReplaceRootLogger(*, replace_root: bool | None) -> None:
+        """Register whether to replace root logger if it's not the correct type.
+
+        This sets whether extendLoggingModule() should replace the root logger
+        if it's not an instance of the apathetic logger class. If not set, the
+        library defaults to DEFAULT_REPLACE_ROOT_LOGGER from constants.py
+        (True by default - replace root logger to ensure it's an apathetic logger).
+
+        When replace_root is False, extendLoggingModule() will not replace the
+        root logger, allowing applications to use their own custom logger class
+        for the root logger. This is useful when:
+        - Using apathetic logging through a library (like utils) but wanting a
+          different logger class for the root logger
+        - Having your own custom logger class that inherits from logging.Logger
+          and wanting to use it for the root logger
+
+        Args:
+            replace_root: Whether to replace root logger (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerReplaceRootLogger
+            >>> # Disable root logger replacement to use your own logger class
+            >>> registerReplaceRootLogger(replace_root=False)
+            >>> # Now extendLoggingModule() won't replace the root logger
+        """
+        if replace_root is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_replace_root_logger = replace_root
+        _safe_logging.safeTrace(
+            "registerReplaceRootLogger() called",
+            f"replace_root={replace_root}",
+        )
+
+    @staticmethod
+    def registerPortHandlers(*, port_handlers: bool | None) -> None:
+        """Register whether to port handlers when replacing a logger.
+
+        This sets whether logger replacement should port handlers from the old
+        logger to the new logger. If not set, the library defaults to
+        DEFAULT_PORT_HANDLERS from constants.py (True by default - port handlers
+        to preserve existing configuration).
+
+        When port_handlers is True, handlers from the old logger are ported to
+        the new logger. When False, the new logger manages its own handlers via
+        manageHandlers() (may conflict with ported handlers).
+
+        Args:
+            port_handlers: Whether to port handlers (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerPortHandlers
+            >>> # Enable handler porting to preserve existing handlers
+            >>> registerPortHandlers(port_handlers=True)
+            >>> # Now logger replacement will port handlers
+        """
+        if port_handlers is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_port_handlers = port_handlers
+        _safe_logging.safeTrace(
+            "registerPortHandlers() called",
+            f"port_handlers={port_handlers}",
+        )
+
+    @staticmethod
+    def registerPortLevel(*, port_level: bool | None) -> None:
+        """Register whether to port level when replacing a logger.
+
+        This sets whether logger replacement should port the log level from the
+        old logger to the new logger. If not set, the library defaults to
+        DEFAULT_PORT_LEVEL from constants.py (True by default - port level to
+        preserve existing configuration).
+
+        When port_level is True (default), the log level is ported from the old
+        logger. When False, the new logger uses apathetic defaults:
+        - Root logger: uses determineLogLevel() to get a sensible default
+        - Leaf loggers: use INHERIT_LEVEL (NOTSET) to inherit from parent
+        Note: User-provided level parameters in getLogger/getLoggerOfType take
+        precedence over ported level.
+
+        Args:
+            port_level: Whether to port level (True or False). If None,
+                returns immediately without making any changes.
+
+        Example:
+            >>> from apathetic_logging import registerPortLevel
+            >>> # Enable level porting to preserve existing level
+            >>> registerPortLevel(port_level=True)
+            >>> # Now logger replacement will port level
+        """
+        if port_level is None:
+            return
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        _registry_data.registered_internal_port_level = port_level
+        _safe_logging.safeTrace(
+            "registerPortLevel() called",
+            f"port_level={port_level}",
+        )
+
+    @staticmethod
+    def getLogLevelEnvVars() -> list[str]:
+        """Get the environment variable names to check for log level.
+
+        Returns the registered environment variable names, or the default
+        environment variables if none are registered.
+
+        Returns:
+            List of environment variable names to check for log level.
+            Defaults to ["LOG_LEVEL"] if not registered.
+
+        Example:
+            >>> from apathetic_logging import getLogLevelEnvVars
+            >>> env_vars = getLogLevelEnvVars()
+            >>> print(env_vars)
+            ["LOG_LEVEL"]
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_log_level_env_vars
+            or _constants.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
+        )
+
+    @staticmethod
+    def getDefaultLogLevel() -> str:
+        """Get the default log level.
+
+        Returns the registered default log level, or the module default
+        if none is registered.
+
+        Returns:
+            Default log level name (e.g., "detail", "info").
+            Defaults to "detail" if not registered.
+
+        Example:
+            >>> from apathetic_logging import getDefaultLogLevel
+            >>> level = getDefaultLogLevel()
+            >>> print(level)
+            "detail"
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_default_log_level
+            or _constants.DEFAULT_APATHETIC_LOG_LEVEL
+        )
+
+    @staticmethod
+    def getRegisteredLoggerName() -> str | None:
+        """Get the registered logger name.
+
+        Returns the registered logger name, or None if no logger name
+        has been registered. Unlike getDefaultLoggerName(), this does not
+        perform inference - it only returns the explicitly registered value.
+
+        Returns:
+            Registered logger name, or None if not registered.
+
+        Example:
+            >>> from apathetic_logging import getRegisteredLoggerName
+            >>> name = getRegisteredLoggerName()
+            >>> if name is None:
+            ...     print("No logger name registered")
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return _registry_data.registered_internal_logger_name
+
+    @staticmethod
+    def getTargetPythonVersion() -> tuple[int, int] | None:
+        """Get the target Python version.
+
+        Returns the registered target Python version, or the minimum
+        supported version if none is registered.
+
+        Returns:
+            Target Python version as (major, minor) tuple, or None if
+            no version is registered and TARGET_PYTHON_VERSION is None
+            (checks disabled).
+
+        Example:
+            >>> from apathetic_logging import getTargetPythonVersion
+            >>> version = getTargetPythonVersion()
+            >>> print(version)
+            (3, 10)  # or None if checks are disabled
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_target_python_version
+            or _constants.TARGET_PYTHON_VERSION
+        )
+
+    @staticmethod
+    def getDefaultPropagate() -> bool:
+        """Get the default propagate setting.
+
+        Returns the registered propagate setting, or the module default
+        (DEFAULT_PROPAGATE) from constants.py if not registered.
+
+        Returns:
+            Default propagate setting (True or False).
+
+        Example:
+            >>> from apathetic_logging import getDefaultPropagate
+            >>> propagate = getDefaultPropagate()
+            >>> print(propagate)
+            True
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_propagate
+            if _registry_data.registered_internal_propagate is not None
+            else _constants.DEFAULT_PROPAGATE
+        )
+
+    @staticmethod
+    def getCompatibilityMode() -> bool:
+        """Get the compatibility mode setting.
+
+        Returns the registered compatibility mode setting, or False (improved
+        behavior) if not registered.
+
+        Returns:
+            Compatibility mode setting (True or False).
+            Defaults to False if not registered.
+
+        Example:
+            >>> from apathetic_logging import getCompatibilityMode
+            >>> compat_mode = getCompatibilityMode()
+            >>> print(compat_mode)
+            False
+        """
+        _registry_data = ApatheticLogging_Internal_RegistryData
+
+        return (
+            _registry_data.registered_internal_compatibility_mode
+            if _registry_data.registered_internal_compatibility_mode is not None
+            else False
+        )
+
+
+# === apathetic_logging.tag_formatter ===
+# src/apathetic_logging/tag_formatter.py
+"""TagFormatter class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.Formatter documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_TagFormatter:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the TagFormatter nested class.
+
+    This class contains the TagFormatter implementation as a nested class.
+    When mixed into apathetic_logging, it provides apathetic_logging.TagFormatter.
+    """
+
+    class TagFormatter(logging.Formatter):
+        """Formatter that adds level tags to log messages.
+
+        Adds colored or plain text tags (e.g., [DEBUG], [ERROR]) based on
+        log level. Color support is controlled by the enable_color attribute
+        on the LogRecord.
+        """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            """Initialize the TagFormatter.
+
+            Wrapper for logging.Formatter.__init__ with future-proofing.
+            """
+            super().__init__(*args, **kwargs)
+
+        def format(
+            self,
+            record: logging.LogRecord,
+            *args: Any,
+            **kwargs: Any,
+        ) -> str:
+            """Format a log record with level tag prefix.
+
+            Args:
+                record: LogRecord to format
+                *args: Additional positional arguments (for future-proofing)
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            Returns:
+                Formatted message with optional level tag prefix
+            """
+            _constants = ApatheticLogging_Internal_Constants
+            tag_color, tag_text = _constants.TAG_STYLES.get(record.levelname, ("", ""))
+            msg = super().format(record, *args, **kwargs)
+            if tag_text:
+                if getattr(record, "enable_color", False) and tag_color:
+                    prefix = f"{tag_color}{tag_text}{_constants.ANSIColors.RESET}"
+                else:
+                    prefix = tag_text
+                return f"{prefix} {msg}"
+            return msg
+
+
+# === apathetic_logging.dual_stream_handler ===
+# src/apathetic_logging/dual_stream_handler.py
+"""DualStreamHandler class for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging.Handler documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the DualStreamHandler nested class.
+
+    This class contains the DualStreamHandler implementation as a nested class.
+    When mixed into apathetic_logging, it provides apathetic_logging.DualStreamHandler.
+    """
+
+    class DualStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+        """Send info to stdout, everything else to stderr.
+
+        INFO, BRIEF, and DETAIL go to stdout (normal program output).
+        TRACE, DEBUG, WARNING, ERROR, and CRITICAL go to stderr
+        (diagnostic/error output).
+        When logger level is TEST, TEST/TRACE/DEBUG messages bypass capture
+        by writing to sys.__stderr__ instead of sys.stderr. This allows
+        debugging tests without breaking output assertions while still being
+        capturable by subprocess.run(capture_output=True).
+        WARNING, ERROR, and CRITICAL always use normal stderr, even in TEST mode.
+
+        Records are formatted with a shared TagFormatter("%(message)s") while
+        no formatter is set. The handler's own formatter starts as None, so
+        setFormatter() and stdlib helpers like basicConfig(format=...) can
+        still fill it in.
+
+        Handlers created by Logger.manageHandlers() skip records that a
+        DualStreamHandler already emitted. This keeps a stale managed handler,
+        or root's handler under a child with a DualStreamHandler of its own,
+        from printing the same message twice. Handlers added by the user
+        always write.
+
+        With async_mode=True, emit() formats the record and picks its stream
+        in the logging call, then queues it; a QueueListener thread only
+        writes the finished line. Call close() to flush the queue before the
+        process (or test) inspects the output.
+        """
+
+        enable_color: bool = False
+        """Enable ANSI color output for log messages."""
+
+        # Fallback used by format() while self.formatter is None. Formatters
+        # keep no per-record state, so every handler can share one instead of
+        # compiling the same format string for each new handler
+        _default_formatter: logging.Formatter = (
+            ApatheticLogging_Internal_TagFormatter.TagFormatter("%(message)s")
+        )
+
+        class _SeenFilter(logging.Filter):
+            """Drop records that a DualStreamHandler already emitted.
+
+            Attached by Logger.manageHandlers() to the handlers it creates.
+            """
+
+            def filter(self, record: logging.LogRecord) -> bool:
+                """Return False if the record is marked as emitted."""
+                return not getattr(record, "_apathetic_seen", False)
+
+        # Stateless, so one instance serves every handler
+        _seen_filter: logging.Filter = _SeenFilter()
+
+        # Set by Logger.manageHandlers() on the handlers it creates; it only
+        # ever removes or rebuilds those (and filters seen records on those),
+        # never a user's DualStreamHandler
+        _managed: bool = False
+
+        class _QueuedRecordWriter(logging.StreamHandler):  # type: ignore[type-arg]
+            """Write records an async DualStreamHandler already formatted."""
+
+            def emit(self, record: logging.LogRecord) -> None:
+                """Write the prepared message to the stream chosen at log time."""
+                self.stream = record._apathetic_stream  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+                super().emit(record)
+
+        # async mode only: the record queue, the handler that writes the
+        # prepared records out, and the listener thread feeding it
+        _queue: queue.SimpleQueue[logging.LogRecord] | None = None
+        _writer: logging.StreamHandler | None = None  # type: ignore[type-arg]
+        _listener: logging.handlers.QueueListener | None = None
+
+        def __init__(self, *args: Any, async_mode: bool = False, **kwargs: Any) -> None:
+            """Initialize the dual stream handler. super().__init__() to StreamHandler.
+
+            Args:
+                *args: Additional positional arguments (for future-proofing)
+                async_mode: Queue records and write them on a listener thread
+                    instead of in the logging call. Defaults to False.
+                **kwargs: Additional keyword arguments (for future-proofing)
+            """
+            # default to stdout, overridden per record in emit()
+            super().__init__(*args, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+
+            if async_mode:
+                self._queue = queue.SimpleQueue()
+                self._writer = self._QueuedRecordWriter()
+                self._listener = logging.handlers.QueueListener(
+                    self._queue, self._writer
+                )
+                self._listener.start()
+
+        def format(self, record: logging.LogRecord) -> str:
+            """Format a record, with the shared TagFormatter if none is set.
+
+            Wrapper for logging.Handler.format.
+
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.format
+            """
+            fmt = self.formatter or self._default_formatter
+            return fmt.format(record)
+
+        def close(self) -> None:
+            """Flush queued records (async mode) and close the handler.
+
+            Wrapper for logging.StreamHandler.close.
+
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.close
+            """
+            if self._listener is not None:
+                # stop() drains the queue before returning
+                self._listener.stop()
+                self._listener = None
+            if self._writer is not None:
+                self._writer.close()
+            super().close()
+
+        def _prepareRecord(
+            self, record: logging.LogRecord, stream: Any
+        ) -> logging.LogRecord:
+            """Return a formatted copy of ``record`` for the async writer.
+
+            Like logging.handlers.QueueHandler.prepare(): the message is
+            formatted now and msg/args/exc_info are replaced by the result, so
+            changes made to the arguments after the call cannot alter the
+            output. The stream picked by emit() travels with the copy.
+            """
+            msg = self.format(record)
+            prepared = copy.copy(record)
+            prepared.message = msg
+            prepared.msg = msg
+            prepared.args = None  # pyright: ignore[reportAttributeAccessIssue]
+            prepared.exc_info = None
+            prepared.exc_text = None
+            prepared.stack_info = None
+            prepared._apathetic_stream = stream  # noqa: SLF001
+            return prepared
+
+        def emit(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> None:
+            """Routes based on log level and handles colorization.
+
+            Features:
+            - Routes messages to stdout or stderr based on log level:
+              - DETAIL, INFO, and BRIEF → stdout (normal program output)
+              - TRACE, DEBUG, WARNING, ERROR, and CRITICAL → stderr
+                (diagnostic/error output)
+            - In TEST mode, TEST/TRACE/DEBUG messages bypass pytest capture
+              by writing to sys.__stderr__ instead of sys.stderr
+            - Sets enable_color attribute on record for TagFormatter integration
+
+            Args:
+                record: The LogRecord to emit
+                *args: Additional positional arguments (for future-proofing)
+                **kwargs: Additional keyword arguments (for future-proofing)
+
+            logging.Handler.emit() implementation:
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
+            """
+            # marked on emit (not in the filter), so a record rejected by a
+            # later filter is still free to reach another DualStreamHandler,
+            # and before queueing, so the mark never depends on when the
+            # listener thread gets to the record
+            record._apathetic_seen = True  # noqa: SLF001
+
+            # Import here to avoid circular dependency
+
+            _constants = ApatheticLogging_Internal_Constants
+            level = record.levelno
+
+            # Check if logger is in TEST mode (bypass capture for verbose levels)
+            logger_name = record.name
+            # from .get_logger import (
+            #     ApatheticLogging_Internal_GetLogger,
+            # )
+
+            # logger_instance = ApatheticLogging_Internal_GetLogger.getLogger(
+            #     logger_name, extend=False
+            # )
+            # can't use internal getLogger() here
+            #   because then it will call extendLoggingModule again
+            logger_instance = logging.getLogger(logger_name)
+
+            # Check the class-level IS_APATHETIC marker to tell if this is our
+            # Logger class (one attribute lookup per record, and no import,
+            # avoiding a circular dependency)
+            is_apathetic = getattr(logger_instance, "IS_APATHETIC", False)
+            # Use effective level (not explicit level) to detect TEST mode,
+            # so child loggers that inherit TEST level from parent are correctly
+            # detected
+            is_test_mode = is_apathetic and logger_instance.getEffectiveLevel() == (
+                _constants.TEST_LEVEL
+            )
+
+            # Determine target stream
+            if level >= logging.WARNING:
+                # WARNING, ERROR, CRITICAL → stderr (always, even in TEST mode)
+                # This ensures they still break tests as expected
+                stream = sys.stderr
+            elif level <= logging.DEBUG:
+                # TEST, TRACE, DEBUG → stderr (normal) or __stderr__ (TEST mode bypass)
+                # Use __stderr__ so they bypass pytest capsys but are still
+                # capturable by subprocess.run(capture_output=True)
+                stream = sys.__stderr__ if is_test_mode else sys.stderr
+            else:
+                # DETAIL, INFO, BRIEF → stdout (normal program output)
+                stream = sys.stdout
+
+            # used by TagFormatter
+            record.enable_color = getattr(self, "enable_color", False)
+
+            if self._queue is not None:
+                # async mode: format and route here, on the logging thread, so
+                # the output reflects the arguments, streams and level of the
+                # call; the listener thread only writes the finished line
+                try:
+                    self._queue.put_nowait(self._prepareRecord(record, stream))
+                except Exception:  # noqa: BLE001
+                    self.handleError(record)
+                return
+
+            self.stream = stream
+            super().emit(record, *args, **kwargs)
+
+
+# === apathetic_logging.logger ===
+# src/apathetic_logging/logger.py
+"""Core Logger implementation for Apathetic Logging.
+
+See https://docs.python.org/3/library/logging.html#logging.Logger for the
+complete list of standard library Logger methods that are extended by this class.
+
+Docstrings are adapted from the standard library logging.Logger documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Core Logger implementation for all Apathetic tools.
+
+    This class contains the core Logger implementation.
+    It provides all the custom methods and functionality for apathetic logging.
+    """
+
+    enable_color: bool = False
+    """Enable ANSI color output for log messages."""
+
+    IS_APATHETIC: bool = True
+    """Marks apathetic loggers; handlers check this instead of probing methods."""
+
+    _logging_module_extended: bool = False
+
+    # if stdout or stderr are redirected, we need to repoint. Holds weak
+    # references to the streams (see _currentStreamRefs()), so a replaced
+    # stream (e.g. a test's capture buffer) is not kept alive by the logger
+    # while the check stays an exact identity comparison
+    _last_stream_ids: tuple[Callable[[], Any], Callable[[], Any]] | None = None
+
+    DEFAULT_STACKLEVEL = 2
+    """Default stacklevel for errorIfNotDebug/criticalIfNotDebug methods."""
+
+    def __init__(
+        self,
+        name: str,
+        level: int | None = ApatheticLogging_Internal_Constants.INHERIT_LEVEL,
+        *,
+        enable_color: bool | None = None,
+        propagate: bool | None = None,
+    ) -> None:
+        """Initialize the logger.
+
+        Sets up color support and log propagation. Loggers default to INHERIT_LEVEL
+        (i.e. NOTSET) to inherit level from root logger. Defaults to propagate=True for
+        root logger architecture.
+
+        **Contract with getLoggerOfType():** The propagate setting follows a two-phase
+        initialization pattern when propagate=None:
+        1. __init__ sets _propagate_explicit=False to indicate the value was not
+           explicitly provided by the user.
+        2. After logger creation, getLoggerOfType() calls _applyPropagateSetting(),
+           which checks _propagate_explicit and applies the registry or default value.
+        This allows explicit user overrides (propagate=True/False in __init__) to take
+        precedence over registry/default values set later via _applyPropagateSetting().
+
+        Args:
+            name: Logger name
+            level: Initial logging level. If None, auto-resolves via
+                determineLogLevel(). If INHERIT_LEVEL (i.e. NOTSET)
+                (default), inherits from root logger. Otherwise, sets
+                explicit level.
+            enable_color: Force color output on/off, or None for auto-detect
+            propagate: Propagate setting. If None, uses registered setting or
+                defaults to True. If True, messages propagate to parent loggers.
+
+        """
+        # it is too late to call extendLoggingModule
+
+        _constants = ApatheticLogging_Internal_Constants
+        super().__init__(name, _constants.INHERIT_LEVEL if level is None else level)
+
+        # Handle None level - auto-resolve via determineLogLevel
+        if level is None:
+            # Initialize with INHERIT_LEVEL (i.e. NOTSET) first, then resolve
+            self.setLevel(self.determineLogLevel())
+
+        # detect color support once per instance
+        self.enable_color = (
+            enable_color
+            if enable_color is not None
+            else type(self).determineColorEnabled()
+        )
+
+        # Set propagate - use provided value, or will be set by _applyPropagateSetting
+        if propagate is not None:
+            self.setPropagate(propagate)
+        else:
+            self._propagate_explicit = False  # Will be set by _applyPropagateSetting
+
+        # handler attachment will happen in _log() with manageHandlers()
+
+    @staticmethod
+    def _streamRef(stream: Any) -> Callable[[], Any]:
+        """Return a weak reference to ``stream``, or a strong one if unsupported.
+
+        Streams without weakref support (e.g. None when there is no console)
+        are held directly; calling the result returns the stream either way.
+        """
+        try:
+            return weakref.ref(stream)
+        except TypeError:
+            return lambda: stream
+
+    @classmethod
+    def _currentStreamRefs(cls) -> tuple[Callable[[], Any], Callable[[], Any]]:
+        """Return references to the current sys.stdout and sys.stderr."""
+        return cls._streamRef(sys.stdout), cls._streamRef(sys.stderr)
+
+    @staticmethod
+    def _isManagedHandler(handler: logging.Handler) -> bool:
+        """Return True if manageHandlers() created this handler."""
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        if not isinstance(handler, _dual_stream_handler.DualStreamHandler):
+            return False
+        return handler._managed  # noqa: SLF001
+
+    def _rebuildAppatheticHandlers(self) -> None:
+        """Rebuild apathetic handlers for this logger.
+
+        Removes the DualStreamHandler instances it created earlier and creates
+        a new one. Updates _last_stream_ids to track current stdout/stderr.
+
+        This is called by manageHandlers() when handlers need to be rebuilt.
+
+        """
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        _safe_logging = ApatheticLogging_Internal_SafeLogging
+
+        # Remove existing managed handlers. In unusual circumstances (e.g., when
+        # test fixtures create a new root logger and copy handlers), there might be
+        # multiple stale handlers from copies. Remove them defensively to ensure
+        # we don't end up with handlers pointing to old stdout/stderr.
+        for handler in list(self.handlers):  # Copy list to avoid mutation issues
+            if self._isManagedHandler(handler):
+                self.removeHandler(handler)
+                if hasattr(handler, "close"):
+                    handler.close()
+
+        # Add new apathetic handler
+        # DualStreamHandler formats with the shared TagFormatter by default
+        h = _dual_stream_handler.DualStreamHandler()
+        h._managed = True  # noqa: SLF001
+        # skip records another DualStreamHandler already wrote (defense in
+        # depth against stale or duplicated handlers multiplying output)
+        h.addFilter(h._seen_filter)  # noqa: SLF001
+        h.enable_color = self.enable_color
+        self.addHandler(h)
+        self._last_stream_ids = self._currentStreamRefs()
+        _safe_logging.safeTrace(
+            "manageHandlers()",
+            f"rebuilt_handlers={self.handlers}",
+        )
+
+    def manageHandlers(self, *, manage_handlers: bool | None = None) -> None:
+        """Manage apathetic handlers for this logger.
+
+        Root logger always gets an apathetic handler. Child loggers only get
+        apathetic handlers if they're not propagating (propagate=False),
+        otherwise they rely on root logger's handler via propagation.
+
+        Only manages the DualStreamHandler instances it created. User-added
+        handlers, including user-added DualStreamHandlers, are left untouched.
+
+        Rebuilds handlers if they're missing or if stdout/stderr have changed.
+
+        Args:
+            manage_handlers: If True, manage handlers (even in compat mode).
+                If None, checks compatibility mode: in compat mode, handlers are
+                not managed unless explicitly enabled. If False, returns early
+                without managing handlers. Defaults to None.
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve manage_handlers parameter
+        if manage_handlers is None:
+            # Check compatibility mode - in compat mode, don't manage handlers
+            # unless explicitly requested
+
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+            compat_mode = _logging_utils._getCompatibilityMode()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+            if compat_mode:
+                # In compat mode, don't manage handlers by default
+                return
+
+            # Not in compat mode, use default from constants
+            manage_handlers = _constants.DEFAULT_MANAGE_HANDLERS
+
+        # Return early if management is disabled
+        if not manage_handlers:
+            return
+
+        # Identify the apathetic handlers this logger created
+        apathetic_handlers = [h for h in self.handlers if self._isManagedHandler(h)]
+
+        # Propagating child loggers should not have apathetic handlers
+        # Only handlers created by manageHandlers() are removed, never
+        # manually-added ones
+        # Root logger can have name "" (ROOT_LOGGER_KEY) or "root" (ROOT_LOGGER_NAME)
+        is_root = self.name in {
+            _constants.ROOT_LOGGER_KEY,
+            _constants.ROOT_LOGGER_NAME,
+        }
+        if not is_root and self.propagate:
+            for handler in apathetic_handlers:
+                self.removeHandler(handler)
+            return
+
+        # Root logger or non-propagating child logger - ensure it has an
+        # apathetic handler. Check if rebuild is needed (missing handler or
+        # streams changed). A reference to a collected stream returns None,
+        # which never matches the current stream
+        last_streams = self._last_stream_ids
+        needs_rebuild = (
+            not apathetic_handlers
+            or last_streams is None
+            or last_streams[0]() is not sys.stdout
+            or last_streams[1]() is not sys.stderr
+        )
+
+        if needs_rebuild:
+            self._rebuildAppatheticHandlers()
+
+    def _log(  # type: ignore[override]
+        self,
+        level: int,
+        msg: str,
+        args: tuple[Any, ...],
+        **kwargs: Any,
+    ) -> None:
+        """Log a message with the specified level.
+
+        Changed:
+        - Automatically manages handlers via manageHandlers()
+
+        Args:
+            level: The numeric logging level
+            msg: The message format string
+            args: Arguments for the message format string
+            **kwargs: Additional keyword arguments passed to the base implementation
+
+        Wrapper for logging.Logger._log.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger._log
+
+        """
+        self.manageHandlers()
+        super()._log(level, msg, args, **kwargs)
+
+    def setLevel(
+        self,
+        level: int | str,
+        *,
+        minimum: bool | None = False,
+    ) -> None:
+        """Set the logging level of this logger.
+
+        Changed:
+        - Accepts both int and str level values (case-insensitive for strings)
+        - Automatically resolves string level names to numeric values
+        - Supports custom level names (TEST, TRACE, BRIEF, DETAIL, SILENT)
+        - Validates that custom levels are registered properly (no duplicate
+          numeric level values via addLevelName)
+        - In compatibility mode, accepts any level value (including 0 and negative)
+          matching stdlib behavior.
+        - Added `minimum` parameter: if True, only sets the level if it's more
+          verbose (lower numeric value) than the current level
+
+        Args:
+            level: The logging level, either as an integer or a string name
+                (case-insensitive). Standard levels (DEBUG, INFO, WARNING, ERROR,
+                CRITICAL) and custom levels (TEST, TRACE, BRIEF, DETAIL, SILENT)
+                are supported. Use 0/NOTSET to inherit level from parent logger.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). Defaults to False. None is accepted and treated
+                as False.
+
+        Wrapper for logging.Logger.setLevel.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.setLevel
+
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve string to integer if needed using utility function
+        level_name: str | None = None
+        if isinstance(level, str):
+            level_name = level
+            level = _logging_utils.getLevelNumber(level)
+
+        # Handle minimum level logic (None is treated as False)
+        if minimum:
+            current_level = self.getEffectiveLevel()
+            # Lower number = more verbose, so only set if new level is more verbose
+            if level >= current_level:
+                # Don't downgrade - keep current level
+                return
+
+        # Validate level only if it's <= 0 in improved mode
+        # (validate that custom negative levels are not used)
+        self.validateLevel(level, level_name=level_name)
+
+        super().setLevel(level)
+        # Clear the isEnabledFor cache when level changes, as cached values
+        # may be stale (e.g., if level was TRACE and cached isEnabledFor(TRACE)=True,
+        # then changing to DEBUG should invalidate that cache entry)
+        if hasattr(self, "_cache"):
+            self._cache.clear()  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+
+    def setLevelMinimum(self, level: int | str) -> None:
+        """Set the logging level only if it's more verbose than the current level.
+
+        This convenience method is equivalent to calling
+        ``setLevel(level, minimum=True)``. It prevents downgrading from a more
+        verbose level (e.g., TRACE) to a less verbose one (e.g., DEBUG).
+
+        Args:
+            level: The logging level, either as an integer or a string name
+                (case-insensitive). Standard levels (DEBUG, INFO, WARNING, ERROR,
+                CRITICAL) and custom levels (TEST, TRACE, BRIEF, DETAIL, SILENT)
+                are supported.
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> logger.setLevel("TRACE")
+            >>> # This won't downgrade from TRACE to DEBUG
+            >>> logger.setLevelMinimum("DEBUG")
+            >>> assert logger.levelName == "TRACE"  # Still TRACE
+            >>> # This will upgrade from INFO to DEBUG
+            >>> logger.setLevel("INFO")
+            >>> logger.setLevelMinimum("DEBUG")
+            >>> assert logger.levelName == "DEBUG"  # Upgraded to DEBUG
+
+        """
+        self.setLevel(level, minimum=True)
+
+    def setLevelInherit(self) -> None:
+        """Set the logger to inherit its level from the parent logger.
+
+        This convenience method is equivalent to calling ``setLevel(0)`` or
+        ``setLevel(INHERIT_LEVEL)`` or ``setLevel("NOTSET")``. It explicitly
+        sets the logger to INHERIT_LEVEL (i.e. NOTSET) so it inherits its
+        effective level from the root logger or parent logger.
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> logger.setLevel("DEBUG")
+            >>> # Set to inherit from root logger
+            >>> logger.setLevelInherit()
+            >>> assert logger.levelName == "NOTSET"
+            >>> assert logger.effectiveLevel == root.level  # Inherits from root
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        self.setLevel(_constants.INHERIT_LEVEL)
+
+    def setPropagate(
+        self,
+        propagate: bool,  # noqa: FBT001
+        *,
+        manage_handlers: bool | None = None,
+    ) -> None:
+        """Set the propagate setting for this logger.
+
+        When propagate is True, messages are passed to handlers of higher level
+        (ancestor) loggers, in addition to any handlers attached to this logger.
+        When False, messages are not passed to handlers of ancestor loggers.
+
+        Args:
+            propagate: If True, messages propagate to parent loggers. If False,
+                messages only go to this logger's handlers.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Wrapper for logging.Logger.propagate attribute.
+
+        https://docs.python.org/3.10/library/logging.html#logging.Logger.propagate
+
+        """
+        self.propagate = propagate
+        self._propagate_explicit = True  # Mark as explicitly set
+
+        # Always call manageHandlers - it will handle the manage_handlers parameter
+        self.manageHandlers(manage_handlers=manage_handlers)
+
+    def setLevelAndPropagate(
+        self,
+        level: int | str,
+        *,
+        minimum: bool | None = False,
+        manage_handlers: bool | None = None,
+    ) -> None:
+        """Set the logging level and propagate setting together in a smart way.
+
+        This convenience method combines setLevel() and setPropagate() with
+        intelligent defaults:
+        - If level is INHERIT_LEVEL (NOTSET): sets propagate=True
+        - If level is a specific level: sets propagate=False
+        - On root logger: only sets level (propagate is unchanged)
+
+        This matches common use cases: when inheriting level, you typically
+        want to propagate to parent handlers. When setting an explicit level,
+        you typically want isolated logging with your own handler.
+
+        Args:
+            level: The logging level, either as an integer or a string name
+                (case-insensitive). Standard levels (DEBUG, INFO, WARNING, ERROR,
+                CRITICAL) and custom levels (TEST, TRACE, BRIEF, DETAIL, SILENT)
+                are supported. Use INHERIT_LEVEL (0) or "NOTSET" to inherit.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). Defaults to False. None is accepted and treated
+                as False.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> # Set to inherit level and propagate to root
+            >>> logger.setLevelAndPropagate(INHERIT_LEVEL)
+            >>> # Set explicit level and disable propagation (isolated logging)
+            >>> logger.setLevelAndPropagate("debug")
+
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve string to integer if needed using utility function
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Set the level first
+        self.setLevel(level_int, minimum=minimum)
+
+        # Determine propagate setting based on level
+        # Only set propagate if not root logger
+        # Root logger can have name "" (ROOT_LOGGER_KEY) or "root" (ROOT_LOGGER_NAME)
+        is_root = self.name in {
+            _constants.ROOT_LOGGER_KEY,
+            _constants.ROOT_LOGGER_NAME,
+        }
+        if not is_root:
+            if level_int == _constants.INHERIT_LEVEL:
+                # INHERIT_LEVEL -> propagate=True
+                self.setPropagate(True, manage_handlers=manage_handlers)
+            else:
+                # Specific level -> propagate=False
+                self.setPropagate(False, manage_handlers=manage_handlers)
+        # Root logger: propagate is unchanged (root always has handlers)
+
+    @classmethod
+    def determineColorEnabled(cls) -> bool:
+        """Return True if colored output should be enabled."""
+        # Respect explicit overrides
+        if "NO_COLOR" in os.environ:
+            return False
+        if os.getenv("FORCE_COLOR", "").lower() in {"1", "true", "yes"}:
+            return True
+
+        # Auto-detect: use color if output is a TTY
+        return sys.stdout.isatty()
+
+    @staticmethod
+    def validateLevel(
+        level: int,
+        *,
+        level_name: str | None = None,
+    ) -> None:
+        """Validate that a level value is not negative (>= 0).
+
+        Custom levels with values < 0 (negative) are discouraged by PEP 282.
+        Level 0 (NOTSET/INHERIT_LEVEL) is allowed - it causes loggers to
+        inherit from parent loggers. For custom levels to not be confusing,
+        duplicate numeric values are prevented via addLevelName() validation.
+
+        In compatibility mode, validation is skipped (all levels are accepted).
+
+        Args:
+            level: The numeric level value to validate
+            level_name: Optional name for the level (for error messages).
+                If None, will attempt to get from getLevelName()
+
+        Raises:
+            ValueError: If level < 0 (negative levels are discouraged)
+
+        Example:
+            >>> Logger.validateLevel(5, level_name="TRACE")
+            >>> Logger.validateLevel(0, level_name="NOTSET")  # OK - allows inheritance
+            >>> Logger.validateLevel(-5, level_name="NEGATIVE")
+            ValueError: Level 'NEGATIVE' has value -5, which is < 0...
+
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Check compatibility mode
+        compat_mode = _logging_utils._getCompatibilityMode()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+        if compat_mode:
+            return
+
+        if level < _constants.INHERIT_LEVEL:
+            if level_name is None:
+                level_name = _logging_utils.getLevelNameStr(level)
+            msg = (
+                f"Level '{level_name}' has value {level}, "
+                "which is < 0. This is discouraged by PEP 282 and"
+                " results can lead to unexpected behavior."
+            )
+            raise ValueError(msg)
+
+    @staticmethod
+    def addLevelName(level: int, level_name: str) -> None:
+        """Associate a level name with a numeric level.
+
+        Changed:
+        - Validates that level is not negative (>= 0) to prevent issues per PEP 282
+        - Checks for duplicate numeric level values to prevent confusion
+        - Sets logging.<LEVEL_NAME> attribute for convenience, matching the
+          pattern of built-in levels (logging.DEBUG, logging.INFO, etc.)
+        - Sets apathetic_logging.<LEVEL_NAME>_LEVEL attribute for consistency
+          with constant naming pattern (e.g., apathetic_logging.TRACE_LEVEL,
+          apathetic_logging.CUSTOM_LEVEL)
+        - Validates existing attributes to ensure consistency
+
+        Args:
+            level: The numeric level value (must be >= 0 and not already used
+                by another level name to avoid confusion)
+            level_name: The name to associate with this level
+
+        Raises:
+            ValueError: If level < 0 (negative levels are discouraged by PEP 282)
+            ValueError: If a different level name already has this numeric value
+            ValueError: If logging.<LEVEL_NAME> already exists with a different value
+            ValueError: If apathetic_logging.<LEVEL_NAME>_LEVEL already exists
+                with a different value
+
+        Wrapper for logging.addLevelName.
+
+        https://docs.python.org/3.10/library/logging.html#logging.addLevelName
+
+        """
+        # Validate level is not negative
+        ApatheticLogging_Internal_LoggerCore.validateLevel(level, level_name=level_name)
+
+        # Check for duplicate numeric level values
+        # Get the existing name for this level value
+        existing_name = logging.getLevelName(level)
+        # Check if this level value is already registered to a different name
+        # (getLevelName returns "Level {n}" format for unknown levels)
+        if not existing_name.startswith("Level ") and existing_name != level_name:
+            msg = (
+                f"Level value {level} is already registered as '{existing_name}'. "
+                f"Cannot register as '{level_name}'. "
+                "Each level value must have a unique name to avoid confusion."
+            )
+            raise ValueError(msg)
+
+        # Check if attribute already exists in logging namespace and validate it
+        existing_value = getattr(logging, level_name, None)
+        if existing_value is not None:
+            # If it exists, it must be a valid level value (positive integer)
+            if not isinstance(existing_value, int):
+                msg = (
+                    f"Cannot set logging.{level_name}: attribute already exists "
+                    f"with non-integer value {existing_value!r}. "
+                    "Level attributes must be integers."
+                )
+                raise ValueError(msg)
+            # Validate existing value is positive
+            ApatheticLogging_Internal_LoggerCore.validateLevel(
+                existing_value,
+                level_name=level_name,
+            )
+            if existing_value != level:
+                msg = (
+                    f"Cannot set logging.{level_name}: attribute already exists "
+                    f"with different value {existing_value} "
+                    f"(trying to set {level}). "
+                    "Level attributes must match the level value."
+                )
+                raise ValueError(msg)
+            # If it exists and matches, we can proceed (idempotent)
+
+        # Get apathetic_logging namespace class
+        namespace_module = sys.modules.get("apathetic_logging")
+        namespace_class = None
+        if namespace_module is not None:
+            namespace_class = getattr(namespace_module, "apathetic_logging", None)
+
+        # Use _LEVEL suffix for apathetic_logging namespace to match constant pattern
+        # (e.g., apathetic_logging.TRACE_LEVEL instead of apathetic_logging.TRACE)
+        apathetic_level_name = f"{level_name}_LEVEL"
+
+        # Check if attribute already exists in apathetic_logging namespace
+        # and validate it
+        if namespace_class is not None:
+            existing_apathetic_value = getattr(
+                namespace_class,
+                apathetic_level_name,
+                None,
+            )
+            if existing_apathetic_value is not None:
+                # If it exists, it must be a valid level value (positive integer)
+                if not isinstance(existing_apathetic_value, int):
+                    msg = (
+                        f"Cannot set apathetic_logging.{apathetic_level_name}: "
+                        f"attribute already exists with non-integer value "
+                        f"{existing_apathetic_value!r}. "
+                        "Level attributes must be integers."
+                    )
+                    raise ValueError(msg)
+                # Validate existing value is positive
+                ApatheticLogging_Internal_LoggerCore.validateLevel(
+                    existing_apathetic_value,
+                    level_name=level_name,
+                )
+                if existing_apathetic_value != level:
+                    msg = (
+                        f"Cannot set apathetic_logging.{apathetic_level_name}: "
+                        f"attribute already exists with different value "
+                        f"{existing_apathetic_value} (trying to set {level}). "
+                        "Level attributes must match the level value."
+                    )
+                    raise ValueError(msg)
+                # If it exists and matches, we can proceed (idempotent)
+
+        logging.addLevelName(level, level_name)
+        # Set convenience attribute matching built-in levels (logging.DEBUG, etc.)
+        setattr(logging, level_name, level)
+
+        # Set convenience attribute on apathetic_logging namespace class
+        # with _LEVEL suffix to match constant pattern
+        # (e.g., apathetic_logging.TRACE_LEVEL, apathetic_logging.CUSTOM_LEVEL)
+        if namespace_class is not None:
+            setattr(namespace_class, apathetic_level_name, level)
+
+    @classmethod
+    def extendLoggingModule(
+        cls,
+        *,
+        replace_root: bool | None = None,
+        port_handlers: bool | None = None,
+        port_level: bool | None = None,
+    ) -> bool:
+        """The return value tells you if we ran or not.
+        If it is False and you're calling it via super(),
+        you can likely skip your code too.
+
+        Args:
+            replace_root: Whether to replace the root logger if it's not the correct
+                type. If None (default), checks the registry setting (set via
+                registerReplaceRootLogger()). If not set in registry, defaults to True
+                for backward compatibility. When False, the root logger will not be
+                replaced, allowing applications to use their own custom logger class
+                for the root logger. Note: This parameter is overridden if the user
+                has explicitly called ensureRootLogger(), which sets the
+                _root_logger_user_configured flag. In that case, the root logger will
+                never be replaced, regardless of the replace_root setting.
+            port_handlers: Whether to port handlers from the old root logger to the
+                new logger. If None (default), checks the registry setting (set via
+                registerPortHandlers()). If not set in registry, defaults to True
+                (DEFAULT_PORT_HANDLERS from constants.py). When False, the new
+                logger manages its own handlers via manageHandlers().
+            port_level: Whether to port level from the old root logger to the new
+                logger. If None (default), uses smart detection: if the root logger
+                was never instantiated (fresh), uses determineLogLevel() to apply
+                registered defaults; if the root logger was already accessed, respects
+                the registry setting (set via registerPortLevel()), defaulting to True
+                (DEFAULT_PORT_LEVEL from constants.py). This allows registered defaults
+                to apply cleanly during initialization, while respecting user
+                configuration of the root logger before extendLoggingModule() is called.
+                When explicitly False, always uses determineLogLevel(). When explicitly
+                True, always preserves the old level.
+
+        Note:
+            This method respects the _root_logger_user_configured flag set by
+            ensureRootLogger(). This flag represents user **intent** to control the
+            root logger, which is distinct from whether the root logger has been
+            **instantiated** (see isRootLoggerInstantiated()). The flag is sticky
+            and persists even if the root logger is later removed, ensuring that
+            if a user explicitly called ensureRootLogger(), subsequent calls to
+            extendLoggingModule() will never replace the root logger.
+
+        Note for tests:
+            When testing isinstance checks on logger instances, use
+            ``logging.getLoggerClass()`` instead of direct class references
+            (e.g., ``mod_alogs.Logger``). This works reliably in both package
+            and stitched runtime modes because it uses the actual class object
+            that was set via ``logging.setLoggerClass()``, rather than a class
+            reference from the import shim which may have different object identity
+            in stitched mode.
+
+        Example:
+                # ✅ Good: Works in both package and stitched modes
+                assert isinstance(logger, logging.getLoggerClass())
+
+                # ❌ May fail in stitched mode due to class identity differences
+                assert isinstance(logger, mod_alogs.Logger)
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        # Check if this specific class has already extended the module
+        # (not inherited from base class)
+        already_extended = getattr(cls, "_logging_module_extended", False)
+
+        # Always set the logger class to cls, even if already extended.
+        # This allows subclasses to override the logger class.
+        # stdlib unwrapped
+        logging.setLoggerClass(cls)
+
+        # Register custom levels EARLY (before root logger replacement)
+        # This ensures determineLogLevel() can return custom level names
+        # when applying defaults via _setApatheticDefaults() during root replacement
+        if not already_extended:
+            # Sanity check: validate TAG_STYLES keys are in LEVEL_ORDER
+            if __debug__:
+                _tag_levels = set(_constants.TAG_STYLES.keys())
+                _known_levels = {lvl.upper() for lvl in _constants.LEVEL_ORDER}
+                if not _tag_levels <= _known_levels:
+                    _msg = "TAG_STYLES contains unknown levels"
+                    raise AssertionError(_msg)
+
+            # Register custom levels with validation
+            # addLevelName() also sets logging.TEST, logging.TRACE, etc. attributes
+            cls.addLevelName(_constants.TEST_LEVEL, "TEST")
+            cls.addLevelName(_constants.TRACE_LEVEL, "TRACE")
+            cls.addLevelName(_constants.DETAIL_LEVEL, "DETAIL")
+            cls.addLevelName(_constants.BRIEF_LEVEL, "BRIEF")
+            cls.addLevelName(_constants.SILENT_LEVEL, "SILENT")
+
+        # Check if root logger exists and needs to be replaced
+        # This handles the case where root logger was created before
+        # extendLoggingModule() was called (e.g., if stdlib logging was imported first)
+        # We always check if root logger needs replacement (even if already_extended),
+        # but only replace on first call OR if root logger is wrong type
+        # Determine if we should replace the root logger
+        # Check parameter first, then registry, then default from constants
+        if replace_root is None:
+            _registry_data = ApatheticLogging_Internal_RegistryData
+            _registered_replace_root = (
+                _registry_data.registered_internal_replace_root_logger
+            )
+            replace_root = (
+                _registered_replace_root
+                if _registered_replace_root is not None
+                else _constants.DEFAULT_REPLACE_ROOT_LOGGER
+            )
+
+        # Check if user has explicitly configured the root logger via
+        # ensureRootLogger(). If they have, respect their choice and don't touch it.
+        # Use the main apathetic_logging module, not the logger submodule
+        # (important for stitched mode where there's only one module)
+        #
+        # NOTE: This checks _root_logger_user_configured (user INTENT), not
+        # isRootLoggerInstantiated() (current STATE). These are fundamentally
+        # different:
+        # - _root_logger_user_configured: True if user called ensureRootLogger()
+        # - isRootLoggerInstantiated(): True if ANY code accessed the root logger
+        # We MUST use the flag here to avoid replacing a root logger that was
+        # created by third-party code when the user didn't explicitly configure it.
+        namespace_module = sys.modules.get("apathetic_logging")
+        user_configured_root = getattr(
+            namespace_module, "_root_logger_user_configured", False
+        )
+
+        # Check if root logger was already instantiated BEFORE getting it
+        # (getting it will create it if it doesn't exist)
+        # This is used to determine whether to port level or apply defaults.
+
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        root_was_instantiated = _logging_utils.isRootLoggerInstantiated()
+
+        # Get root logger directly (logging.root or from registry)
+        root_logger = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+        # Determine if we should replace the root logger
+        # Only replace if:
+        # 1. replace_root is True (parameter, registry, or default)
+        # 2. User has NOT explicitly configured root via ensureRootLogger()
+        # 3. Either on first call (not already_extended) OR root logger is wrong type
+        #
+        # The _root_logger_user_configured flag is critical here: if True, we NEVER
+        # replace the root logger, ensuring that user intent via ensureRootLogger()
+        # is always respected. This differs from isRootLoggerInstantiated(), which
+        # can be True if third-party code accessed the root logger.
+        should_replace_root = (
+            replace_root
+            and not user_configured_root
+            and (not already_extended or not isinstance(root_logger, cls))
+        )
+        if should_replace_root:
+            # Root logger is wrong type - need to replace it
+            # Remove old root logger from registry
+
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+            # Remove from registry
+            _logging_utils.removeLogger(_constants.ROOT_LOGGER_KEY)
+
+            # Clear logging.root (root logger is stored there as a module-level
+            # variable). This is necessary because logging.getLogger("") returns
+            # logging.root directly.
+            if hasattr(logging, "root"):
+                logging.root = None  # type: ignore[assignment]
+
+            # Create new root logger using the manager's getLogger method
+            # The logger class is already set to cls (line 687), so this will create
+            # a logger of type cls. We use the manager directly because it handles
+            # root logger creation properly even when logging.root is None.
+            # Note: We don't use _getOrCreateLoggerOfType() here because:
+            # 1. It would call _setLoggerClassTemporarily() which is unnecessary
+            #    since we've already set the logger class to cls
+            # 2. The manager's getLogger() is the most direct way to create a root
+            #    logger
+            # 3. This avoids any potential issues with logging.root being None
+            new_root_logger = logging.Logger.manager.getLogger(
+                _constants.ROOT_LOGGER_KEY
+            )
+
+            # Ensure root logger has correct name ("root" not "")
+            # Python's logging module sets root logger name to "root" even though
+            # it's retrieved with "". We need to ensure our replacement maintains
+            # this behavior.
+            if new_root_logger.name != _constants.ROOT_LOGGER_NAME:
+                new_root_logger.name = _constants.ROOT_LOGGER_NAME
+
+            # Update logging.root to point to the new root logger
+            # This is necessary because logging.getLogger("") returns logging.root
+            # directly, and we want to ensure it points to our new logger instance.
+            if hasattr(logging, "root"):
+                logging.root = new_root_logger  # type: ignore[assignment]
+
+            # Also update logging.Logger.manager.root to point to new root logger
+            # The manager's root must stay in sync with logging.root, otherwise
+            # they reference different objects and child loggers may have incorrect
+            # parent references.
+            logging.Logger.manager.root = new_root_logger  # type: ignore[assignment]
+
+            # Port state from old root logger to new root logger
+            # (also reconnects child loggers internally)
+            #
+            # Smart port_level handling:
+            # - If root was instantiated: port its level (respect existing config)
+            # - If root is fresh (never accessed): use determineLogLevel() for defaults
+            # This allows users to register defaults and have them apply when the
+            # root logger hasn't been touched yet, while respecting user-configured
+            # root loggers accessed before extendLoggingModule() was called.
+            effective_port_level = port_level
+            if port_level is None and not root_was_instantiated:
+                # Root was never instantiated - use defaults, not port_level=True
+                # This makes determineLogLevel() apply via _setApatheticDefaults()
+                effective_port_level = False
+
+            _logging_utils.portLoggerState(
+                root_logger,
+                new_root_logger,
+                port_handlers=port_handlers,
+                port_level=effective_port_level,
+            )
+
+        # If already extended, skip returning early
+        if already_extended:
+            return False
+        cls._logging_module_extended = True
+
+        return True
+
+    @classmethod
+    def ensureRootLogger(
+        cls,
+        *,
+        logger_class: type[logging.Logger] | None = None,
+        always_replace: bool = False,
+        accept_subclass: bool = True,
+    ) -> None:
+        """Ensure the root logger is of the specified type.
+
+        This function allows applications to explicitly set what the root logger
+        should be. After calling this function, the root logger will not be
+        replaced by subsequent calls to extendLoggingModule().
+
+        Args:
+            logger_class: The desired logger class for the root logger. If None
+                (default), uses the current default logger class
+                (logging.getLoggerClass()). If specified, the root logger will be
+                created/replaced to be an instance of this class.
+            always_replace: If True, always replace the root logger even if it's
+                already the correct type or a subclass. If False (default), respects
+                existing root logger if it's already the desired type or a subclass
+                (when accept_subclass=True). This parameter is mainly for forcing
+                a fresh creation of the root logger.
+            accept_subclass: If True (default), considers a root logger that is a
+                subclass of `logger_class` as acceptable (no replacement needed).
+                If False, only exact type match is considered acceptable. This
+                affects the behavior when always_replace=False.
+
+        Example:
+            # Ensure root logger is the default apathetic logger
+            apathetic_logging.Logger.ensureRootLogger()
+
+            # Ensure root logger is a custom logger class
+            class MyLogger(apathetic_logging.Logger):
+                pass
+
+            apathetic_logging.Logger.ensureRootLogger(logger_class=MyLogger)
+
+        Note:
+            This function sets a module-level flag (_root_logger_user_configured)
+            indicating the user has **explicitly** configured the root logger. This
+            flag represents user **intent** and is distinct from whether the root
+            logger has been **instantiated** (see isRootLoggerInstantiated()).
+
+            The difference is critical:
+            - isRootLoggerInstantiated(): Queries current registry state. Returns
+              True if ANY code (user, library, stdlib) has accessed the root logger.
+            - _root_logger_user_configured flag: Tracks user intent. Only set if
+              the user explicitly called ensureRootLogger(). This flag persists
+              even if the root logger is later removed, ensuring user configuration
+              is always respected.
+
+            Subsequent calls to extendLoggingModule() check this flag to decide
+            whether to replace the root logger. If the flag is set,
+            extendLoggingModule() will not touch the root logger, respecting the
+            user's explicit choice.
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        # If logger_class is None, use the current default logger class
+        if logger_class is None:
+            logger_class = logging.getLoggerClass()
+
+        # Get current root logger
+        root_logger = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+        # Determine if we should replace
+        should_replace = always_replace
+        if not should_replace:
+            # Smart mode: only replace if root is not the desired type
+            if accept_subclass:
+                # Accept exact match or subclass
+                should_replace = not isinstance(root_logger, logger_class)
+            else:
+                # Require exact match
+                should_replace = type(root_logger) is not logger_class
+
+        if should_replace:
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+            # Remove old root logger from registry
+            _logging_utils.removeLogger(_constants.ROOT_LOGGER_KEY)
+
+            # Clear logging.root
+            if hasattr(logging, "root"):
+                logging.root = None  # type: ignore[assignment]
+
+            # Set the logger class before getting the root logger
+            # This ensures the manager creates the root logger with the correct class
+            logging.setLoggerClass(logger_class)
+
+            # Create new root logger using the manager's getLogger method
+            # The logger class is already set above, so this will create a logger
+            # of type logger_class. We use the manager directly because it handles
+            # root logger creation properly even when logging.root is None.
+            new_root_logger = logging.Logger.manager.getLogger(
+                _constants.ROOT_LOGGER_KEY
+            )
+
+            # Ensure root logger has correct name
+            if new_root_logger.name != _constants.ROOT_LOGGER_NAME:
+                new_root_logger.name = _constants.ROOT_LOGGER_NAME
+
+            # Update logging.root
+            if hasattr(logging, "root"):
+                logging.root = new_root_logger  # type: ignore[assignment]
+
+            # Also update logging.Logger.manager.root to point to new root logger
+            # The manager's root must stay in sync with logging.root, otherwise
+            # they reference different objects and child loggers may have incorrect
+            # parent references.
+            logging.Logger.manager.root = new_root_logger  # type: ignore[assignment]
+
+            # Port state from old root logger to new one
+            _logging_utils.portLoggerState(
+                root_logger,
+                new_root_logger,
+                port_handlers=True,
+                port_level=True,
+            )
+
+        # Mark that user has explicitly configured the root logger
+        # This tells extendLoggingModule() not to touch the root logger
+        #
+        # IMPORTANT: This flag represents USER INTENT, not current state. It is
+        # distinct from isRootLoggerInstantiated() which queries the registry:
+        # - _root_logger_user_configured: "Did user call ensureRootLogger()?"
+        #   * Only set by ensureRootLogger()
+        #   * Sticky: persists even if root logger is removed
+        #   * Used to prevent extendLoggingModule() from touching the root logger
+        # - isRootLoggerInstantiated(): "Does a root logger currently exist?"
+        #   * Returns True if ANY code (user/library/stdlib) accessed root logger
+        #   * Dynamic: can change if root logger is removed
+        #   * Used to determine if we should port state or apply defaults
+        #
+        # Set on both the logger module (package mode) and apathetic_logging module
+        # (stitched mode). This ensures the flag is accessible in all runtime modes.
+        # Also set on the shim module (apathetic_logging.logger) if it exists, as
+        # serger creates separate module objects for submodule shims in stitched mode.
+        logger_module = sys.modules.get(__name__)
+        if logger_module is not None:
+            logger_module._root_logger_user_configured = True  # type: ignore[attr-defined]  # noqa: SLF001
+        namespace_module = sys.modules.get("apathetic_logging")
+        if namespace_module is not None:
+            namespace_module._root_logger_user_configured = True  # type: ignore[attr-defined]  # noqa: SLF001
+        # Also set on the shim module for stitched mode compatibility
+        logger_shim_module = sys.modules.get("apathetic_logging.logger")
+        if logger_shim_module is not None:
+            logger_shim_module._root_logger_user_configured = True  # type: ignore[attr-defined]  # noqa: SLF001
+
+    def determineLogLevel(
+        self,
+        *,
+        args: argparse.Namespace | None = None,
+        root_log_level: str | None = None,
+    ) -> str:
+        """Resolve log level from CLI → env → root config → default."""
+        _registry = ApatheticLogging_Internal_RegistryData
+        _constants = ApatheticLogging_Internal_Constants
+        args_level = getattr(args, "log_level", None)
+        if args_level is not None:
+            # cast_hint would cause circular dependency
+            return cast("str", args_level).upper()
+
+        # Check registered environment variables, or fall back to "LOG_LEVEL"
+        # Access registry via namespace class MRO to ensure correct resolution
+        # in both package and stitched builds
+        namespace_module = sys.modules.get("apathetic_logging")
+        if namespace_module is not None:
+            namespace_class = getattr(namespace_module, "apathetic_logging", None)
+            if namespace_class is not None:
+                # Use namespace class MRO to access registry
+                # (handles shadowed attributes correctly)
+                registered_env_vars = getattr(
+                    namespace_class,
+                    "registered_internal_log_level_env_vars",
+                    None,
+                )
+                registered_default = getattr(
+                    namespace_class,
+                    "registered_internal_default_log_level",
+                    None,
+                )
+            else:
+                # Fallback to direct registry access
+                registry_cls = _registry
+                registered_env_vars = (
+                    registry_cls.registered_internal_log_level_env_vars
+                )
+                registered_default = registry_cls.registered_internal_default_log_level
+        else:
+            # Fallback to direct registry access
+            registered_env_vars = _registry.registered_internal_log_level_env_vars
+            registered_default = _registry.registered_internal_default_log_level
+
+        env_vars_to_check = (
+            registered_env_vars or _constants.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
+        )
+        for env_var in env_vars_to_check:
+            env_log_level = os.getenv(env_var)
+            if env_log_level:
+                return env_log_level.upper()
+
+        if root_log_level:
+            return root_log_level.upper()
+
+        # Use registered default, or fall back to module default
+        default_level: str = (
+            registered_default or _constants.DEFAULT_APATHETIC_LOG_LEVEL
+        )
+        return default_level.upper()
+
+    @property
+    def levelName(self) -> str:
+        """Return the explicit level name set on this logger.
+
+        This property returns the name of the level explicitly set on this logger
+        (via self.level). For the effective level name (what's actually used,
+        considering inheritance), use effectiveLevelName instead.
+
+        See also: logging.getLevelName, effectiveLevelName
+        """
+        return self.getLevelName()
+
+    @property
+    def effectiveLevel(self) -> int:
+        """Return the effective level (what's actually used).
+
+        This property returns the effective logging level for this logger,
+        considering inheritance from parent loggers. This is the preferred
+        way to get the effective level. Also available via getEffectiveLevel()
+        for stdlib compatibility.
+
+        See also: logging.Logger.getEffectiveLevel, effectiveLevelName
+        """
+        return self.getEffectiveLevel()
+
+    @property
+    def effectiveLevelName(self) -> str:
+        """Return the effective level name (what's actually used).
+
+        This property returns the name of the effective logging level for this
+        logger, considering inheritance from parent loggers. This is the
+        preferred way to get the effective level name. Also available via
+        getEffectiveLevelName() for consistency.
+
+        See also: logging.getLevelName, effectiveLevel
+        """
+        return self.getEffectiveLevelName()
+
+    @property
+    def root(self) -> "ApatheticLogging_Internal_Logger.Logger" | logging.RootLogger:  # type: ignore[override, name-defined]  # noqa: UP037
+        """Return the root logger instance.
+
+        This property overrides the standard library's ``logging.Logger.root``
+        class attribute to provide better type hints. It returns the same root
+        logger instance as the standard library.
+
+        The root logger may be either:
+        - An ``apathetic_logging.Logger`` if it was created after
+          ``extendLoggingModule()`` was called (expected/common case)
+        - A standard ``logging.RootLogger`` if it was created before
+          ``extendLoggingModule()`` was called (fallback, see ROADMAP.md)
+
+        Returns:
+            The root logger instance (either ``apathetic_logging.Logger`` or
+            ``logging.RootLogger``).
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> # Access root logger with better type hints
+            >>> logger.root.setLevel("debug")
+            >>> logger.root.levelName
+            'DEBUG'
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        return logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+    def getLevel(self) -> int:
+        """Return the explicit level set on this logger.
+
+        This method returns the level explicitly set on this logger (via
+        self.level). For the effective level (what's actually used, considering
+        inheritance), use getEffectiveLevel() or the effectiveLevel property.
+
+        Returns:
+            The explicit level value (int) set on this logger.
+
+        See also: level property, getEffectiveLevel
+
+        """
+        return self.level
+
+    def getLevelName(self) -> str:
+        """Return the explicit level name set on this logger.
+
+        This method returns the name of the level explicitly set on this logger
+        (via self.level). For the effective level name (what's actually used,
+        considering inheritance), use getEffectiveLevelName() or the
+        effectiveLevelName property.
+
+        Returns:
+            The explicit level name (str) set on this logger.
+
+        See also: levelName property, getEffectiveLevelName
+
+        """
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(self.level)
+
+    def getEffectiveLevelName(self) -> str:
+        """Return the effective level name (what's actually used).
+
+        This method returns the name of the effective logging level for this
+        logger, considering inheritance from parent loggers. Prefer the
+        effectiveLevelName property for convenience, or use this method for
+        consistency with getEffectiveLevel().
+
+        Returns:
+            The effective level name (str) for this logger.
+
+        See also: effectiveLevelName property, getEffectiveLevel
+
+        """
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(
+            self.getEffectiveLevel(),
+        )
+
+    def errorIfNotDebug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Logs an exception with the real traceback starting from the caller.
+        Only shows full traceback if debug/trace is enabled.
+        """
+        exc_info = kwargs.pop("exc_info", True)
+        stacklevel = kwargs.pop("stacklevel", self.DEFAULT_STACKLEVEL)
+        if self.isEnabledFor(logging.DEBUG):
+            self.exception(
+                msg,
+                *args,
+                exc_info=exc_info,
+                stacklevel=stacklevel,
+                **kwargs,
+            )
+        else:
+            self.error(msg, *args, **kwargs)
+
+    def criticalIfNotDebug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Logs an exception with the real traceback starting from the caller.
+        Only shows full traceback if debug/trace is enabled.
+        """
+        exc_info = kwargs.pop("exc_info", True)
+        stacklevel = kwargs.pop("stacklevel", self.DEFAULT_STACKLEVEL)
+        if self.isEnabledFor(logging.DEBUG):
+            self.exception(
+                msg,
+                *args,
+                exc_info=exc_info,
+                stacklevel=stacklevel,
+                **kwargs,
+            )
+        else:
+            self.critical(msg, *args, **kwargs)
+
+    def colorize(
+        self,
+        text: str,
+        color: str,
+        *,
+        enable_color: bool | None = None,
+    ) -> str:
+        """Apply ANSI color codes to text.
+
+        Defaults to using the instance's enable_color setting.
+
+        Args:
+            text: Text to colorize
+            color: ANSI color code
+            enable_color: Override color setting, or None to use instance default
+
+        Returns:
+            Colorized text if enabled, otherwise original text
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        if enable_color is None:
+            enable_color = self.enable_color
+        return f"{color}{text}{_constants.ANSIColors.RESET}" if enable_color else text
+
+    def trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a trace-level message (more verbose than DEBUG)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.TRACE_LEVEL):
+            self._log(_constants.TRACE_LEVEL, msg, args, **kwargs)
+
+    def detail(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a detail-level message (more detailed than INFO)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.DETAIL_LEVEL):
+            self._log(
+                _constants.DETAIL_LEVEL,
+                msg,
+                args,
+                **kwargs,
+            )
+
+    def brief(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a brief-level message (less detailed than INFO)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.BRIEF_LEVEL):
+            self._log(
+                _constants.BRIEF_LEVEL,
+                msg,
+                args,
+                **kwargs,
+            )
+
+    def test(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a test-level message (most verbose, bypasses capture)."""
+        _constants = ApatheticLogging_Internal_Constants
+        if self.isEnabledFor(_constants.TEST_LEVEL):
+            self._log(_constants.TEST_LEVEL, msg, args, **kwargs)
+
+    def logDynamic(self, level: str | int, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with a dynamically provided log level
+           (unlike .info(), .error(), etc.).
+
+        Useful when you have a log level (string or numeric) and don't want to resolve
+        either the string to int, or the int to a log method.
+
+        Args:
+            level: Log level as string name or integer
+            msg: Message format string
+            *args: Arguments for message formatting
+            **kwargs: Additional keyword arguments
+
+        """
+        # Resolve level
+        if isinstance(level, str):
+            try:
+                level_no = ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+            except ValueError:
+                self.error("Unknown log level: %r", level)
+                return
+        elif isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            level_no = level
+        else:
+            self.error("Invalid log level type: %r", type(level))
+            return
+
+        # Same guard as the level methods, so filtered messages skip _log()
+        # (and its handler management) entirely
+        if self.isEnabledFor(level_no):
+            self._log(level_no, msg, args, **kwargs)
+
+    @contextmanager
+    def useLevel(
+        self,
+        level: str | int,
+        *,
+        minimum: bool = False,
+    ) -> Generator[None, None, None]:
+        """Use a context to temporarily log with a different log-level.
+
+        Args:
+            level: Log level to use (string name or numeric value)
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current effective level. This prevents
+                downgrading from a more verbose level (e.g., TRACE) to a less
+                verbose one (e.g., DEBUG). Compares against effective level
+                (considering parent inheritance), matching setLevel(minimum=True)
+                behavior. Defaults to False.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        """
+        # Save explicit level for restoration (not effective level)
+        prev_level = self.level
+
+        # Resolve level
+        if isinstance(level, str):
+            try:
+                level_no = ApatheticLogging_Internal_LoggingUtils.getLevelNumber(level)
+            except ValueError:
+                self.error("Unknown log level: %r", level)
+                # Yield control anyway so the 'with' block doesn't explode
+                yield
+                return
+        elif isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            level_no = level
+        else:
+            self.error("Invalid log level type: %r", type(level))
+            yield
+            return
+
+        # Apply new level (only if more verbose when minimum=True)
+        if minimum:
+            # Compare against effective level (not explicit level) to match
+            # setLevel(minimum=True) behavior. This ensures consistent behavior
+            # when logger inherits level from parent.
+            current_effective_level = self.getEffectiveLevel()
+            # Lower number = more verbose, so only set if new level is more verbose
+            if level_no < current_effective_level:
+                self.setLevel(level_no)
+            # Otherwise keep current level (don't downgrade)
+        else:
+            self.setLevel(level_no)
+
+        try:
+            yield
+        finally:
+            self.setLevel(prev_level)
+
+    @contextmanager
+    def useLevelMinimum(self, level: str | int) -> Generator[None, None, None]:
+        """Use a context to temporarily log with a different log-level.
+
+        Only applies if the level is more verbose than the current level.
+
+        This convenience context manager is equivalent to calling
+        ``useLevel(level, minimum=True)``. It temporarily sets the logger level
+        only if the requested level is more verbose (lower numeric value) than
+        the current effective level, preventing downgrades from more verbose
+        levels.
+
+        Args:
+            level: Log level to use (string name or numeric value). Only applied
+                if it's more verbose than the current effective level.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> logger.setLevel("TRACE")
+            >>> # This won't downgrade from TRACE to DEBUG
+            >>> with logger.useLevelMinimum("DEBUG"):
+            ...     assert logger.levelName == "TRACE"  # Still TRACE
+            >>> # This will upgrade from INFO to DEBUG
+            >>> logger.setLevel("INFO")
+            >>> with logger.useLevelMinimum("DEBUG"):
+            ...     assert logger.levelName == "DEBUG"  # Upgraded to DEBUG
+
+        """
+        with self.useLevel(level, minimum=True):
+            yield
+
+    @contextmanager
+    def usePropagate(
+        self,
+        propagate: bool,  # noqa: FBT001
+        *,
+        manage_handlers: bool | None = None,
+    ) -> Generator[None, None, None]:
+        """Use a context to temporarily change propagate setting.
+
+        Args:
+            propagate: If True, messages propagate to parent loggers. If False,
+                messages only go to this logger's handlers.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        """
+        # Save current propagate setting for restoration
+        prev_propagate = self.propagate
+
+        # Apply new propagate setting
+        self.setPropagate(propagate, manage_handlers=manage_handlers)
+
+        try:
+            yield
+        finally:
+            # Restore previous propagate setting
+            self.setPropagate(prev_propagate, manage_handlers=manage_handlers)
+
+    @contextmanager
+    def useLevelAndPropagate(
+        self,
+        level: str | int,
+        *,
+        minimum: bool = False,
+        manage_handlers: bool | None = None,
+    ) -> Generator[None, None, None]:
+        """Use a context to temporarily set level and propagate together.
+
+        This convenience context manager combines useLevel() and usePropagate()
+        with intelligent defaults:
+        - If level is INHERIT_LEVEL (NOTSET): sets propagate=True
+        - If level is a specific level: sets propagate=False
+        - On root logger: only sets level (propagate is unchanged)
+
+        Both settings are restored when the context exits.
+
+        Args:
+            level: Log level to use (string name or numeric value). Use
+                INHERIT_LEVEL (0) or "NOTSET" to inherit.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current effective level. This prevents
+                downgrading from a more verbose level (e.g., TRACE) to a less
+                verbose one (e.g., DEBUG). Compares against effective level
+                (considering parent inheritance), matching setLevel(minimum=True)
+                behavior. Defaults to False.
+            manage_handlers: If True, automatically manage apathetic handlers
+                based on propagate setting. If None, uses DEFAULT_MANAGE_HANDLERS
+                from constants. If False, only sets propagate without managing handlers.
+                In compat_mode, this may default to False.
+
+        Yields:
+            None: Context manager yields control to the with block
+
+        Example:
+            >>> logger = getLogger("mymodule")
+            >>> # Temporarily inherit level and propagate
+            >>> with logger.useLevelAndPropagate(INHERIT_LEVEL):
+            ...     logger.info("This propagates to root")
+            >>> # Temporarily set explicit level with isolated logging
+            >>> with logger.useLevelAndPropagate("debug"):
+            ...     logger.debug("This only goes to logger's handlers")
+
+        """
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Save current settings for restoration
+        prev_level = self.level
+        prev_propagate = self.propagate
+
+        # Resolve level
+        if isinstance(level, str):
+            _logging_utils = ApatheticLogging_Internal_LoggingUtils
+            try:
+                level_no = _logging_utils.getLevelNumber(level)
+            except ValueError:
+                self.error("Unknown log level: %r", level)
+                # Yield control anyway so the 'with' block doesn't explode
+                yield
+                return
+        elif isinstance(level, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+            level_no = level
+        else:
+            self.error("Invalid log level type: %r", type(level))
+            yield
+            return
+
+        # Apply new level (only if more verbose when minimum=True)
+        if minimum:
+            # Compare against effective level (not explicit level) to match
+            # setLevel(minimum=True) behavior. This ensures consistent behavior
+            # when logger inherits level from parent.
+            current_effective_level = self.getEffectiveLevel()
+            # Lower number = more verbose, so only set if new level is more verbose
+            if level_no < current_effective_level:
+                self.setLevel(level_no)
+            # Otherwise keep current level (don't downgrade)
+        else:
+            self.setLevel(level_no)
+
+        # Set propagate based on level (only if not root logger)
+        # Root logger can have name "" (ROOT_LOGGER_KEY) or "root" (ROOT_LOGGER_NAME)
+        is_root = self.name in {
+            _constants.ROOT_LOGGER_KEY,
+            _constants.ROOT_LOGGER_NAME,
+        }
+        if not is_root:
+            if level_no == _constants.INHERIT_LEVEL:
+                # INHERIT_LEVEL -> propagate=True
+                self.setPropagate(True, manage_handlers=manage_handlers)
+            else:
+                # Specific level -> propagate=False
+                self.setPropagate(False, manage_handlers=manage_handlers)
+        # Root logger: propagate is unchanged (root always has handlers)
+
+        try:
+            yield
+        finally:
+            # Restore previous settings
+            self.setLevel(prev_level)
+            if not is_root:
+                self.setPropagate(prev_propagate, manage_handlers=manage_handlers)
+
+
+# === apathetic_logging.logger_namespace ===
+# src/apathetic_logging/logger_namespace.py
+"""Logger namespace mixin that provides the Logger nested class.
+
+See https://docs.python.org/3/library/logging.html#logging.Logger for the
+complete list of standard library Logger methods.
+
+Docstrings are adapted from the standard library logging.Logger documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_Logger:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the Logger nested class.
+
+    This class contains the Logger implementation as a nested class, using
+    the core Logger implementation.
+
+    When mixed into apathetic_logging, it provides apathetic_logging.Logger.
+    """
+
+    class Logger(
+        ApatheticLogging_Internal_LoggerCore,
+    ):
+        """Logger for all Apathetic tools.
+
+        This Logger class is composed from:
+        - Core Logger implementation
+          (ApatheticLogging_Internal_LoggerCore, which inherits from logging.Logger)
+        """
+
+
+# === apathetic_logging.get_logger ===
+# src/apathetic_logging/get_logger.py
+"""GetLogger functionality for Apathetic Logging.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+class ApatheticLogging_Internal_GetLogger:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides the getLogger static method.
+
+    This class contains the getLogger implementation as a static method.
+    When mixed into apathetic_logging, it provides apathetic_logging.getLogger.
+    """
+
+    _LoggerType = TypeVar("_LoggerType", bound=logging.Logger)
+
+    @staticmethod
+    def _setLoggerClassTemporarily(
+        klass: type[ApatheticLogging_Internal_GetLogger._LoggerType],
+        name: str,
+    ) -> ApatheticLogging_Internal_GetLogger._LoggerType:
+        """Temporarily set the logger class, get/create a logger, then restore.
+
+        This is an internal helper function used by getLoggerOfType to create
+        a logger of a specific type when one doesn't already exist. It temporarily
+        sets the logger class to the desired type, gets or creates the logger,
+        then restores the original logger class.
+
+        This function is mostly for internal use by the library. If you need
+        a logger of a specific type, use getLoggerOfType instead, which provides
+        all the conveniences (name inference, registry checking, etc.).
+
+        Args:
+            klass (logger class): The desired logger class type.
+            name: The name of the logger to get.
+
+        Returns:
+            A logger instance of the specified type.
+        """
+        # stdlib unwrapped
+        original_class = logging.getLoggerClass()
+        logging.setLoggerClass(klass)
+        # avoid circular dependency by using logging.getLogger directly
+        logger = logging.getLogger(name)
+        logging.setLoggerClass(original_class)
+        typed_logger = cast("ApatheticLogging_Internal_GetLogger._LoggerType", logger)
+        return typed_logger
+
+    @staticmethod
+    def _getOrCreateLoggerOfType(
+        register_name: str,
+        class_type: type[ApatheticLogging_Internal_GetLogger._LoggerType],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ApatheticLogging_Internal_GetLogger._LoggerType:
+        """Get or create a logger of the specified type.
+
+        Checks if a logger with the given name exists. If it exists but is not
+        of the correct type, removes it and creates a new one. If it doesn't
+        exist, creates a new logger of the specified type.
+
+        Args:
+            register_name: The name of the logger to get or create.
+            class_type: The logger class type to use.
+            *args: Additional positional arguments to pass to logging.getLogger.
+            **kwargs: Additional keyword arguments to pass to logging.getLogger.
+
+        Returns:
+            A logger instance of the specified type.
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        logger: logging.Logger | None = None
+        old_logger: logging.Logger | None = None
+        registered = _logging_utils.hasLogger(register_name)
+        if registered:
+            logger = logging.getLogger(register_name, *args, **kwargs)
+            if not isinstance(logger, class_type):
+                # Save reference to old logger before removing it
+                old_logger = logger
+                _logging_utils.removeLogger(register_name)
+                registered = False
+        if not registered:  # may have changed above
+            # Save the parent that Python's logging module assigned before creating
+            # logger. This is important because when we create a new logger, Python's
+            # logging module might assign it a parent (e.g., old root logger or
+            # intermediate logger)
+
+            _constants = ApatheticLogging_Internal_Constants
+
+            # Get the parent that would be assigned by Python's logging module
+            # We do this by temporarily creating the logger to see what parent it gets
+            # But we can't do that without side effects, so we'll check after creation
+            logger = ApatheticLogging_Internal_GetLogger._setLoggerClassTemporarily(
+                class_type, register_name
+            )
+
+            # Save the parent that was assigned
+            old_parent = logger.parent
+
+            # Port state from old logger if we replaced an existing logger
+            # (also reconnects child loggers internally)
+            if old_logger is not None:
+                # Port state from old logger, but user-provided kwargs take precedence
+                # Check if level is explicitly provided in kwargs - if so, don't port
+                # level (user's level will be applied later in getLoggerOfType)
+                user_provided_level = kwargs.get("level")
+                # Only port if user didn't provide level
+                port_level = user_provided_level is None
+                _logging_utils.portLoggerState(
+                    old_logger,
+                    logger,
+                    port_handlers=None,  # Use default (True) - port handlers
+                    port_level=port_level,  # Port level only if user didn't provide one
+                )
+
+            # Fix parent if it points to old root logger
+            # Only fix if this is not the root logger itself
+            if logger.name not in {
+                _constants.ROOT_LOGGER_KEY,
+                _constants.ROOT_LOGGER_NAME,
+            }:
+                # Check if old parent was the old root logger (has no parent itself)
+                # Root logger is the only logger that has no parent
+                if old_parent is not None:
+                    # Check if old_parent might be the old root logger
+                    # Root logger has no parent, and its name is "" or "root"
+                    old_parent_might_be_old_root = (
+                        old_parent.name
+                        in {
+                            _constants.ROOT_LOGGER_KEY,
+                            _constants.ROOT_LOGGER_NAME,
+                        }
+                        and old_parent.parent is None
+                    )
+
+                    if old_parent_might_be_old_root:
+                        # Get current root logger to check if it's different
+                        # Only call logging.getLogger() when we actually need to fix
+                        current_root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+                        if old_parent is not current_root:
+                            # Old parent was the old root logger - set to new root
+                            logger.parent = current_root
+                    # else: old parent was an intermediate logger - keep it
+                    # (preserve hierarchy)
+                else:
+                    # No old parent (shouldn't happen for non-root loggers, but be safe)
+                    # Get current root logger and set as parent
+                    current_root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+                    logger.parent = current_root
+
+        typed_logger = cast("ApatheticLogging_Internal_GetLogger._LoggerType", logger)
+        return typed_logger
+
+    @staticmethod
+    def _applyPropagateSetting(logger: logging.Logger) -> None:
+        """Apply propagate setting to a logger from registry or default.
+
+        This method implements the second phase of the two-phase propagate
+        initialization pattern. It is called automatically by getLoggerOfType()
+        after logger creation.
+
+        **Contract with Logger.__init__:** Only applies the registry/default
+        propagate value if the logger's _propagate_explicit flag is False,
+        indicating that the user did not explicitly provide a propagate value
+        in Logger.__init__(). This ensures that explicit user settings take
+        precedence over registry/default values.
+
+        If the logger does not have setPropagate() (e.g., standard logging.Logger),
+        the propagate attribute is set directly.
+
+        Args:
+            logger: The logger instance to apply the propagate setting to.
+        """
+        # Only set if not already explicitly set in __init__
+        if not getattr(logger, "_propagate_explicit", False):
+            # Use getDefaultPropagate() to resolve registry/default value
+            propagate_value = ApatheticLogging_Internal_Registry.getDefaultPropagate()
+
+            # Use setPropagate if available (apathetic logger), otherwise set directly
+            if hasattr(logger, "setPropagate"):
+                logger.setPropagate(propagate_value)  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+            else:
+                logger.propagate = propagate_value
+
+    @staticmethod
+    def getLogger(
+        name: str | None = None,
+        *args: Any,
+        level: str | int | None = None,
+        minimum: bool | None = None,
+        extend: bool | None = None,
+        replace_root: bool | None = None,
+        **kwargs: Any,
+    ) -> ApatheticLogging_Internal_Logger.Logger:
+        """Return a logger with the specified name, creating it if necessary.
+
+        Changes:
+        - When name is None, infers the name automatically from
+          the calling module's __package__ attribute by examining the call stack
+          (using skip_frames=2 to correctly identify the caller)
+          instead of returning the root logger.
+        - When name is an empty string (""), returns the root logger
+          as usual, matching standard library behavior.
+        - Returns an apathetic_logging.Logger instance instead of
+          the standard logging.Logger.
+
+        Args:
+            name: The name of the logger to get. If None, the logger name
+                will be auto-inferred from the calling module's __package__.
+                If an empty string (""), returns the root logger.
+            *args: Additional positional arguments (for future-proofing)
+            level: Log level to set on the logger. Accepts both string
+                names (case-insensitive) and numeric values. Level 0 or
+                INHERIT_LEVEL (i.e. NOTSET) allows inheritance from parent logger.
+                - If not provided: defaults to INHERIT_LEVEL (inherits from root)
+                - If None: auto-resolves via determineLogLevel()
+                - If provided (str/int): sets the logger's level to this value
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). If None, defaults to False. Only used when
+                `level` is provided.
+            extend: If True (default), extend the logging module.
+            replace_root: Whether to replace the root logger if it's not the correct
+                type. If None (default), uses registry setting or constant default.
+                Only used when extend=True.
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            A logger of type ApatheticLogging_Internal_Logger.Logger.
+
+        Wrapper for logging.getLogger.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogger
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        skip_frames = 2
+        result = _get_logger.getLoggerOfType(
+            name,
+            _logger.Logger,
+            skip_frames,
+            *args,
+            level=level,
+            minimum=minimum,
+            extend=extend,
+            replace_root=replace_root,
+            **kwargs,
+        )
+        return cast("ApatheticLogging_Internal_Logger.Logger", result)  # type: ignore[redundant-cast]
+
+    @staticmethod
+    def getLoggerOfType(
+        name: str | None,
+        class_type: type[ApatheticLogging_Internal_GetLogger._LoggerType],
+        skip_frames: int = 1,
+        *args: Any,
+        level: str | int | None = None,
+        minimum: bool | None = None,
+        extend: bool | None = True,
+        replace_root: bool | None = None,
+        **kwargs: Any,
+    ) -> ApatheticLogging_Internal_GetLogger._LoggerType:
+        """Get a logger of the specified type, creating it if necessary.
+
+        Changes:
+        - When name is None, infers the name automatically from
+          the calling module's __package__ attribute by examining the call stack
+          (using skip_frames to correctly identify the caller)
+          instead of returning the root logger.
+        - When name is an empty string (""), returns the root logger
+          as usual, matching standard library behavior.
+        - Returns a class_type instance instead of
+          the standard logging.Logger.
+
+        Args:
+            name: The name of the logger to get. If None, the logger name
+                will be auto-inferred from the calling module's __package__.
+                If an empty string (""), returns the root logger.
+            class_type: The logger class type to use.
+            skip_frames: Number of frames to skip when inferring logger name.
+                Prefer using as a keyword argument (e.g., skip_frames=2) for clarity.
+            *args: Additional positional arguments (for future-proofing)
+            level: Exact log level to set on the logger. Accepts both string
+                names (case-insensitive) and numeric values. Level 0 or
+                INHERIT_LEVEL (i.e. NOTSET) allows inheritance from parent
+                logger. If provided, sets the logger's level to this value.
+                Defaults to None.
+            minimum: If True, only set the level if it's more verbose (lower
+                numeric value) than the current level. This prevents downgrading
+                from a more verbose level (e.g., TRACE) to a less verbose one
+                (e.g., DEBUG). If None, defaults to False. Only used when
+                `level` is provided.
+            extend: If True (default), extend the logging module.
+            replace_root: Whether to replace the root logger if it's not the correct
+                type. If None (default), uses registry setting or constant default.
+                Only used when extend=True.
+            **kwargs: Additional keyword arguments (for future-proofing)
+
+        Returns:
+            A logger instance of the specified type.
+
+        Wrapper for logging.getLogger.
+
+        https://docs.python.org/3.10/library/logging.html#logging.getLogger
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Check compatibility mode for getLogger(None) behavior
+
+        _registry_data = ApatheticLogging_Internal_RegistryData
+        compatibility_mode = (
+            _registry_data.registered_internal_compatibility_mode
+            if _registry_data.registered_internal_compatibility_mode is not None
+            else False
+        )
+
+        # In compatibility mode, getLogger(None) returns root logger (stdlib behavior)
+        if name is None and compatibility_mode:
+            register_name: str = ApatheticLogging_Internal_Constants.ROOT_LOGGER_KEY
+        else:
+            # Resolve logger name (with inference if needed)
+            # Note: Empty string ("") is a special case - getDefaultLoggerName
+            # returns it as-is (root logger, matching stdlib behavior). This is
+            # handled by the
+            # early return in getDefaultLoggerName when logger_name is not None.
+            # skip_frames+1 because: getLoggerOfType -> getDefaultLoggerName -> caller
+            # check_registry=True because getLogger() should use a previously registered
+            # name if available, which is the expected behavior for "get" operations.
+            # raise_on_error=True because getLogger() requires a logger name.
+            # infer=True and register=True - getLogger() infers and stores (matches old
+            # resolveLoggerName behavior where inferred names were automatically stored)
+            register_name_raw = _logging_utils.getDefaultLoggerName(
+                name,
+                check_registry=True,
+                skip_frames=skip_frames + 1,
+                raise_on_error=True,
+                infer=True,
+                register=True,
+            )
+            # With raise_on_error=True, register_name is guaranteed to be str, not None
+            register_name = register_name_raw  # type: ignore[assignment]
+
+        # extend logging module
+        if extend and hasattr(class_type, "extendLoggingModule"):
+            class_type.extendLoggingModule(replace_root=replace_root)  # type: ignore[attr-defined]
+
+        # Get or create logger of the correct type
+        logger = ApatheticLogging_Internal_GetLogger._getOrCreateLoggerOfType(
+            register_name, class_type, *args, **kwargs
+        )
+
+        # Apply log level settings
+        if level is not None:
+            logger.setLevel(
+                level,
+                minimum=minimum,  # type: ignore[call-arg]  # pyright: ignore[reportCallIssue]
+            )
+
+        # Apply propagate setting from registry or default
+        ApatheticLogging_Internal_GetLogger._applyPropagateSetting(logger)
+
+        return logger
+
+
+# === apathetic_logging.logging_levels ===
+# src/apathetic_logging/logging_levels.py
+"""Custom log level functions for Apathetic Logging.
+
+This module provides convenience functions for custom log levels (TEST, TRACE, DETAIL,
+BRIEF) that don't exist in the standard library. These functions log
+to the root logger and ensure the logging module is extended with custom levels.
+"""
+
+
+class ApatheticLogging_Internal_LoggingLevels:  # noqa: N801  # pyright: ignore[reportUnusedClass]
+    """Mixin class that provides custom log level functions.
+
+    This class contains convenience functions for custom log levels that don't
+    exist in the standard library. These functions log to the root logger and
+    ensure the logging module is extended with custom levels.
+
+    When mixed into apathetic_logging, it provides functions for TEST, TRACE, DETAIL,
+    and BRIEF log levels.
+    """
+
+    @staticmethod
+    def trace(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'TRACE' on the root logger.
+
+        TRACE is more verbose than DEBUG. If the logger has no handlers,
+        call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its trace() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has trace method (it should if it's an apathetic logger)
+        if hasattr(logger, "trace"):
+            logger.trace(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        # This can happen if root logger was created before extendLoggingModule
+        elif logger.isEnabledFor(_constants.TRACE_LEVEL):
+            logger._log(_constants.TRACE_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    @staticmethod
+    def detail(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'DETAIL' on the root logger.
+
+        DETAIL is more detailed than INFO. If the logger has no handlers,
+        call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its detail() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has detail method (it should if it's an apathetic logger)
+        if hasattr(logger, "detail"):
+            logger.detail(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        elif logger.isEnabledFor(_constants.DETAIL_LEVEL):
+            logger._log(_constants.DETAIL_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    @staticmethod
+    def brief(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'BRIEF' on the root logger.
+
+        BRIEF is less detailed than INFO. If the logger has no handlers,
+        call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its brief() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has brief method (it should if it's an apathetic logger)
+        if hasattr(logger, "brief"):
+            logger.brief(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        elif logger.isEnabledFor(_constants.BRIEF_LEVEL):
+            logger._log(_constants.BRIEF_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    @staticmethod
+    def test(msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message with severity 'TEST' on the root logger.
+
+        TEST is the most verbose level and bypasses capture. If the logger has no
+        handlers, call basicConfig() to add a console handler with a pre-defined format.
+
+        This function gets an apathetic_logging.Logger instance (ensuring
+        the root logger is an apathetic logger) and calls its test() method.
+        """
+        _get_logger = ApatheticLogging_Internal_GetLogger
+        _logger = ApatheticLogging_Internal_Logger
+        _constants = ApatheticLogging_Internal_Constants
+        # Ensure logging module is extended
+        _logger.Logger.extendLoggingModule()
+        # Get root logger - it should be an apathetic logger now
+        logger = _get_logger.getLogger("", extend=True)
+        # Check if logger has test method (it should if it's an apathetic logger)
+        if hasattr(logger, "test"):
+            logger.test(msg, *args, **kwargs)
+        # Fallback: if root logger is still a standard logger, use _log directly
+        # This can happen if root logger was created before extendLoggingModule
+        elif logger.isEnabledFor(_constants.TEST_LEVEL):
+            logger._log(_constants.TEST_LEVEL, msg, args, **kwargs)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+# === apathetic_logging.logging_root ===
+# src/apathetic_logging/logging_root.py
+"""Root logger convenience API for applications using root logger as source of truth.
+
+This module provides a set of functions that operate on the root logger directly.
+This API is designed for applications that use the root logger as the single source
+of truth for log levels, with child loggers inheriting via NOTSET/INHERIT_LEVEL.
+
+By providing a complete root-logger-specific API, we prevent users from accidentally
+mixing root logger operations with child logger operations, which can lead to hard
+to trace bugs.
+"""
+
+
+class ApatheticLogging_Internal_LoggingRoot:  # noqa: N801
+    """Mixin providing root logger convenience methods.
+
+    These functions operate directly on the root logger and provide utilities
+    for applications that use root logger as the single source of truth for
+    log levels.
+
+    This prevents users from accidentally using child logger methods when they
+    meant to use root logger methods, which is a common source of hard-to-trace bugs.
+    """
+
+    @staticmethod
+    def getRootLogger() -> logging.Logger:  # May be Logger or RootLogger
+        """Return the root logger instance.
+
+        This is the primary way to access the root logger. It's more explicit
+        and discoverable than using ``logging.getLogger("")`` or
+        ``getLogger("")``.
+
+        The root logger may be either:
+        - An ``apathetic_logging.Logger`` if it was created after
+          ``extendLoggingModule()`` was called (expected/common case)
+        - A standard ``logging.RootLogger`` if it was created before
+          ``extendLoggingModule()`` was called (fallback, see ROADMAP.md)
+
+        Returns:
+            The root logger instance (either ``apathetic_logging.Logger`` or
+            ``logging.RootLogger``).
+
+        Example:
+            >>> from apathetic_logging import getRootLogger
+            >>> root = getRootLogger()
+            >>> root.setLevel("debug")
+            >>> root.info("This logs to the root logger")
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        return logging.getLogger(_constants.ROOT_LOGGER_KEY)
+
+    @staticmethod
+    def getRootLevel() -> int:
+        """Return the current explicit log level set on the root logger.
+
+        This is the level set on the root logger itself, not considering any
+        parent (the root logger has no parent). For the effective level (which
+        would be the same for root), use getEffectiveRootLevel().
+
+        Returns:
+            Integer log level value. Returns logging.NOTSET (0) if root logger
+            has not had its level explicitly set.
+
+        Example:
+            >>> getRootLevel()
+            10  # DEBUG
+            >>> getRootLevelName()
+            "DEBUG"
+
+        See Also:
+            getEffectiveRootLevel() - Returns effective level (same as explicit
+                for root)
+            getEffectiveRootLevelName() - Returns name of effective level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        return root.level
+
+    @staticmethod
+    def getRootLevelName() -> str:
+        """Return the name of the current explicit log level on the root logger.
+
+        Returns the name of the level set on the root logger itself (e.g., "DEBUG",
+        "INFO", "NOTSET"). For the name of the effective level, use
+        getEffectiveRootLevelName().
+
+        Returns:
+            Level name as uppercase string (e.g., "DEBUG", "TRACE", "NOTSET").
+
+        Raises:
+            ValueError: If the level value is unknown (should not happen with
+                standard and registered levels).
+
+        Example:
+            >>> getRootLevelName()
+            "DEBUG"
+            >>> getRootLevel()
+            10
+
+        See Also:
+            getRootLevel() - Returns numeric level value
+            getEffectiveRootLevelName() - Returns name of effective level
+        """
+        level = ApatheticLogging_Internal_LoggingRoot.getRootLevel()
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(level)
+
+    @staticmethod
+    def getEffectiveRootLevel() -> int:
+        """Return the effective log level on the root logger.
+
+        For the root logger, this is the same as the explicit level since the
+        root logger has no parent to inherit from. This method exists for API
+        completeness and symmetry with Logger.getEffectiveLevel().
+
+        Returns:
+            Integer log level value.
+
+        Example:
+            >>> getEffectiveRootLevel()
+            10  # DEBUG
+
+        See Also:
+            getRootLevel() - Returns explicit level on root
+            getEffectiveRootLevelName() - Returns name of effective level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        return root.getEffectiveLevel()
+
+    @staticmethod
+    def getEffectiveRootLevelName() -> str:
+        """Return the name of the effective log level on the root logger.
+
+        For the root logger, this is the same as the explicit level name.
+        This method exists for API completeness and symmetry with
+        Logger.getEffectiveLevelName().
+
+        Returns:
+            Level name as uppercase string (e.g., "DEBUG", "TRACE", "NOTSET").
+
+        Example:
+            >>> getEffectiveRootLevelName()
+            "DEBUG"
+
+        See Also:
+            getRootLevelName() - Returns name of explicit level
+            getEffectiveRootLevel() - Returns numeric effective level
+        """
+        level = ApatheticLogging_Internal_LoggingRoot.getEffectiveRootLevel()
+        return ApatheticLogging_Internal_LoggingUtils.getLevelNameStr(level)
+
+    @staticmethod
+    def setRootLevel(  # noqa: PLR0912
+        level: str | int,
+        *,
+        apply_to_children: bool = True,
+        set_children_to_level: bool = True,
+        root: logging.Logger | None = None,
+    ) -> None:
+        """Set the log level on the root logger and optionally on child loggers.
+
+        This is the recommended way to set log levels in a CLI application,
+        as it ensures all loggers (including those from libraries) use the
+        same level. When propagation is enabled (default), child loggers
+        inherit from root, so setting root level affects all loggers.
+
+        Args:
+            level: The log level to set, as a string name (case-insensitive)
+                or integer value. Supports standard levels (DEBUG, INFO, etc.)
+                and custom levels (TRACE, DETAIL, BRIEF, SILENT).
+            apply_to_children: If True (default), also sets level on any child
+                loggers that are not NOTSET. This handles loggers that were
+                created before the root level was set. If False, only sets
+                level on the root logger.
+            set_children_to_level: If True (default), sets child loggers to
+                the same level as root. If False, sets child loggers to NOTSET
+                so they inherit from root. Only used when apply_to_children=True.
+            root: The logger to use as the root. If None (default), uses the
+                actual root logger (logging.getLogger(ROOT_LOGGER_KEY)).
+                Can pass any logger to work on its children instead.
+
+        Example:
+            >>> from apathetic_logging import setRootLevel
+            >>> # Set root level - all loggers inherit
+            >>> setRootLevel("debug")
+            >>> # Set root level and reset all child loggers to NOTSET
+            >>> setRootLevel("info", set_children_to_level=False)
+            >>> # Set level on a specific logger and its children
+            >>> my_logger = getLogger("myapp")
+            >>> setRootLevel("warning", root=my_logger)
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Get root logger (or use provided one)
+        # Note: logging.getLogger("") returns the root logger, but its .name is "root"
+        # We need to check for both "" and "root" as root logger names
+        if root is None:
+            root_logger = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        else:
+            root_logger = root
+
+        # Set level on root logger
+        root_logger.setLevel(level_int)
+
+        # Optionally apply to children
+        if apply_to_children:
+            root_name = root_logger.name
+            # Find all child loggers
+            # Children are loggers whose name starts with root_name + "."
+            # (or any logger if root_name is "")
+            for logger_name, logger in logging.Logger.manager.loggerDict.items():
+                # Skip if not a Logger instance
+                if not isinstance(logger, logging.Logger):
+                    continue
+
+                # Skip the root logger itself
+                if logger is root_logger:
+                    continue
+
+                # Check if this is a child of root
+                is_child = False
+                # Root logger can have name "" or "root" depending on Python version
+                root_names = {_constants.ROOT_LOGGER_KEY, _constants.ROOT_LOGGER_NAME}
+                if root_name in root_names:
+                    # Root logger - any logger with a name is a child
+                    is_child = logger_name not in {
+                        _constants.ROOT_LOGGER_KEY,
+                        _constants.ROOT_LOGGER_NAME,
+                    }
+                else:
+                    # Named root - child names start with root_name + "."
+                    is_child = logger_name.startswith(root_name + ".")
+
+                if is_child and logger.level != _constants.INHERIT_LEVEL:
+                    # This child has an explicit level set
+                    if set_children_to_level:
+                        # Set child to same level as root
+                        logger.setLevel(level_int)
+                    else:
+                        # Set child to INHERIT_LEVEL (i.e. NOTSET) so it
+                        # inherits from root
+                        logger.setLevel(_constants.INHERIT_LEVEL)
+
+    @staticmethod
+    def setRootLevelMinimum(level: str | int) -> None:
+        """Set root logger level only if more verbose than current level.
+
+        This is a convenience method that prevents downgrades from more verbose
+        to less verbose levels.
+
+        Args:
+            level: The log level to potentially set, as a string name
+                (case-insensitive) or integer value.
+
+        Example:
+            >>> setRootLevelMinimum("DEBUG")
+            >>> # Root at DEBUG
+            >>> setRootLevelMinimum("INFO")
+            >>> # Still at DEBUG (more verbose is kept)
+
+        See Also:
+            setRootLevel() - Set level unconditionally
+        """
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+        _constants = ApatheticLogging_Internal_Constants
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Get root logger
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        current_level = root.getEffectiveLevel()
+
+        # Only set if new level is more verbose (lower numeric value)
+        if level_int < current_level:
+            root.setLevel(level_int)
+
+    @staticmethod
+    @contextmanager
+    def useRootLevel(
+        level: str | int,
+        *,
+        minimum: bool = False,
+    ) -> Generator[None, None, None]:
+        """Context manager to temporarily set root logger level.
+
+        Sets the root logger to a specific level for the duration of the with block,
+        then restores the previous level. Useful for temporarily increasing verbosity
+        for debugging or testing.
+
+        Args:
+            level: The temporary log level to use, as a string name
+                (case-insensitive) or integer value.
+            minimum: If True, only applies the level if it's more verbose
+                (lower numeric value) than the current effective level. If False
+                (default), always sets the level. When minimum=True, the
+                comparison is against the effective level (which considers parent
+                inheritance, though root has no parent).
+
+        Yields:
+            None
+
+        Example:
+            >>> setRootLevel("INFO")
+            >>> with useRootLevel("DEBUG"):
+            ...     debug_logger.debug("This is logged at DEBUG")
+            >>> # Back to INFO level
+
+            >>> # Only debug if not already at DEBUG
+            >>> with useRootLevel("DEBUG", minimum=True):
+            ...     pass
+
+        See Also:
+            useRootLevelMinimum() - Convenience for useRootLevel(level, minimum=True)
+            setRootLevel() - Permanently set level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _logger_core = ApatheticLogging_Internal_LoggerCore
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        # Get root logger
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        # Cast to Any to handle _last_stream_ids attribute that exists at runtime
+        root_any: Any = root
+        old_level = root.level
+
+        # Check minimum condition if requested
+        if minimum:
+            current_effective = root.getEffectiveLevel()
+            # Only set if more verbose (lower numeric value)
+            if level_int >= current_effective:
+                # Not more verbose, don't change level
+                yield
+                return
+
+        try:
+            # Set temporary level
+            root.setLevel(level_int)
+            yield
+        finally:
+            # Restore original level
+            root.setLevel(old_level)
+            # Update stream cache state to fix .plan/062 bug where stale stream refs
+            # cause handler rebuild loops in stitched mode on sequential context
+            # manager use. We set it to the current streams (not None) to signal
+            # valid state while allowing detection of stream changes on next use.
+            stream_refs = _logger_core._currentStreamRefs()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            root_any._last_stream_ids = stream_refs  # noqa: SLF001
+
+    @staticmethod
+    @contextmanager
+    def useRootLevelMinimum(level: str | int) -> Generator[None, None, None]:
+        """Context manager to temporarily set root level only if more verbose.
+
+        Convenience context manager equivalent to useRootLevel(level, minimum=True).
+        Only applies the level if it's more verbose than the current effective level.
+
+        Args:
+            level: The temporary log level to potentially use, as a string name
+                (case-insensitive) or integer value.
+
+        Yields:
+            None
+
+        Example:
+            >>> with useRootLevelMinimum("DEBUG"):
+            ...     # DEBUG level active only if not already more verbose
+            ...     pass
+
+        See Also:
+            useRootLevel() - For unconditional temporary level change
+        """
+        with ApatheticLogging_Internal_LoggingRoot.useRootLevel(level, minimum=True):
+            yield
+
+    @staticmethod
+    def isRootEnabledFor(level: str | int) -> bool:
+        """Check if root logger would process messages at the given level.
+
+        Returns True if the root logger's effective level would allow messages
+        at the given level to be processed. Useful for conditional expensive
+        operations that should only run if logging is enabled.
+
+        Args:
+            level: Log level to check, as a string name (case-insensitive)
+                or integer value.
+
+        Returns:
+            True if messages at this level would be processed, False otherwise.
+
+        Example:
+            >>> setRootLevel("INFO")
+            >>> isRootEnabledFor("DEBUG")
+            False
+            >>> isRootEnabledFor("INFO")
+            True
+            >>> isRootEnabledFor("WARNING")
+            True
+
+        See Also:
+            getRootLevel() - Get current root level
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        return root.isEnabledFor(level_int)
+
+    @staticmethod
+    def logRootDynamic(
+        level: str | int,
+        msg: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Log a message to root logger with dynamically provided level.
+
+        This allows logging with a level that is determined at runtime rather
+        than compile time. Useful when the logging level comes from user input,
+        configuration, or other dynamic sources.
+
+        Args:
+            level: Log level as string name (case-insensitive) or integer value.
+            msg: The log message.
+            *args: Arguments for message formatting (e.g., for % formatting).
+            **kwargs: Additional keyword arguments for logging (exc_info,
+                stack_info, etc.).
+
+        Example:
+            >>> level = "DEBUG"
+            >>> logRootDynamic(level, "Message at %s level", level)
+            >>> logRootDynamic(logging.DEBUG, "Direct integer level")
+
+        See Also:
+            getRootLogger() - Get root logger for standard logging methods
+        """
+        _constants = ApatheticLogging_Internal_Constants
+        _logging_utils = ApatheticLogging_Internal_LoggingUtils
+
+        # Resolve level string to integer if needed
+        if isinstance(level, str):
+            level_int = _logging_utils.getLevelNumber(level)
+        else:
+            level_int = level
+
+        root = logging.getLogger(_constants.ROOT_LOGGER_KEY)
+        root.log(level_int, msg, *args, **kwargs)
+
+
+# === apathetic_logging.namespace ===
+# src/apathetic_logging/namespace.py
+"""Shared Apathetic CLI logger implementation.
+
+See https://docs.python.org/3/library/logging.html for the complete list of
+standard library logging functions that are wrapped by this namespace.
+
+Docstrings are adapted from the standard library logging module documentation
+licensed under the Python Software Foundation License Version 2.
+"""
+
+
+# --- Apathetic Logging Namespace -------------------------------------------
+
+
+class apathetic_logging(  # noqa: N801
+    ApatheticLogging_Internal_Constants,
+    ApatheticLogging_Internal_DualStreamHandler,
+    ApatheticLogging_Internal_GetLogger,
+    ApatheticLogging_Internal_Logger,
+    ApatheticLogging_Internal_LoggingLevels,
+    ApatheticLogging_Internal_LoggingRoot,
+    ApatheticLogging_Internal_LoggingUtils,
+    ApatheticLogging_Internal_Registry,
+    ApatheticLogging_Internal_RegistryData,
+    ApatheticLogging_Internal_SafeLogging,
+    ApatheticLogging_Internal_TagFormatter,
+    ApatheticLogging_Internal_StdCamelCase,  # keep last
+):
+    """Namespace for apathetic logging functionality.
+
+    All logger functionality is accessed via this namespace class to minimize
+    global namespace pollution when the library is embedded in a stitched script.
+
+    **Classes:**
+    - ``Logger`` → ``ApatheticLogging_Internal_Logger``
+    - ``TagFormatter`` → ``ApatheticLogging_Internal_TagFormatter``
+    - ``DualStreamHandler`` → ``ApatheticLogging_Internal_DualStreamHandler``
+
+    **Static Methods:**
+    - ``getLogger()`` → ``ApatheticLogging_Internal_GetLogger``
+    - ``registerDefaultLogLevel()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerLogLevelEnvVars()`` → ``ApatheticLogging_Internal_Registry``
+    - ``registerLogger()`` → ``ApatheticLogging_Internal_Registry``
+    - ``safeLog()`` → ``ApatheticLogging_Internal_SafeLogging``
+    - ``safeTrace()`` → ``ApatheticLogging_Internal_SafeLogging``
+    - ``makeSafeTrace()`` → ``ApatheticLogging_Internal_SafeLogging``
+
+    **Constants:**
+    - ``DEFAULT_APATHETIC_LOG_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS`` → ``ApatheticLogging_Internal_Constants``
+    - ``SAFE_TRACE_ENABLED`` → ``ApatheticLogging_Internal_SafeLogging``
+    - ``TEST_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``TRACE_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``BRIEF_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``DETAIL_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``SILENT_LEVEL`` → ``ApatheticLogging_Internal_Constants``
+    - ``LEVEL_ORDER`` → ``ApatheticLogging_Internal_Constants``
+    - ``ANSIColors`` → ``ApatheticLogging_Internal_Constants``
+    - ``TAG_STYLES`` → ``ApatheticLogging_Internal_Constants``
+    """
+
+
+# Ensure logging module is extended with TEST, TRACE, DETAIL, BRIEF, and SILENT
+# levels
+# This must be called before any loggers are created
+# This runs when namespace.py is executed (both package and stitched modes)
+# The method is idempotent, so safe to call multiple times if needed
+apathetic_logging.Logger.extendLoggingModule()
+
+# Note: All exports are handled in __init__.py
+# - For library builds (package/stitched): __init__.py is included, exports happen
+# - For embedded builds: __init__.py is excluded, no exports (only class available)
+
+
+# === apathetic_logging ===
+# src/apathetic_logging/__init__.py
+"""Apathetic Logging implementation."""
+
+
+# Get reference to the namespace class
+# In stitched mode: class is already defined in namespace.py (executed before this)
+# In package mode: import from namespace module
+_apathetic_logging_is_stitched = globals().get("__STITCHED__", False)
+
+if _apathetic_logging_is_stitched:
+    # Stitched mode: class already defined in namespace.py
+    # Get reference to the class (it's already in globals from namespace.py)
+    _apathetic_logging_raw = globals().get("apathetic_logging")
+    if _apathetic_logging_raw is None:
+        # Fallback: should not happen, but handle gracefully
+        msg = "apathetic_logging class not found in stitched mode"
+        raise RuntimeError(msg)
+    # Type cast to help mypy understand this is the apathetic_logging class
+    # The import gives us type[apathetic_logging], so cast to
+    # type[_apathetic_logging_class]
+    apathetic_logging = cast("type[_apathetic_logging_class]", _apathetic_logging_raw)
+else:
+    # Package mode: import from namespace module
+    # This block is only executed in package mode, not in stitched builds
+
+    # Ensure the else block is not empty (build script may remove import)
+    _ = apathetic_logging
+
+# Export all namespace items for convenience
+# These are aliases to apathetic_logging.*
+#
+# Note: In embedded builds, __init__.py is excluded from the stitch,
+# so this code never runs and no exports happen (only the class is available).
+# In stitched/package builds, __init__.py is included, so exports happen.
+DEFAULT_APATHETIC_LOG_LEVEL = apathetic_logging.DEFAULT_APATHETIC_LOG_LEVEL
+DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS = (
+    apathetic_logging.DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS
+)
+LEVEL_ORDER = apathetic_logging.LEVEL_ORDER
+SILENT_LEVEL = apathetic_logging.SILENT_LEVEL
+TAG_STYLES = apathetic_logging.TAG_STYLES
+TEST_LEVEL = apathetic_logging.TEST_LEVEL
+safeTrace = apathetic_logging.safeTrace
+SAFE_TRACE_ENABLED = apathetic_logging.SAFE_TRACE_ENABLED
+TRACE_LEVEL = apathetic_logging.TRACE_LEVEL
+BRIEF_LEVEL = apathetic_logging.BRIEF_LEVEL
+DETAIL_LEVEL = apathetic_logging.DETAIL_LEVEL
+INHERIT_LEVEL = apathetic_logging.INHERIT_LEVEL
+NOTSET_LEVEL = apathetic_logging.NOTSET_LEVEL
+ROOT_ALLOW_ALL_LEVEL = apathetic_logging.ROOT_ALLOW_ALL_LEVEL
+
+# Standard library logging levels
+DEBUG_LEVEL = apathetic_logging.DEBUG_LEVEL
+INFO_LEVEL = apathetic_logging.INFO_LEVEL
+WARNING_LEVEL = apathetic_logging.WARNING_LEVEL
+ERROR_LEVEL = apathetic_logging.ERROR_LEVEL
+CRITICAL_LEVEL = apathetic_logging.CRITICAL_LEVEL
+
+# ANSI Colors
+ANSIColors = apathetic_logging.ANSIColors
+
+# Classes
+DualStreamHandler = apathetic_logging.DualStreamHandler
+TagFormatter = apathetic_logging.TagFormatter
+# Logger is a nested class in ApatheticLogging_Internal_Logger that
+# inherits from logging.Logger.
+# Use TypeAlias to help mypy understand this is a class type.
+if TYPE_CHECKING:
+    Logger: TypeAlias = ApatheticLogging_Internal_Logger.Logger
+else:
+    Logger = apathetic_logging.Logger
+
+# Functions (camelCase - stdlib wrappers)
+addLevelName = apathetic_logging.addLevelName
+basicConfig = apathetic_logging.basicConfig
+captureWarnings = apathetic_logging.captureWarnings
+critical = apathetic_logging.critical
+currentframe = apathetic_logging.currentframe
+debug = apathetic_logging.debug
+detail = apathetic_logging.detail
+disable = apathetic_logging.disable
+error = apathetic_logging.error
+exception = apathetic_logging.exception
+fatal = apathetic_logging.fatal
+getHandlerByName = apathetic_logging.getHandlerByName
+getHandlerNames = apathetic_logging.getHandlerNames
+getLevelName = apathetic_logging.getLevelName
+getLevelNamesMapping = apathetic_logging.getLevelNamesMapping
+getLogRecordFactory = apathetic_logging.getLogRecordFactory
+getLogger = apathetic_logging.getLogger
+getLoggerClass = apathetic_logging.getLoggerClass
+info = apathetic_logging.info
+log = apathetic_logging.log
+makeLogRecord = apathetic_logging.makeLogRecord
+brief = apathetic_logging.brief
+setLogRecordFactory = apathetic_logging.setLogRecordFactory
+setLoggerClass = apathetic_logging.setLoggerClass
+setRootLevel = apathetic_logging.setRootLevel
+shutdown = apathetic_logging.shutdown
+test = apathetic_logging.test
+trace = apathetic_logging.trace
+warn = apathetic_logging.warn
+warning = apathetic_logging.warning
+
+# Functions (camelCase - library functions)
+getCompatibilityMode = apathetic_logging.getCompatibilityMode
+getDefaultLogLevel = apathetic_logging.getDefaultLogLevel
+getDefaultLoggerName = apathetic_logging.getDefaultLoggerName
+getDefaultPropagate = apathetic_logging.getDefaultPropagate
+getEffectiveRootLevel = apathetic_logging.getEffectiveRootLevel
+getEffectiveRootLevelName = apathetic_logging.getEffectiveRootLevelName
+getLevelName = apathetic_logging.getLevelName
+getLevelNameStr = apathetic_logging.getLevelNameStr
+getLevelNumber = apathetic_logging.getLevelNumber
+getLogLevelEnvVars = apathetic_logging.getLogLevelEnvVars
+getLoggerOfType = apathetic_logging.getLoggerOfType
+getRegisteredLoggerName = apathetic_logging.getRegisteredLoggerName
+getRootLevel = apathetic_logging.getRootLevel
+getRootLevelName = apathetic_logging.getRootLevelName
+getRootLogger = apathetic_logging.getRootLogger  # pyright: ignore[reportUnknownVariableType,reportUnknownMemberType]
+getTargetPythonVersion = apathetic_logging.getTargetPythonVersion
+hasLogger = apathetic_logging.hasLogger
+isRootLoggerInstantiated = apathetic_logging.isRootLoggerInstantiated
+makeSafeTrace = apathetic_logging.makeSafeTrace
+registerDefaultLogLevel = apathetic_logging.registerDefaultLogLevel
+registerLogLevelEnvVars = apathetic_logging.registerLogLevelEnvVars
+registerLogger = apathetic_logging.registerLogger
+registerCompatibilityMode = apathetic_logging.registerCompatibilityMode
+registerPortHandlers = apathetic_logging.registerPortHandlers
+registerPortLevel = apathetic_logging.registerPortLevel
+registerPropagate = apathetic_logging.registerPropagate
+registerReplaceRootLogger = apathetic_logging.registerReplaceRootLogger
+registerTargetPythonVersion = apathetic_logging.registerTargetPythonVersion
+removeLogger = apathetic_logging.removeLogger
+safeLog = apathetic_logging.safeLog
+setRootLevel = apathetic_logging.setRootLevel
+setRootLevelMinimum = apathetic_logging.setRootLevelMinimum
+useRootLevel = apathetic_logging.useRootLevel
+useRootLevelMinimum = apathetic_logging.useRootLevelMinimum
+isRootEnabledFor = apathetic_logging.isRootEnabledFor
+logRootDynamic = apathetic_logging.logRootDynamic
+
+
+__all__ = [
+    "BRIEF_LEVEL",
+    "CRITICAL_LEVEL",
+    "DEBUG_LEVEL",
+    "DEFAULT_APATHETIC_LOG_LEVEL",
+    "DEFAULT_APATHETIC_LOG_LEVEL_ENV_VARS",
+    "DETAIL_LEVEL",
+    "ERROR_LEVEL",
+    "INFO_LEVEL",
+    "INHERIT_LEVEL",
+    "LEVEL_ORDER",
+    "NOTSET_LEVEL",
+    "ROOT_ALLOW_ALL_LEVEL",
+    "SAFE_TRACE_ENABLED",
+    "SILENT_LEVEL",
+    "TAG_STYLES",
+    "TEST_LEVEL",
+    "TRACE_LEVEL",
+    "WARNING_LEVEL",
+    "ANSIColors",
+    "DualStreamHandler",
+    "Logger",
+    "TagFormatter",
+    "addLevelName",
+    "apathetic_logging",
+    "basicConfig",
+    "brief",
+    "captureWarnings",
+    "critical",
+    "currentframe",
+    "debug",
+    "detail",
+    "disable",
+    "error",
+    "exception",
+    "fatal",
+    "getCompatibilityMode",
+    "getDefaultLogLevel",
+    "getDefaultLoggerName",
+    "getDefaultPropagate",
+    "getEffectiveRootLevel",
+    "getEffectiveRootLevelName",
+    "getHandlerByName",
+    "getHandlerNames",
+    "getLevelName",
+    "getLevelNameStr",
+    "getLevelNamesMapping",
+    "getLevelNumber",
+    "getLogLevelEnvVars",
+    "getLogRecordFactory",
+    "getLogger",
+    "getLoggerClass",
+    "getLoggerOfType",
+    "getRegisteredLoggerName",
+    "getRootLevel",
+    "getRootLevelName",
+    "getRootLogger",
+    "getTargetPythonVersion",
+    "hasLogger",
+    "info",
+    "isRootEnabledFor",
+    "isRootLoggerInstantiated",
+    "log",
+    "logRootDynamic",
+    "makeLogRecord",
+    "makeSafeTrace",
+    "registerCompatibilityMode",
+    "registerDefaultLogLevel",
+    "registerLogLevelEnvVars",
+    "registerLogger",
+    "registerPortHandlers",
+    "registerPortLevel",
+    "registerPropagate",
+    "registerReplaceRootLogger",
+    "registerTargetPythonVersion",
+    "removeLogger",
+    "safeLog",
+    "safeTrace",
+    "setLogRecordFactory",
+    "setLoggerClass",
+    "setRootLevel",
+    "setRootLevelMinimum",
+    "shutdown",
+    "test",
+    "trace",
+    "useRootLevel",
+    "useRootLevelMinimum",
+    "warn",
+    "warning",
+]
+
+
+# --- import shims for stitched runtime ---
+def _create_pkg_module(pkg_name: str) -> types.ModuleType:
+    """Create a package module and set up parent relationships."""
+    # Always create a new module object for packages
+    # Don't reuse existing modules - they might be the
+    # stitched module itself or have wrong attributes
+    _mod = types.ModuleType(pkg_name)
+    _mod.__package__ = pkg_name
+    sys.modules[pkg_name] = _mod
+    # Set up parent-child relationships for nested packages
+    if "." in pkg_name:
+        _parent_pkg = ".".join(pkg_name.split(".")[:-1])
+        _child_name = pkg_name.rsplit(".", maxsplit=1)[-1]
+        _parent = sys.modules.get(_parent_pkg)
+        if _parent:
+            setattr(_parent, _child_name, _mod)
+    return _mod
+
+
+def _setup_pkg_modules(  # noqa: C901, PLR0912
+    pkg_name: str, module_names: list[str], name_mapping: dict[str, str] | None = None
+) -> None:
+    """Set up package module attributes and register submodules."""
+    _mod = sys.modules.get(pkg_name)
+    if not _mod:
+        return
+    # Copy attributes from all modules under this package
+    _globals = globals()
+    # Debug: log what's in globals for this package
+    # Note: This copies all globals to the package module
+    for _key, _value in _globals.items():
+        setattr(_mod, _key, _value)
+    # Set up package attributes for nested packages BEFORE registering
+    # modules (so packages are available when modules are registered)
+    _seen_packages: set[str] = set()
+    for _name in module_names:
+        if _name != pkg_name and _name.startswith(pkg_name + "."):
+            # Extract parent package (e.g., mypkg.public from
+            # mypkg.public.utils)
+            _name_parts = _name.split(".")
+            if len(_name_parts) > 2:  # noqa: PLR2004
+                # Has at least one intermediate package
+                _parent_pkg = ".".join(_name_parts[:-1])
+                if (
+                    _parent_pkg.startswith(pkg_name + ".")
+                    and _parent_pkg not in _seen_packages
+                ):
+                    _seen_packages.add(_parent_pkg)
+                    _pkg_obj = sys.modules.get(_parent_pkg)
+                    if _pkg_obj and _pkg_obj != _mod:
+                        # Set parent package as attribute
+                        _pkg_attr_name = _name_parts[1]
+                        if not hasattr(_mod, _pkg_attr_name):
+                            setattr(_mod, _pkg_attr_name, _pkg_obj)
+    # Register all modules under this package
+    for _name in module_names:
+        # Try to find module by transformed name first
+        _module_obj = sys.modules.get(_name)
+        if not _module_obj and name_mapping:
+            # If not found, try to find by original name
+            _original_name = name_mapping.get(_name)
+            if _original_name:
+                _module_obj = sys.modules.get(_original_name)
+                if _module_obj:
+                    # Register with transformed name
+                    sys.modules[_name] = _module_obj
+        # If still not found, use package module
+        if not _module_obj:
+            sys.modules[_name] = _mod
+    # Set submodules as attributes on parent package
+    for _name in module_names:
+        if _name != pkg_name and _name.startswith(pkg_name + "."):
+            _submodule_name = _name.split(".")[-1]
+            # Try to get actual module object
+            _module_obj = sys.modules.get(_name)
+            if not _module_obj and name_mapping:
+                _original_name = name_mapping.get(_name)
+                if _original_name:
+                    _module_obj = sys.modules.get(_original_name)
+            # Use actual module object if found, otherwise package
+            _target = _module_obj or _mod
+            if not hasattr(_mod, _submodule_name) or isinstance(
+                getattr(_mod, _submodule_name, None), types.ModuleType
+            ):
+                setattr(_mod, _submodule_name, _target)
+
+
+_create_pkg_module("apathetic_logging")
+
+_setup_pkg_modules(
+    "apathetic_logging",
+    [
+        "apathetic_logging",
+        "apathetic_logging.constants",
+        "apathetic_logging.dual_stream_handler",
+        "apathetic_logging.get_logger",
+        "apathetic_logging.logger",
+        "apathetic_logging.logger_namespace",
+        "apathetic_logging.logging_levels",
+        "apathetic_logging.logging_root",
+        "apathetic_logging.logging_std_camel",
+        "apathetic_logging.logging_utils",
+        "apathetic_logging.namespace",
+        "apathetic_logging.registry",
+        "apathetic_logging.registry_data",
+        "apathetic_logging.safe_logging",
+        "apathetic_logging.tag_formatter",
+    ],
+    None,
+)
@@ -7,10 +7,17 @@ licensed under the Python Software Foundation License Version 2.
 
 from __future__ import annotations
 
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Any
 
+from .tag_formatter import (
+    ApatheticLogging_Internal_TagFormatter,
+)
+
 
 class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ignore[reportUnusedClass]
     """Mixin class that provides the DualStreamHandler nested class.
@@ -30,21 +37,132 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
         debugging tests without breaking output assertions while still being
         capturable by subprocess.run(capture_output=True).
         WARNING, ERROR, and CRITICAL always use normal stderr, even in TEST mode.
+
+        Records are formatted with a shared TagFormatter("%(message)s") while
+        no formatter is set. The handler's own formatter starts as None, so
+        setFormatter() and stdlib helpers like basicConfig(format=...) can
+        still fill it in.
+
+        Handlers created by Logger.manageHandlers() skip records that a
+        DualStreamHandler already emitted. This keeps a stale managed handler,
+        or root's handler under a child with a DualStreamHandler of its own,
+        from printing the same message twice. Handlers added by the user
+        always write.
+
+        With async_mode=True, emit() formats the record and picks its stream
+        in the logging call, then queues it; a QueueListener thread only
+        writes the finished line. Call close() to flush the queue before the
+        process (or test) inspects the output.
         """
 
         enable_color: bool = False
         """Enable ANSI color output for log messages."""
 
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # Fallback used by format() while self.formatter is None. Formatters
+        # keep no per-record state, so every handler can share one instead of
+        # compiling the same format string for each new handler
+        _default_formatter: logging.Formatter = (
+            ApatheticLogging_Internal_TagFormatter.TagFormatter("%(message)s")
+        )
+
+        class _SeenFilter(logging.Filter):
+            """Drop records that a DualStreamHandler already emitted.
+
+            Attached by Logger.manageHandlers() to the handlers it creates.
+            """
+
+            def filter(self, record: logging.LogRecord) -> bool:
+                """Return False if the record is marked as emitted."""
+                return not getattr(record, "_apathetic_seen", False)
+
+        # Stateless, so one instance serves every handler
+        _seen_filter: logging.Filter = _SeenFilter()
+
+        # Set by Logger.manageHandlers() on the handlers it creates; it only
+        # ever removes or rebuilds those (and filters seen records on those),
+        # never a user's DualStreamHandler
+        _managed: bool = False
+
+        class _QueuedRecordWriter(logging.StreamHandler):  # type: ignore[type-arg]
+            """Write records an async DualStreamHandler already formatted."""
+
+            def emit(self, record: logging.LogRecord) -> None:
+                """Write the prepared message to the stream chosen at log time."""
+                self.stream = record._apathetic_stream  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+                super().emit(record)
+
+        # async mode only: the record queue, the handler that writes the
+        # prepared records out, and the listener thread feeding it
+        _queue: queue.SimpleQueue[logging.LogRecord] | None = None
+        _writer: logging.StreamHandler | None = None  # type: ignore[type-arg]
+        _listener: logging.handlers.QueueListener | None = None
+
+        def __init__(self, *args: Any, async_mode: bool = False, **kwargs: Any) -> None:
             """Initialize the dual stream handler. super().__init__() to StreamHandler.
 
             Args:
                 *args: Additional positional arguments (for future-proofing)
+                async_mode: Queue records and write them on a listener thread
+                    instead of in the logging call. Defaults to False.
                 **kwargs: Additional keyword arguments (for future-proofing)
             """
             # default to stdout, overridden per record in emit()
             super().__init__(*args, **kwargs)  # pyright: ignore[reportUnknownMemberType]
 
+            if async_mode:
+                self._queue = queue.SimpleQueue()
+                self._writer = self._QueuedRecordWriter()
+                self._listener = logging.handlers.QueueListener(
+                    self._queue, self._writer
+                )
+                self._listener.start()
+
+        def format(self, record: logging.LogRecord) -> str:
+            """Format a record, with the shared TagFormatter if none is set.
+
+            Wrapper for logging.Handler.format.
+
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.format
+            """
+            fmt = self.formatter or self._default_formatter
+            return fmt.format(record)
+
+        def close(self) -> None:
+            """Flush queued records (async mode) and close the handler.
+
+            Wrapper for logging.StreamHandler.close.
+
+            https://docs.python.org/3.10/library/logging.html#logging.Handler.close
+            """
+            if self._listener is not None:
+                # stop() drains the queue before returning
+                self._listener.stop()
+                self._listener = None
+            if self._writer is not None:
+                self._writer.close()
+            super().close()
+
+        def _prepareRecord(
+            self, record: logging.LogRecord, stream: Any
+        ) -> logging.LogRecord:
+            """Return a formatted copy of ``record`` for the async writer.
+
+            Like logging.handlers.QueueHandler.prepare(): the message is
+            formatted now and msg/args/exc_info are replaced by the result, so
+            changes made to the arguments after the call cannot alter the
+            output. The stream picked by emit() travels with the copy.
+            """
+            msg = self.format(record)
+            prepared = copy.copy(record)
+            prepared.message = msg
+            prepared.msg = msg
+            prepared.args = None  # pyright: ignore[reportAttributeAccessIssue]
+            prepared.exc_info = None
+            prepared.exc_text = None
+            prepared.stack_info = None
+            prepared._apathetic_stream = stream  # noqa: SLF001
+            return prepared
+
         def emit(self, record: logging.LogRecord, *args: Any, **kwargs: Any) -> None:
             """Routes based on log level and handles colorization.
 
@@ -65,6 +183,12 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
             logging.Handler.emit() implementation:
             https://docs.python.org/3.10/library/logging.html#logging.Handler.emit
             """
+            # marked on emit (not in the filter), so a record rejected by a
+            # later filter is still free to reach another DualStreamHandler,
+            # and before queueing, so the mark never depends on when the
+            # listener thread gets to the record
+            record._apathetic_seen = True  # noqa: SLF001
+
             # Import here to avoid circular dependency
             from .constants import (  # noqa: PLC0415
                 ApatheticLogging_Internal_Constants,
@@ -86,15 +210,14 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
             #   because then it will call extendLoggingModule again
             logger_instance = logging.getLogger(logger_name)
 
-            # Use duck typing to check if this is our Logger class
-            # (has test() method) to avoid circular dependency
-            has_test_method = hasattr(logger_instance, "test") and callable(
-                getattr(logger_instance, "test", None)
-            )
+            # Check the class-level IS_APATHETIC marker to tell if this is our
+            # Logger class (one attribute lookup per record, and no import,
+            # avoiding a circular dependency)
+            is_apathetic = getattr(logger_instance, "IS_APATHETIC", False)
             # Use effective level (not explicit level) to detect TEST mode,
             # so child loggers that inherit TEST level from parent are correctly
             # detected
-            is_test_mode = has_test_method and logger_instance.getEffectiveLevel() == (
+            is_test_mode = is_apathetic and logger_instance.getEffectiveLevel() == (
                 _constants.TEST_LEVEL
             )
 
@@ -102,20 +225,28 @@ class ApatheticLogging_Internal_DualStreamHandler:  # noqa: N801  # pyright: ign
             if level >= logging.WARNING:
                 # WARNING, ERROR, CRITICAL → stderr (always, even in TEST mode)
                 # This ensures they still break tests as expected
-                self.stream = sys.stderr
+                stream = sys.stderr
             elif level <= logging.DEBUG:
                 # TEST, TRACE, DEBUG → stderr (normal) or __stderr__ (TEST mode bypass)
                 # Use __stderr__ so they bypass pytest capsys but are still
                 # capturable by subprocess.run(capture_output=True)
-                if is_test_mode:
-                    self.stream = sys.__stderr__
-                else:
-                    self.stream = sys.stderr
+                stream = sys.__stderr__ if is_test_mode else sys.stderr
             else:
                 # DETAIL, INFO, BRIEF → stdout (normal program output)
-                self.stream = sys.stdout
+                stream = sys.stdout
 
             # used by TagFormatter
             record.enable_color = getattr(self, "enable_color", False)
 
+            if self._queue is not None:
+                # async mode: format and route here, on the logging thread, so
+                # the output reflects the arguments, streams and level of the
+                # call; the listener thread only writes the finished line
+                try:
+                    self._queue.put_nowait(self._prepareRecord(record, stream))
+                except Exception:  # noqa: BLE001
+                    self.handleError(record)
+                return
+
+            self.stream = stream
             super().emit(record, *args, **kwargs)
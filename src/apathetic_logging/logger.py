@@ -14,9 +14,10 @@ import argparse
 import logging
 import os
 import sys
-from collections.abc import Generator
+import weakref
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from typing import Any, TextIO, cast
+from typing import Any, cast
 
 from .constants import (
     ApatheticLogging_Internal_Constants,
@@ -30,9 +31,6 @@ from .registry_data import (
 from .safe_logging import (
     ApatheticLogging_Internal_SafeLogging,
 )
-from .tag_formatter import (
-    ApatheticLogging_Internal_TagFormatter,
-)
 
 
 class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyright: ignore[reportUnusedClass]
@@ -45,10 +43,16 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
     enable_color: bool = False
     """Enable ANSI color output for log messages."""
 
+    IS_APATHETIC: bool = True
+    """Marks apathetic loggers; handlers check this instead of probing methods."""
+
     _logging_module_extended: bool = False
 
-    # if stdout or stderr are redirected, we need to repoint
-    _last_stream_ids: tuple[TextIO, TextIO] | None = None
+    # if stdout or stderr are redirected, we need to repoint. Holds weak
+    # references to the streams (see _currentStreamRefs()), so a replaced
+    # stream (e.g. a test's capture buffer) is not kept alive by the logger
+    # while the check stays an exact identity comparison
+    _last_stream_ids: tuple[Callable[[], Any], Callable[[], Any]] | None = None
 
     DEFAULT_STACKLEVEL = 2
     """Default stacklevel for errorIfNotDebug/criticalIfNotDebug methods."""
@@ -112,35 +116,63 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
 
         # handler attachment will happen in _log() with manageHandlers()
 
+    @staticmethod
+    def _streamRef(stream: Any) -> Callable[[], Any]:
+        """Return a weak reference to ``stream``, or a strong one if unsupported.
+
+        Streams without weakref support (e.g. None when there is no console)
+        are held directly; calling the result returns the stream either way.
+        """
+        try:
+            return weakref.ref(stream)
+        except TypeError:
+            return lambda: stream
+
+    @classmethod
+    def _currentStreamRefs(cls) -> tuple[Callable[[], Any], Callable[[], Any]]:
+        """Return references to the current sys.stdout and sys.stderr."""
+        return cls._streamRef(sys.stdout), cls._streamRef(sys.stderr)
+
+    @staticmethod
+    def _isManagedHandler(handler: logging.Handler) -> bool:
+        """Return True if manageHandlers() created this handler."""
+        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
+        if not isinstance(handler, _dual_stream_handler.DualStreamHandler):
+            return False
+        return handler._managed  # noqa: SLF001
+
     def _rebuildAppatheticHandlers(self) -> None:
         """Rebuild apathetic handlers for this logger.
 
-        Removes existing DualStreamHandler instances and creates a new one.
-        Updates _last_stream_ids to track current stdout/stderr.
+        Removes the DualStreamHandler instances it created earlier and creates
+        a new one. Updates _last_stream_ids to track current stdout/stderr.
 
         This is called by manageHandlers() when handlers need to be rebuilt.
 
         """
         _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
-        _tag_formatter = ApatheticLogging_Internal_TagFormatter
         _safe_logging = ApatheticLogging_Internal_SafeLogging
 
-        # Remove existing apathetic handlers. In unusual circumstances (e.g., when
+        # Remove existing managed handlers. In unusual circumstances (e.g., when
         # test fixtures create a new root logger and copy handlers), there might be
         # multiple stale handlers from copies. Remove them defensively to ensure
         # we don't end up with handlers pointing to old stdout/stderr.
         for handler in list(self.handlers):  # Copy list to avoid mutation issues
-            if isinstance(handler, _dual_stream_handler.DualStreamHandler):
+            if self._isManagedHandler(handler):
                 self.removeHandler(handler)
                 if hasattr(handler, "close"):
                     handler.close()
 
         # Add new apathetic handler
+        # DualStreamHandler formats with the shared TagFormatter by default
         h = _dual_stream_handler.DualStreamHandler()
-        h.setFormatter(_tag_formatter.TagFormatter("%(message)s"))
+        h._managed = True  # noqa: SLF001
+        # skip records another DualStreamHandler already wrote (defense in
+        # depth against stale or duplicated handlers multiplying output)
+        h.addFilter(h._seen_filter)  # noqa: SLF001
         h.enable_color = self.enable_color
         self.addHandler(h)
-        self._last_stream_ids = (sys.stdout, sys.stderr)
+        self._last_stream_ids = self._currentStreamRefs()
         _safe_logging.safeTrace(
             "manageHandlers()",
             f"rebuilt_handlers={self.handlers}",
@@ -153,8 +185,8 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         apathetic handlers if they're not propagating (propagate=False),
         otherwise they rely on root logger's handler via propagation.
 
-        Only manages DualStreamHandler instances. User-added handlers are
-        left untouched.
+        Only manages the DualStreamHandler instances it created. User-added
+        handlers, including user-added DualStreamHandlers, are left untouched.
 
         Rebuilds handlers if they're missing or if stdout/stderr have changed.
 
@@ -189,45 +221,32 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
         if not manage_handlers:
             return
 
-        _dual_stream_handler = ApatheticLogging_Internal_DualStreamHandler
-
-        # Identify apathetic handlers
-        apathetic_handlers = [
-            h
-            for h in self.handlers
-            if isinstance(h, _dual_stream_handler.DualStreamHandler)
-        ]
+        # Identify the apathetic handlers this logger created
+        apathetic_handlers = [h for h in self.handlers if self._isManagedHandler(h)]
 
         # Propagating child loggers should not have apathetic handlers
-        # Only remove handlers if we previously managed them (indicated by
-        # _last_stream_ids being set), to avoid removing manually-added handlers
+        # Only handlers created by manageHandlers() are removed, never
+        # manually-added ones
         # Root logger can have name "" (ROOT_LOGGER_KEY) or "root" (ROOT_LOGGER_NAME)
         is_root = self.name in {
             _constants.ROOT_LOGGER_KEY,
             _constants.ROOT_LOGGER_NAME,
         }
         if not is_root and self.propagate:
-            # Only remove apathetic handlers if we previously managed them
-            # (indicated by _last_stream_ids being set)
-            if self._last_stream_ids is not None and apathetic_handlers:
-                # We previously managed handlers for this logger, remove them
-                for handler in apathetic_handlers:
-                    self.removeHandler(handler)
+            for handler in apathetic_handlers:
+                self.removeHandler(handler)
             return
 
         # Root logger or non-propagating child logger - ensure it has an
         # apathetic handler. Check if rebuild is needed (missing handler or
-        # streams changed)
+        # streams changed). A reference to a collected stream returns None,
+        # which never matches the current stream
+        last_streams = self._last_stream_ids
         needs_rebuild = (
             not apathetic_handlers
-            or (
-                self._last_stream_ids is not None
-                and (
-                    self._last_stream_ids[0] is not sys.stdout
-                    or self._last_stream_ids[1] is not sys.stderr
-                )
-            )
-            or self._last_stream_ids is None
+            or last_streams is None
+            or last_streams[0]() is not sys.stdout
+            or last_streams[1]() is not sys.stderr
         )
 
         if needs_rebuild:
@@ -1375,7 +1394,10 @@ class ApatheticLogging_Internal_LoggerCore(logging.Logger):  # noqa: N801  # pyr
             self.error("Invalid log level type: %r", type(level))
             return
 
-        self._log(level_no, msg, args, **kwargs)
+        # Same guard as the level methods, so filtered messages skip _log()
+        # (and its handler management) entirely
+        if self.isEnabledFor(level_no):
+            self._log(level_no, msg, args, **kwargs)
 
     @contextmanager
     def useLevel(
@@ -13,7 +13,6 @@ to trace bugs.
 from __future__ import annotations
 
 import logging
-import sys
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any
@@ -369,11 +368,15 @@ class ApatheticLogging_Internal_LoggingRoot:  # noqa: N801
         from .constants import (  # noqa: PLC0415
             ApatheticLogging_Internal_Constants,
         )
+        from .logger import (  # noqa: PLC0415
+            ApatheticLogging_Internal_LoggerCore,
+        )
         from .logging_utils import (  # noqa: PLC0415
             ApatheticLogging_Internal_LoggingUtils,
         )
 
         _constants = ApatheticLogging_Internal_Constants
+        _logger_core = ApatheticLogging_Internal_LoggerCore
         _logging_utils = ApatheticLogging_Internal_LoggingUtils
 
         # Resolve level string to integer if needed
@@ -404,11 +407,12 @@ class ApatheticLogging_Internal_LoggingRoot:  # noqa: N801
         finally:
             # Restore original level
             root.setLevel(old_level)
-            # Update stream cache state to fix .plan/062 bug where stale stream IDs
+            # Update stream cache state to fix .plan/062 bug where stale stream refs
             # cause handler rebuild loops in stitched mode on sequential context
             # manager use. We set it to the current streams (not None) to signal
             # valid state while allowing detection of stream changes on next use.
-            root_any._last_stream_ids = (sys.stdout, sys.stderr)  # noqa: SLF001
+            stream_refs = _logger_core._currentStreamRefs()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            root_any._last_stream_ids = stream_refs  # noqa: SLF001
 
     @staticmethod
     @contextmanager
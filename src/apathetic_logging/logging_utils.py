@@ -449,8 +449,8 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
         logger supports it, to ensure apathetic handlers are set up appropriately
         based on propagate setting. This ensures root logger always has a handler,
         and child loggers with propagate=False get handlers as needed. manageHandlers()
-        only manages DualStreamHandler instances, so it won't interfere with ported
-        user handlers.
+        only manages the DualStreamHandler instances it created, so it won't touch
+        ported user handlers.
 
         Finally, reconnects child loggers from the old logger to the new logger,
         ensuring child loggers point to the new logger instance after replacement.
@@ -497,11 +497,12 @@ class ApatheticLogging_Internal_LoggingUtils:  # noqa: N801  # pyright: ignore[r
             ApatheticLogging_Internal_LoggingUtils._portHandlers(old_logger, new_logger)
 
         # After porting (or not porting) handlers, ensure apathetic handlers are set up
-        # if the logger supports manageHandlers(). This ensures root logger always has
-        # a handler, and child loggers with propagate=False get handlers as needed.
-        # manageHandlers() only manages DualStreamHandler instances, so it won't
-        # interfere with ported user handlers.
-        if hasattr(new_logger, "manageHandlers"):
+        # if it is an apathetic logger (IS_APATHETIC, so it has manageHandlers()).
+        # This ensures root logger always has a handler, and child loggers with
+        # propagate=False get handlers as needed. manageHandlers() only manages
+        # the DualStreamHandler instances it created, so it won't touch ported user
+        # handlers.
+        if getattr(new_logger, "IS_APATHETIC", False):
             new_logger.manageHandlers()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
 
         # Resolve port_level parameter
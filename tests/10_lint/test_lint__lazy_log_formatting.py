@@ -0,0 +1,129 @@
+# tests/10_lint/test_lint__lazy_log_formatting.py
+"""Custom lint rule: Log calls in src/ must pass format args, not pre-format.
+
+This test acts as a "poor person's linter" alongside ruff's flake8-logging-format
+rules (G001-G004). Those only recognise the standard level methods on objects
+that look like loggers. This check also covers our own level methods (trace,
+detail, brief, test, logDynamic, errorIfNotDebug, criticalIfNotDebug) and calls
+made through `self`.
+
+Disallowed message arguments:
+- f-strings: `logger.debug(f"value={value}")`
+- str.format(): `logger.debug("value={}".format(value))`
+- %-interpolation: `logger.debug("value=%s" % value)`
+
+Allowed:
+- `logger.debug("value=%s", value)`
+
+Why this matters:
+- The message is only formatted if a handler actually emits the record.
+  Pre-formatting pays the cost on every call, even when the level
+  filters the message out.
+"""
+
+import ast
+from pathlib import Path
+
+from tests.utils.constants import PROJ_ROOT
+
+
+#: Log method name -> index of its message among the positional arguments
+MESSAGE_ARG_INDEX = {
+    **dict.fromkeys(
+        (
+            "debug",
+            "info",
+            "warning",
+            "error",
+            "critical",
+            "exception",
+            "trace",
+            "detail",
+            "brief",
+            "test",
+            "errorIfNotDebug",
+            "criticalIfNotDebug",
+        ),
+        0,
+    ),
+    # level first, then the message
+    "log": 1,
+    "logDynamic": 1,
+}
+
+
+def _is_eager_format(node: ast.expr) -> bool:
+    """Return True if ``node`` builds the message before the call is made."""
+    if isinstance(node, ast.JoinedStr):
+        return True
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "format"
+    ):
+        return True
+    return (
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, ast.Mod)
+        and isinstance(node.left, ast.Constant)
+        and isinstance(node.left.value, str)
+    )
+
+
+class EagerLogFormatChecker(ast.NodeVisitor):
+    """AST visitor collecting log calls whose message is pre-formatted."""
+
+    def __init__(self) -> None:
+        self.violations: list[tuple[int, str]] = []  # (line, method)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Attribute):
+            msg_index = MESSAGE_ARG_INDEX.get(node.func.attr)
+            if (
+                msg_index is not None
+                and len(node.args) > msg_index
+                and _is_eager_format(node.args[msg_index])
+            ):
+                self.violations.append((node.lineno, node.func.attr))
+        self.generic_visit(node)
+
+
+def test_log_calls_use_lazy_formatting() -> None:
+    """Enforce lazy %-style args in every log call under src/.
+
+    Custom lint rule implemented as a pytest test because ruff's G rules
+    don't know about our custom level methods. Fails listing each call that
+    passes an f-string, str.format() or %-interpolated message.
+    """
+    src_dir = PROJ_ROOT / "src"
+    if not src_dir.exists():
+        msg = f"Source directory not found: {src_dir}"
+        raise AssertionError(msg)
+
+    all_violations: list[tuple[Path, int, str]] = []
+    for py_file in sorted(src_dir.rglob("*.py")):
+        tree = ast.parse(py_file.read_text(encoding="utf-8"), filename=str(py_file))
+        checker = EagerLogFormatChecker()
+        checker.visit(tree)
+        all_violations.extend(
+            (py_file, line_num, method) for line_num, method in checker.violations
+        )
+
+    if all_violations:
+        print("\n❌ Log calls must pass format arguments instead of pre-formatting:")
+        print(
+            '\n  ❌ logger.debug(f"value={value}")'
+            '\n  ❌ logger.debug("value={}".format(value))'
+            '\n  ❌ logger.debug("value=%s" % value)'
+            '\n  ✅ logger.debug("value=%s", value)'
+        )
+        print("\nViolations found:")
+        for file_path, line_num, method in all_violations:
+            relative_path = file_path.relative_to(PROJ_ROOT)
+            print(f"  - {relative_path}:{line_num}: {method}()")
+        xmsg = (
+            f"{len(all_violations)} log call(s) pre-format their message."
+            " Pass the arguments to the log call so formatting only happens"
+            " for records that are emitted."
+        )
+        raise AssertionError(xmsg)
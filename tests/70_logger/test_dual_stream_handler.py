@@ -1,9 +1,11 @@
 # tests/50_core/test_dual_stream_handler.py
 """Tests for DualStreamHandler class."""
 
+import contextlib
 import io
 import logging
 import sys
+from unittest import mock
 
 import pytest
 
@@ -11,7 +13,7 @@ import apathetic_logging as mod_alogs
 
 
 def test_dual_stream_handler_info_goes_to_stdout(
-    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """DualStreamHandler should route INFO level to stdout."""
     # --- setup ---
@@ -20,21 +22,17 @@ def test_dual_stream_handler_info_goes_to_stdout(
     logger.setLevel(logging.INFO)
     logger.addHandler(handler)
 
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-
     # --- execute ---
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
     logger.info("test info message")
 
     # --- verify ---
-    assert "test info message" in out_buf.getvalue()
-    assert "test info message" not in err_buf.getvalue()
+    captured = capsys.readouterr()
+    assert "test info message" in captured.out
+    assert "test info message" not in captured.err
 
 
 def test_dual_stream_handler_debug_goes_to_stderr(
-    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """DualStreamHandler should route DEBUG level to stderr."""
     # --- setup ---
@@ -43,21 +41,17 @@ def test_dual_stream_handler_debug_goes_to_stderr(
     logger.setLevel(logging.DEBUG)
     logger.addHandler(handler)
 
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-
     # --- execute ---
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
     logger.debug("test debug message")
 
     # --- verify ---
-    assert "test debug message" in err_buf.getvalue()
-    assert "test debug message" not in out_buf.getvalue()
+    captured = capsys.readouterr()
+    assert "test debug message" in captured.err
+    assert "test debug message" not in captured.out
 
 
 def test_dual_stream_handler_warning_goes_to_stderr(
-    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """DualStreamHandler should route WARNING level to stderr."""
     # --- setup ---
@@ -66,21 +60,17 @@ def test_dual_stream_handler_warning_goes_to_stderr(
     logger.setLevel(logging.WARNING)
     logger.addHandler(handler)
 
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-
     # --- execute ---
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
     logger.warning("test warning message")
 
     # --- verify ---
-    assert "test warning message" not in out_buf.getvalue()
-    assert "test warning message" in err_buf.getvalue()
+    captured = capsys.readouterr()
+    assert "test warning message" not in captured.out
+    assert "test warning message" in captured.err
 
 
 def test_dual_stream_handler_error_goes_to_stderr(
-    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """DualStreamHandler should route ERROR level to stderr."""
     # --- setup ---
@@ -89,21 +79,17 @@ def test_dual_stream_handler_error_goes_to_stderr(
     logger.setLevel(logging.ERROR)
     logger.addHandler(handler)
 
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-
     # --- execute ---
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
     logger.error("test error message")
 
     # --- verify ---
-    assert "test error message" not in out_buf.getvalue()
-    assert "test error message" in err_buf.getvalue()
+    captured = capsys.readouterr()
+    assert "test error message" not in captured.out
+    assert "test error message" in captured.err
 
 
 def test_dual_stream_handler_critical_goes_to_stderr(
-    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """DualStreamHandler should route CRITICAL level to stderr."""
     # --- setup ---
@@ -112,21 +98,17 @@ def test_dual_stream_handler_critical_goes_to_stderr(
     logger.setLevel(logging.CRITICAL)
     logger.addHandler(handler)
 
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-
     # --- execute ---
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
     logger.critical("test critical message")
 
     # --- verify ---
-    assert "test critical message" not in out_buf.getvalue()
-    assert "test critical message" in err_buf.getvalue()
+    captured = capsys.readouterr()
+    assert "test critical message" not in captured.out
+    assert "test critical message" in captured.err
 
 
 def test_dual_stream_handler_detail_goes_to_stdout(
-    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """DualStreamHandler should route DETAIL level to stdout."""
     # --- setup ---
@@ -135,21 +117,17 @@ def test_dual_stream_handler_detail_goes_to_stdout(
     logger.setLevel(mod_alogs.apathetic_logging.DETAIL_LEVEL)
     logger.addHandler(handler)
 
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-
     # --- execute ---
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
     logger.detail("test detail message")
 
     # --- verify ---
-    assert "test detail message" in out_buf.getvalue()
-    assert "test detail message" not in err_buf.getvalue()
+    captured = capsys.readouterr()
+    assert "test detail message" in captured.out
+    assert "test detail message" not in captured.err
 
 
 def test_dual_stream_handler_brief_goes_to_stdout(
-    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """DualStreamHandler should route BRIEF level to stdout."""
     # --- setup ---
@@ -158,17 +136,13 @@ def test_dual_stream_handler_brief_goes_to_stdout(
     logger.setLevel(mod_alogs.apathetic_logging.BRIEF_LEVEL)
     logger.addHandler(handler)
 
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-
     # --- execute ---
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
     logger.brief("test brief message")
 
     # --- verify ---
-    assert "test brief message" in out_buf.getvalue()
-    assert "test brief message" not in err_buf.getvalue()
+    captured = capsys.readouterr()
+    assert "test brief message" in captured.out
+    assert "test brief message" not in captured.err
 
 
 def test_dual_stream_handler_has_enable_color_attribute() -> None:
@@ -287,3 +261,202 @@ def test_dual_stream_handler_test_level_uses_effective_level(
         "WARNING messages should not be in bypass buffer. "
         f"Bypass buffer: {bypass_output[:200]}"
     )
+
+
+def test_dual_stream_handler_async_mode_flushes_on_close(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """async_mode should write records on the listener thread by close()."""
+    # --- setup ---
+    handler = mod_alogs.apathetic_logging.DualStreamHandler(async_mode=True)
+    writer = handler._writer  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    assert writer is not None
+    # A plain stdlib logger outside the logger tree: no manageHandlers() and
+    # no root handler, so the async writer is the only thing that can write
+    logger = logging.Logger("test_async")  # noqa: LOG001
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+
+    # --- execute ---
+    with mock.patch.object(writer, "emit", wraps=writer.emit) as writer_emit:
+        logger.info("test async info message")
+        logger.warning("test async warning message")
+        logger.removeHandler(handler)
+        handler.close()
+
+    # --- verify ---
+    captured = capsys.readouterr()
+    # The writer got both records, already formatted (TagFormatter tags
+    # included) by the logging thread
+    written = [call.args[0].getMessage() for call in writer_emit.call_args_list]
+    assert written[0] == "test async info message"
+    assert written[1].endswith("test async warning message")
+    assert "test async info message" in captured.out
+    assert "test async warning message" in captured.err
+    assert "test async info message" not in captured.err
+
+
+def test_dual_stream_handler_async_mode_formats_at_log_time() -> None:
+    """async_mode should write the arguments as they were at the logging call."""
+    # --- setup ---
+    handler = mod_alogs.apathetic_logging.DualStreamHandler(async_mode=True)
+    logger = logging.Logger("test_async_args")  # noqa: LOG001
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    items = ["a", "b"]
+    out_buf = io.StringIO()
+
+    # --- execute ---
+    with contextlib.redirect_stdout(out_buf):
+        logger.info("items=%s", items)
+        items[1] = "MUTATED"
+        handler.close()
+
+    # --- verify ---
+    assert "items=['a', 'b']" in out_buf.getvalue()
+    assert "MUTATED" not in out_buf.getvalue()
+
+
+def test_dual_stream_handler_async_mode_routes_at_log_time(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """async_mode should write to the stream that was current at the call.
+
+    The redirect ends before close() drains the queue; the record must still
+    land in the redirect target, not in the restored stdout.
+    """
+    # --- setup ---
+    handler = mod_alogs.apathetic_logging.DualStreamHandler(async_mode=True)
+    logger = logging.Logger("test_async_route")  # noqa: LOG001
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    out_buf = io.StringIO()
+
+    # --- execute ---
+    with contextlib.redirect_stdout(out_buf):
+        logger.info("test async redirected message")
+    handler.close()
+
+    # --- verify ---
+    assert "test async redirected message" in out_buf.getvalue()
+    assert "test async redirected message" not in capsys.readouterr().out
+
+
+def test_dual_stream_handler_falls_back_to_shared_tag_formatter() -> None:
+    """Handlers without a formatter should format with the shared TagFormatter."""
+    # --- setup ---
+    handler1 = mod_alogs.apathetic_logging.DualStreamHandler()
+    handler2 = mod_alogs.apathetic_logging.DualStreamHandler()
+    custom = mod_alogs.TagFormatter("%(levelname)s %(message)s")
+    record = logging.makeLogRecord(
+        {"name": "test_fallback", "levelno": logging.INFO, "levelname": "INFO"}
+    )
+    record.msg = "test fallback message"
+
+    # --- verify ---
+    # No formatter is set, so stdlib helpers can still fill one in
+    assert handler1.formatter is None
+    assert handler1.format(record) == "test fallback message"
+
+    # --- execute ---
+    handler2.setFormatter(custom)
+
+    # --- verify ---
+    assert handler2.formatter is custom
+    assert handler2.format(record) == "INFO test fallback message"
+    assert handler1.formatter is None
+
+
+def test_dual_stream_handler_basic_config_format_is_applied(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """basicConfig(format=...) should set the format on a DualStreamHandler."""
+    # --- setup ---
+    handler = mod_alogs.apathetic_logging.DualStreamHandler()
+
+    # --- execute ---
+    logging.basicConfig(
+        handlers=[handler],
+        format="FMT %(levelname)s %(message)s",
+        force=True,
+    )
+    logging.getLogger().warning("test basic config message")
+
+    # --- verify ---
+    captured = capsys.readouterr()
+    assert "FMT WARNING test basic config message" in captured.err
+
+
+def test_dual_stream_handler_user_handlers_each_write(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Handlers added by the user should all write, even to the same stream."""
+    # --- setup ---
+    logger = logging.Logger("test_each_write")  # noqa: LOG001
+    logger.setLevel(logging.INFO)
+    handlers = [
+        mod_alogs.apathetic_logging.DualStreamHandler(),
+        mod_alogs.apathetic_logging.DualStreamHandler(),
+    ]
+    for handler in handlers:
+        logger.addHandler(handler)
+
+    # --- execute ---
+    logger.info("test each write message")
+
+    # --- verify ---
+    captured = capsys.readouterr()
+    assert captured.out.count("test each write message") == len(handlers)
+
+
+def test_dual_stream_handler_async_mode_marks_before_queueing() -> None:
+    """An async handler should mark the record as emitted on the calling thread."""
+    # --- setup ---
+    handler = mod_alogs.apathetic_logging.DualStreamHandler(async_mode=True)
+    record = logging.makeLogRecord(
+        {"name": "test_async_mark", "levelno": logging.INFO, "msg": "test"}
+    )
+
+    # --- execute ---
+    handler.handle(record)
+    marked = getattr(record, "_apathetic_seen", False)
+    handler.close()
+
+    # --- verify ---
+    assert marked is True
+
+
+def test_managed_handlers_emit_once_with_corrupted_stream_cache(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Managed handlers should write each record once despite stale bookkeeping.
+
+    Root carries a second managed handler (as a copied root logger would),
+    and _last_stream_ids is forced to match the current streams so
+    manageHandlers() sees nothing to rebuild. The seen filter still keeps
+    the record from being written twice.
+    """
+    # --- setup ---
+    root = mod_alogs.getRootLogger()
+    root.setLevel(logging.INFO)
+    root.handlers.clear()
+    other = mod_alogs.Logger("test_once_other")
+    other.setPropagate(propagate=False)
+    other.manageHandlers(manage_handlers=True)
+    stale_handlers = list(other.handlers)
+    other.handlers.clear()
+
+    # --- execute ---
+    root.manageHandlers(manage_handlers=True)
+    for handler in stale_handlers:
+        root.addHandler(handler)
+    # corrupt the cache: claim the current streams are already handled
+    root._last_stream_ids = root._currentStreamRefs()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    root.info("test once message")
+
+    # --- verify ---
+    captured = capsys.readouterr()
+    managed = [h for h in root.handlers if isinstance(h, mod_alogs.DualStreamHandler)]
+    assert len(managed) > 1
+    assert captured.out.count("test once message") == 1
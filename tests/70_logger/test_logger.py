@@ -286,3 +286,40 @@ def test_log_dynamic_accepts_numeric_level(
     captured = capsys.readouterr()
     combined = (captured.out + captured.err).lower()
     assert "Numeric detail log works".lower() in combined
+
+
+def test_log_dynamic_filtered_level_skips_handler_management(
+    monkeypatch: pytest.MonkeyPatch,
+    direct_logger: Logger,
+) -> None:
+    """log_dynamic() below the logger level should not reach _log()."""
+    # --- setup ---
+    direct_logger.setLevel("INFO")
+    calls: list[bool | None] = []
+    monkeypatch.setattr(
+        direct_logger,
+        "manageHandlers",
+        lambda *, manage_handlers=None: calls.append(manage_handlers),
+    )
+
+    # --- execute ---
+    direct_logger.logDynamic("DEBUG", "filtered message")
+    direct_logger.logDynamic(logging.DEBUG, "filtered message")
+
+    # --- verify ---
+    assert calls == []
+
+    # --- execute ---
+    direct_logger.logDynamic("INFO", "emitted message")
+
+    # --- verify ---
+    assert calls == [None]
+
+
+def test_is_apathetic_marks_only_apathetic_loggers(
+    direct_logger: Logger,
+) -> None:
+    """IS_APATHETIC should be set on apathetic loggers and absent on stdlib ones."""
+    # --- verify ---
+    assert direct_logger.IS_APATHETIC is True
+    assert not hasattr(logging.Logger, "IS_APATHETIC")
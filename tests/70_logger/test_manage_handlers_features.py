@@ -52,7 +52,7 @@ def test_manage_handlers_does_not_remove_manually_added_handlers() -> None:
 
     # --- execute ---
     # Trigger manageHandlers by logging
-    # Since _last_stream_ids is None, it shouldn't remove the handler
+    # manageHandlers() didn't create the handler, so it shouldn't remove it
     child.info("test message")
 
     # --- verify ---
@@ -61,6 +61,37 @@ def test_manage_handlers_does_not_remove_manually_added_handlers() -> None:
     assert isinstance(child.handlers[0], mod_alogs.DualStreamHandler)
 
 
+def test_manage_handlers_keeps_user_dual_stream_handler() -> None:
+    """manageHandlers() should not replace a user's DualStreamHandler.
+
+    On a non-propagating logger it adds its own handler next to the user's
+    one instead of removing and closing it (which would stop an async
+    handler's listener).
+    """
+    # --- setup ---
+    child = mod_alogs.Logger("test_manage_keep_user_dual")
+    child.setPropagate(propagate=False)
+    child.handlers.clear()
+    user_handler = mod_alogs.DualStreamHandler(async_mode=True)
+    child.addHandler(user_handler)
+
+    # --- execute ---
+    # Trigger manageHandlers by logging
+    child.info("test message")
+
+    # --- verify ---
+    try:
+        assert user_handler in child.handlers
+        assert user_handler._listener is not None  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        assert any(
+            isinstance(h, mod_alogs.DualStreamHandler) and h is not user_handler
+            for h in child.handlers
+        )
+    finally:
+        child.removeHandler(user_handler)
+        user_handler.close()
+
+
 def test_manage_handlers_removes_previously_managed_handlers() -> None:
     """manageHandlers() should remove handlers it previously managed.
 
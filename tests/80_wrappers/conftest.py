@@ -0,0 +1,124 @@
+# tests/80_wrappers/conftest.py
+"""Shared fixtures for module-level wrapper tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import apathetic_logging as mod_alogs
+from tests.utils import MODULE_STD_CAMEL_TESTS
+
+
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+# ----------------------------------------------------------------------
+# Parametrization
+# ----------------------------------------------------------------------
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize camelCase wrapper tests from MODULE_STD_CAMEL_TESTS.
+
+    Applies to tests requesting ``std_camel_wrappers``. Tests that take
+    ``targ_version`` get the version-gated rows, all others get the rest.
+    Tests that take ``stdlib_mock`` receive the (module, attr) target
+    indirectly. For gated rows, a collection-time skip covers stdlib
+    functions missing on this interpreter.
+    """
+    if "std_camel_wrappers" not in metafunc.fixturenames:
+        return
+
+    gated = "targ_version" in metafunc.fixturenames
+    mocked = "stdlib_mock" in metafunc.fixturenames
+    argnames = ["func_name", "args", "kwargs"]
+    if gated:
+        argnames.append("targ_version")
+    if mocked:
+        argnames.append("stdlib_mock")
+
+    params: list[Any] = []
+    for name, args, kwargs, mock_target, version in MODULE_STD_CAMEL_TESTS:
+        if (version is not None) is not gated:
+            continue
+        values: list[object] = [name, args, kwargs]
+        marks: list[pytest.MarkDecorator] = []
+        if version is not None:
+            values.append(version)
+        if mocked:
+            values.append(mock_target)
+            if version is not None:
+                marks.append(
+                    pytest.mark.skipif(
+                        not hasattr(*mock_target),
+                        reason=f"{name} requires Python {version[0]}.{version[1]}+",
+                    )
+                )
+        params.append(pytest.param(*values, id=name, marks=marks))
+
+    metafunc.parametrize(
+        argnames, params, indirect=["stdlib_mock"] if mocked else False
+    )
+
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture
+def dual_stream_root_logger() -> Generator[Logger, None, None]:
+    """Root logger whose only handler is the library's managed DualStreamHandler.
+
+    The test only needs to set the level and call the function under test.
+    The handler is the one manageHandlers() attaches (a DualStreamHandler
+    with the shared TagFormatter); if the streams change before the first
+    log call, manageHandlers() swaps it for a fresh one of the same kind.
+
+    Note: stdout/stderr are not patched here. Pytest re-installs its own
+    sys.stdout between fixture setup and the test call, so use capsys
+    inside the test body to read the output.
+    """
+    root_logger = mod_alogs.getLogger("")
+    root_logger.handlers.clear()
+    root_logger.manageHandlers(manage_handlers=True)
+
+    yield root_logger
+
+    root_logger.handlers.clear()
+
+
+@pytest.fixture(scope="session")
+def std_camel_wrappers() -> dict[str, Callable[..., Any]]:
+    """Map each camelCase wrapper name to the apathetic_logging function.
+
+    Resolved once per session instead of on every parametrized row.
+    """
+    return {
+        func_name: getattr(mod_alogs, func_name)
+        for func_name, _, _, _, _ in MODULE_STD_CAMEL_TESTS
+    }
+
+
+@pytest.fixture
+def stdlib_mock(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> MagicMock:
+    """Replace the (module, attribute) given via indirect parametrize with a mock.
+
+    The mock is only built when the row actually runs. The wrappers look up
+    logging.<func> at call time, so patching the stdlib module attribute is
+    enough.
+    """
+    module, attr_name = request.param
+    mock_func = MagicMock()
+    monkeypatch.setattr(module, attr_name, mock_func)
+    return mock_func
@@ -1,4 +1,4 @@
-# tests/70_wrappers/test_module_custom_levels.py
+# tests/80_wrappers/test_module_custom_levels.py
 """Test module-level custom level convenience functions (trace, detail, brief)."""
 
 from __future__ import annotations
@@ -7,7 +7,7 @@ import io
 import sys
 from typing import TYPE_CHECKING
 
-import pytest  # noqa: TC002
+import pytest
 
 import apathetic_logging as mod_alogs
 
@@ -34,201 +34,57 @@ def test_module_custom_level_functions_exist() -> None:
     )
 
 
-def test_trace_logs_to_root_logger(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that trace() logs to root logger at TRACE level."""
-    # --- setup ---
-    # Capture output
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
-
-    # Get root logger and configure it
-    root_logger = mod_alogs.getLogger("")
-    root_logger.setLevel("TRACE")
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    root_logger.addHandler(handler)
-
-    # --- execute ---
-    mod_alogs.trace("test trace message")
-
-    # --- verify ---
-    output = err_buf.getvalue()
-    assert "test trace message" in output
-    # Tag might not be present if formatter isn't fully configured,
-    # but message should be there. The important thing is that the
-    # function works and logs at TRACE level
-
-
-def test_detail_logs_to_root_logger(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that detail() logs to root logger at DETAIL level."""
-    # --- setup ---
-    # Capture output
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
-
-    # Get root logger and configure it
-    root_logger = mod_alogs.getLogger("")
-    root_logger.setLevel("DETAIL")
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    handler.setFormatter(mod_alogs.TagFormatter())
-    root_logger.addHandler(handler)
-
-    # --- execute ---
-    mod_alogs.detail("test detail message")
-
-    # --- verify ---
-    output = out_buf.getvalue()  # DETAIL goes to stdout like INFO
-    assert "test detail message" in output
-
-
-def test_brief_logs_to_root_logger(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that brief() logs to root logger at BRIEF level."""
-    # --- setup ---
-    # Capture output
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
-
-    # Get root logger and configure it
-    root_logger = mod_alogs.getLogger("")
-    root_logger.setLevel("BRIEF")
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    handler.setFormatter(mod_alogs.TagFormatter())
-    root_logger.addHandler(handler)
-
-    # --- execute ---
-    mod_alogs.brief("test brief message")
-
-    # --- verify ---
-    output = out_buf.getvalue()  # BRIEF goes to stdout like INFO
-    assert "test brief message" in output
-
-
-def test_trace_respects_log_level(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that trace() respects log level setting."""
-    # --- setup ---
-    # Capture output
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
-
-    # Get root logger and configure it
-    root_logger = mod_alogs.getLogger("")
-    root_logger.setLevel("INFO")  # Set to INFO, so TRACE should not log
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    handler.setFormatter(mod_alogs.TagFormatter())
-    root_logger.addHandler(handler)
-
-    # --- execute ---
-    mod_alogs.trace("test trace message - should not appear")
-
-    # --- verify ---
-    output = err_buf.getvalue()
-    assert "test trace message - should not appear" not in output
-
-
-def test_detail_respects_log_level(
-    monkeypatch: pytest.MonkeyPatch,
+# Format: (function_name, logger_level, stream, should_log)
+# TRACE goes to stderr; DETAIL and BRIEF go to stdout like INFO
+CUSTOM_LEVEL_LOG_CASES: list[tuple[str, str, str, bool]] = [
+    ("trace", "TRACE", "stderr", True),
+    ("detail", "DETAIL", "stdout", True),
+    ("brief", "BRIEF", "stdout", True),
+    ("trace", "INFO", "stderr", False),
+    ("detail", "INFO", "stdout", False),
+    ("brief", "WARNING", "stdout", False),
+]
+
+
+@pytest.mark.parametrize(
+    ("func_name", "level", "stream", "should_log"),
+    CUSTOM_LEVEL_LOG_CASES,
+    ids=[
+        f"{func_name}-{level.lower()}"
+        for func_name, level, _, _ in CUSTOM_LEVEL_LOG_CASES
+    ],
+)
+def test_custom_level_function_logs_to_root_logger(
+    func_name: str,
+    level: str,
+    stream: str,
+    *,
+    should_log: bool,
+    dual_stream_root_logger: Logger,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
-    """Test that detail() respects log level setting."""
+    """Test that trace()/detail()/brief() log to root logger and respect its level."""
     # --- setup ---
-    # Capture output
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
-
-    # Get root logger and configure it
-    root_logger = mod_alogs.getLogger("")
-    root_logger.setLevel("INFO")  # Set to INFO, so DETAIL should not log
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    handler.setFormatter(mod_alogs.TagFormatter())
-    root_logger.addHandler(handler)
+    dual_stream_root_logger.setLevel(level)
+    message = f"test {func_name} message at {level}"
 
     # --- execute ---
-    mod_alogs.detail("test detail message - should not appear")
+    getattr(mod_alogs, func_name)(message)
 
     # --- verify ---
-    output = out_buf.getvalue()
-    assert "test detail message - should not appear" not in output
-
-
-def test_brief_respects_log_level(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that brief() respects log level setting."""
-    # --- setup ---
-    # Capture output
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
-
-    # Get root logger and configure it
-    root_logger = mod_alogs.getLogger("")
-    root_logger.setLevel("WARNING")  # Set to WARNING, so BRIEF should not log
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    handler.setFormatter(mod_alogs.TagFormatter())
-    root_logger.addHandler(handler)
-
-    # --- execute ---
-    mod_alogs.brief("test brief message - should not appear")
-
-    # --- verify ---
-    output = out_buf.getvalue()
-    assert "test brief message - should not appear" not in output
+    captured = capsys.readouterr()
+    output = captured.out if stream == "stdout" else captured.err
+    assert (message in output) is should_log
 
 
 def test_custom_level_functions_work_with_format_args(
-    monkeypatch: pytest.MonkeyPatch,
+    dual_stream_root_logger: Logger,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
     """Test that custom level functions support format arguments."""
     # --- setup ---
-    # Capture output
-    out_buf = io.StringIO()
-    err_buf = io.StringIO()
-    monkeypatch.setattr(sys, "stdout", out_buf)
-    monkeypatch.setattr(sys, "stderr", err_buf)
-
-    # Get root logger and configure it
-    root_logger = mod_alogs.getLogger("")
+    root_logger = dual_stream_root_logger
     root_logger.setLevel("TRACE")
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    root_logger.addHandler(handler)
 
     # --- execute ---
     mod_alogs.trace("test %s message with %d args", "trace", 2)
@@ -236,14 +92,16 @@ def test_custom_level_functions_work_with_format_args(
     mod_alogs.brief("test %s message with %d args", "brief", 2)
 
     # --- verify ---
-    err_output = err_buf.getvalue()
-    out_output = out_buf.getvalue()
+    captured = capsys.readouterr()
+    err_output = captured.err
+    out_output = captured.out
     assert "test trace message with 2 args" in err_output
     assert "test detail message with 2 args" in out_output
     assert "test brief message with 2 args" in out_output
 
 
 def test_test_logs_to_root_logger(
+    dual_stream_root_logger: Logger,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that test() logs to root logger at TEST level."""
@@ -252,39 +110,21 @@ def test_test_logs_to_root_logger(
     # to bypass pytest capture, so we need to patch __stderr__ to capture them
     bypass_buf = io.StringIO()
     monkeypatch.setattr(sys, "__stderr__", bypass_buf)
-
-    # Get root logger and configure it
     # Must use TEST level (not TRACE) because TEST > TRACE, so TRACE won't log TEST
-    root_logger = mod_alogs.getLogger("")
-    original_level = root_logger.level
-    root_logger.setLevel("TEST")
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    handler.setFormatter(mod_alogs.TagFormatter("%(message)s"))
-    root_logger.addHandler(handler)
+    dual_stream_root_logger.setLevel("TEST")
 
     # --- execute ---
     # Call test() directly on the logger to ensure it uses our configured logger
-    root_logger.test("test test message")
+    dual_stream_root_logger.test("test test message")
 
     # --- verify ---
     # TEST messages go to __stderr__ when logger level is TEST
     output = bypass_buf.getvalue()
     assert "test test message" in output
-    # Tag might not be present if formatter isn't fully configured,
-    # but message should be there. The important thing is that the
-    # function works and logs at TEST level
-
-    # --- cleanup ---
-    root_logger.setLevel(original_level)
-    # Tag might not be present if formatter isn't fully configured,
-    # but message should be there. The important thing is that the
-    # function works and logs at TEST level
 
 
 def test_test_logs_at_most_verbose_level(
+    dual_stream_root_logger: Logger,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that test() logs at TEST level (most verbose)."""
@@ -293,27 +133,11 @@ def test_test_logs_at_most_verbose_level(
     # to bypass pytest capture, so we need to patch __stderr__ to capture them
     bypass_buf = io.StringIO()
     monkeypatch.setattr(sys, "__stderr__", bypass_buf)
-
-    # Get root logger and configure it
-    # Must use TEST level (not TRACE) because TEST > TRACE, so TRACE won't log TEST
-    root_logger = mod_alogs.getLogger("")
-    original_level = root_logger.level
-    root_logger.setLevel("TEST")  # Set to TEST level so TEST messages will log
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-    # Add a handler to capture output
-    handler = mod_alogs.DualStreamHandler()
-    handler.setFormatter(mod_alogs.TagFormatter())
-    root_logger.addHandler(handler)
+    dual_stream_root_logger.setLevel("TEST")  # TEST is the most verbose level
 
     # --- execute ---
-    # Call test() directly on the logger to ensure it uses our configured logger
-    root_logger.test("test test message - should appear")
+    dual_stream_root_logger.test("test test message - should appear")
 
     # --- verify ---
-    # TEST messages go to __stderr__ when logger level is TEST
     output = bypass_buf.getvalue()
     assert "test test message - should appear" in output
-
-    # --- cleanup ---
-    root_logger.setLevel(original_level)
@@ -1,14 +1,12 @@
-# tests/70_snake/test_module_std_camel.py
+# tests/80_wrappers/test_module_std_camel.py
 """Test module-level stdlib camelCase convenience functions."""
 
 from __future__ import annotations
 
-import logging
-import sys
-from contextlib import suppress
-from unittest.mock import MagicMock
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock, call
 
-import apathetic_utils
 import pytest
 from apathetic_testing import create_mock_version_info
 
@@ -16,8 +14,7 @@ import apathetic_logging as mod_alogs
 import apathetic_logging.constants as mod_constants
 import apathetic_logging.logging_utils as mod_logging_utils
 import apathetic_logging.registry_data as mod_registry_data
-from tests.utils import PATCH_STITCH_HINTS, PROGRAM_PACKAGE
-from tests.utils.level_validation import validate_test_level
+from tests.utils import MODULE_STD_CAMEL_TESTS
 
 
 TARGET_PYTHON_VERSION = (
@@ -25,177 +22,90 @@ TARGET_PYTHON_VERSION = (
 )
 
 
-# Safe test level value (26 is between BRIEF=25 and WARNING=30)
-TEST_LEVEL_VALUE = 26
-validate_test_level(TEST_LEVEL_VALUE)
-
-# List of all stdlib module-level camelCase functions and their test parameters
-# Format: (function_name, args, kwargs, mock_target, target_python_version)
-# target_python_version is (major, minor) tuple or None if available in
-# TARGET_PYTHON_VERSION+
-MODULE_STD_CAMEL_TESTS: list[
-    tuple[str, tuple[object, ...], dict[str, object], str, tuple[int, int] | None]
-] = [
-    ("basicConfig", (), {}, "logging.basicConfig", None),
-    (
-        "addLevelName",
-        (TEST_LEVEL_VALUE, "CUSTOM_TEST_LEVEL"),
-        {},
-        "logging.addLevelName",
-        None,
-    ),
-    ("getLevelName", (logging.DEBUG,), {}, "logging.getLevelName", None),
-    ("getLevelNamesMapping", (), {}, "logging.getLevelNamesMapping", (3, 11)),
-    ("getLoggerClass", (), {}, "logging.getLoggerClass", None),
-    ("setLoggerClass", (object,), {}, "logging.setLoggerClass", None),
-    ("getLogRecordFactory", (), {}, "logging.getLogRecordFactory", None),
-    ("setLogRecordFactory", (object,), {}, "logging.setLogRecordFactory", None),
-    ("shutdown", (), {}, "logging.shutdown", None),
-    ("disable", (logging.DEBUG,), {}, "logging.disable", None),
-    ("captureWarnings", (True,), {}, "logging.captureWarnings", None),
-    ("critical", ("test",), {}, "logging.critical", None),
-    ("debug", ("test",), {}, "logging.debug", None),
-    ("error", ("test",), {}, "logging.error", None),
-    ("exception", ("test",), {"exc_info": True}, "logging.exception", None),
-    ("fatal", ("test",), {}, "logging.fatal", None),
-    ("info", ("test",), {}, "logging.info", None),
-    ("log", (logging.INFO, "test"), {}, "logging.log", None),
-    ("warn", ("test",), {}, "logging.warning", None),
-    ("warning", ("test",), {}, "logging.warning", None),
-    ("getLogger", ("test",), {}, "logging.getLogger", None),
-    ("makeLogRecord", ({"name": "test"},), {}, "logging.makeLogRecord", None),
-    ("currentframe", (), {}, "logging.currentframe", None),
-    ("getHandlerNames", (), {}, "logging.getHandlerNames", (3, 12)),
-    ("getHandlerByName", ("test",), {}, "logging.getHandlerByName", (3, 12)),
-]
-
-
-@pytest.mark.parametrize(
-    ("func_name", "args", "kwargs", "mock_target"),
-    [
-        (name, args, kwargs, target)
-        for name, args, kwargs, target, version in MODULE_STD_CAMEL_TESTS
-        if version is None
-    ],
-)
 def test_module_std_camel_function_calls_underlying(
     func_name: str,
     args: tuple[object, ...],
     kwargs: dict[str, object],
-    mock_target: str,
-    monkeypatch: pytest.MonkeyPatch,
+    stdlib_mock: MagicMock,
+    std_camel_wrappers: dict[str, Callable[..., Any]],
 ) -> None:
     """Test camelCase functions call underlying stdlib function.
 
     This tests camelCase wrappers that don't have version requirements.
+    Rows are generated by pytest_generate_tests in conftest.py.
     """
-    # Get the camelCase function
-    camel_func = getattr(mod_alogs, func_name)
-    assert camel_func is not None
-
-    # Mock the underlying function and verify it's called
-    module_name, func_name_in_module = mock_target.rsplit(".", 1)
-    assert module_name == "logging", f"Expected logging module, got {module_name}"
-
-    mock_func = MagicMock()
-    apathetic_utils.patch_everywhere(
-        monkeypatch,
-        logging,
-        func_name_in_module,
-        mock_func,
-        package_prefix=PROGRAM_PACKAGE,
-        stitch_hints=PATCH_STITCH_HINTS,
-        create_if_missing=True,
-    )
+    camel_func = std_camel_wrappers[func_name]
+    # pytest's logging plugin calls logging.getLogger() between fixture setup
+    # and the test call; only count calls made by the wrapper
+    stdlib_mock.reset_mock()
 
-    # Call the camelCase function (suppress exceptions from logging operations)
-    with suppress(Exception):
-        camel_func(*args, **kwargs)
+    # Call the camelCase function
+    camel_func(*args, **kwargs)
 
     # Verify the underlying function was called
-    mock_func.assert_called_once_with(*args, **kwargs)
+    assert stdlib_mock.call_count == 1, stdlib_mock.mock_calls
+    assert stdlib_mock.call_args == call(*args, **kwargs)
 
 
-@pytest.mark.parametrize(
-    ("func_name", "args", "kwargs", "mock_target", "targ_version"),
-    [
-        (name, args, kwargs, target, version)
-        for name, args, kwargs, target, version in MODULE_STD_CAMEL_TESTS
-        if version is not None
-    ],
-)
-def test_module_std_camel_function_version_gated(
+def test_module_std_camel_function_version_gated_raises(
     func_name: str,
     args: tuple[object, ...],
     kwargs: dict[str, object],
-    mock_target: str,
     targ_version: tuple[int, int],
+    std_camel_wrappers: dict[str, Callable[..., Any]],
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test version-gated camelCase functions.
-
-    Verifies functions raise NotImplementedError on older Python versions
-    and work correctly when version requirements are met.
-    """
-    # Get the camelCase function
-    camel_func = getattr(mod_alogs, func_name)
-    assert camel_func is not None
-
-    # Test NotImplementedError on older version
-    older_version = (targ_version[0], targ_version[1] - 1)
+    """Test version-gated camelCase functions raise on older Python versions."""
+    # --- setup ---
+    camel_func = std_camel_wrappers[func_name]
     _registry = mod_registry_data.ApatheticLogging_Internal_RegistryData
-    original_target = _registry.registered_internal_target_python_version
-    _registry.registered_internal_target_python_version = older_version
+    older_version = (targ_version[0], targ_version[1] - 1)
+    # (monkeypatch restores the registry and version_info at teardown)
+    monkeypatch.setattr(
+        _registry, "registered_internal_target_python_version", older_version
+    )
     monkeypatch.setattr(
         mod_logging_utils.sys,  # type: ignore[attr-defined]
         "version_info",
         create_mock_version_info(older_version[0], older_version[1], 0),
     )
 
-    try:
-        with pytest.raises(NotImplementedError):
-            camel_func(*args, **kwargs)
-    finally:
-        _registry.registered_internal_target_python_version = original_target
-        monkeypatch.undo()
-
-    # Test success case on sufficient version
-    # Always set target version to the required version for success case
-    _registry.registered_internal_target_python_version = targ_version
-    if sys.version_info < targ_version:
-        monkeypatch.setattr(
-            mod_logging_utils.sys,  # type: ignore[attr-defined]
-            "version_info",
-            create_mock_version_info(targ_version[0], targ_version[1], 0),
-        )
-
-    try:
-        module_name, func_name_in_module = mock_target.rsplit(".", 1)
-        assert module_name == "logging"
-
-        mock_func = MagicMock()
-        apathetic_utils.patch_everywhere(
-            monkeypatch,
-            logging,
-            func_name_in_module,
-            mock_func,
-            package_prefix=PROGRAM_PACKAGE,
-            stitch_hints=PATCH_STITCH_HINTS,
-            create_if_missing=True,
-        )
-
-        with suppress(Exception):
-            camel_func(*args, **kwargs)
-
-        mock_func.assert_called_once_with(*args, **kwargs)
-    finally:
-        _registry.registered_internal_target_python_version = original_target
-        monkeypatch.undo()
-
-
-def test_module_std_camel_function_exists() -> None:
-    """Verify all expected camelCase functions exist on apathetic_logging."""
-    for func_name, _, _, _, _ in MODULE_STD_CAMEL_TESTS:
-        assert hasattr(mod_alogs, func_name), (
-            f"Function {func_name} should exist on apathetic_logging"
-        )
+    # --- execute and verify ---
+    with pytest.raises(NotImplementedError):
+        camel_func(*args, **kwargs)
+
+
+def test_module_std_camel_function_version_gated_calls_underlying(
+    func_name: str,
+    args: tuple[object, ...],
+    kwargs: dict[str, object],
+    targ_version: tuple[int, int],
+    stdlib_mock: MagicMock,
+    std_camel_wrappers: dict[str, Callable[..., Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test version-gated camelCase functions call stdlib when supported."""
+    # --- setup ---
+    camel_func = std_camel_wrappers[func_name]
+    _registry = mod_registry_data.ApatheticLogging_Internal_RegistryData
+    monkeypatch.setattr(
+        _registry, "registered_internal_target_python_version", targ_version
+    )
+    stdlib_mock.reset_mock()
+
+    # --- execute ---
+    camel_func(*args, **kwargs)
+
+    # --- verify ---
+    assert stdlib_mock.call_count == 1, stdlib_mock.mock_calls
+    assert stdlib_mock.call_args == call(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "func_name", [name for name, _, _, _, _ in MODULE_STD_CAMEL_TESTS]
+)
+def test_module_std_camel_function_exists(func_name: str) -> None:
+    """Verify each expected camelCase function exists on apathetic_logging."""
+    assert hasattr(mod_alogs, func_name), (
+        f"Function {func_name} should exist on apathetic_logging"
+    )
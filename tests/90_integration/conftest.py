@@ -0,0 +1,180 @@
+# tests/90_integration/conftest.py
+"""Shared fixtures for integration tests."""
+
+import logging
+import subprocess
+import sys
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import apathetic_logging as mod_alogs
+from tests.utils.build_cache import (
+    build_cache_path,
+    compile_build,
+    find_build_command,
+    store_build,
+)
+from tests.utils.constants import PROJ_ROOT
+from tests.utils.prepared_logging import PreparedLogging
+
+
+# ----------------------------------------------------------------------
+# Build helpers
+# ----------------------------------------------------------------------
+# The builds run in a subprocess on purpose: serger and zipbundler both log
+# through apathetic_logging, so calling their main() in-process would use the
+# copy under test (swapped in by runtime_swap) and leave their registered
+# logger name, logger class and root handlers behind in this session.
+# Each build runs at most once per session, and not at all on a cache hit.
+
+
+def _build_serger(build_dir: Path) -> Path:
+    """Stitch the project with its .serger.jsonc config (or reuse the cache).
+
+    The stitched header embeds the project version from pyproject.toml, so
+    that file is part of the cache key along with the config. The cached
+    script is also byte-compiled once, so loading it skips compile().
+    """
+    config_file = PROJ_ROOT / ".serger.jsonc"
+    cached_file = build_cache_path(
+        "serger",
+        "apathetic_logging.py",
+        config_file,
+        PROJ_ROOT / "pyproject.toml",
+    )
+    if cached_file.exists():
+        compile_build(cached_file)
+        return cached_file
+
+    output_file = build_dir / "apathetic_logging.py"
+
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "serger",
+            "--config",
+            str(config_file),
+            "--out",
+            str(output_file),
+        ],
+        cwd=PROJ_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        pytest.fail(
+            f"Serger failed with return code {result.returncode}.\n"
+            f"stderr: {result.stderr.decode()}"
+        )
+
+    if not output_file.exists():
+        pytest.fail(f"Stitched file not created at {output_file}")
+
+    store_build(output_file, cached_file)
+    compile_build(cached_file)
+    return cached_file
+
+
+def _build_zipapp(build_dir: Path) -> Path:
+    """Bundle src/ into a zipapp with zipbundler (or reuse the cache).
+
+    zipbundler reads its settings from pyproject.toml, so that file is part
+    of the cache key.
+    """
+    cached_file = build_cache_path(
+        "zipbundler", "apathetic_logging.pyz", PROJ_ROOT / "pyproject.toml"
+    )
+    if cached_file.exists():
+        return cached_file
+
+    zipapp_file = build_dir / "apathetic_logging.pyz"
+
+    zipbundler_cmd = find_build_command("zipbundler")
+    result = subprocess.run(  # noqa: S603
+        [
+            *zipbundler_cmd,
+            "-o",
+            str(zipapp_file),
+            "-q",
+            "src",
+        ],
+        cwd=PROJ_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        pytest.fail(
+            f"Zipbundler failed with return code {result.returncode}.\n"
+            f"stderr: {result.stderr.decode()}"
+        )
+
+    if not zipapp_file.exists():
+        pytest.fail(f"Zipapp file not created at {zipapp_file}")
+
+    return store_build(zipapp_file, cached_file)
+
+
+# ----------------------------------------------------------------------
+# Fixtures
+# ----------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session")
+def artifact_builds(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[dict[str, Future[Path]], None, None]:
+    """Start the serger and zipbundler builds concurrently, once per session.
+
+    Both builds are subprocess-bound, so running them on two threads overlaps
+    their wall time. Requesting either artifact fixture starts both; the
+    other one is usually finished by the time its test asks for it.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield {
+            "serger": pool.submit(_build_serger, tmp_path_factory.mktemp("serger")),
+            "zipbundler": pool.submit(
+                _build_zipapp, tmp_path_factory.mktemp("zipbundler")
+            ),
+        }
+
+
+@pytest.fixture(scope="session")
+def serger_stitched_file(artifact_builds: dict[str, Future[Path]]) -> Path:
+    """The project's single-file script built with serger.
+
+    Uses the project's actual .serger.jsonc config, writing into a session
+    temp directory so dist/ (used by RUNTIME_MODE=stitched) is left alone.
+    Reuses a cached build when src/, the config, pyproject.toml and serger
+    are unchanged.
+    """
+    return artifact_builds["serger"].result()
+
+
+@pytest.fixture(scope="session")
+def zipapp_built_file(artifact_builds: dict[str, Future[Path]]) -> Path:
+    """apathetic_logging built as a zipapp with zipbundler.
+
+    Reuses a cached build when src/, pyproject.toml and zipbundler are
+    unchanged.
+    """
+    return artifact_builds["zipbundler"].result()
+
+
+@pytest.fixture
+def prepared_logging(atest_isolated_logging: Any) -> PreparedLogging:
+    """Isolated logging state with the root logger at DEBUG.
+
+    Also provides a factory for DEBUG child loggers (PreparedLogging.get_child).
+    """
+    root = mod_alogs.getRootLogger()
+    root.setLevel(logging.DEBUG)
+    return PreparedLogging(root=root, isolation=atest_isolated_logging)
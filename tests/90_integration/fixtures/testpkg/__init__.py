@@ -0,0 +1,2 @@
+# tests/90_integration/fixtures/testpkg/__init__.py
+"""Test package."""
@@ -0,0 +1,8 @@
+# tests/90_integration/fixtures/testpkg/module.py
+"""Test module."""
+
+value = 42
+
+
+def main() -> None:
+    print("testpkg")
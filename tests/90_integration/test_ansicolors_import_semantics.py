@@ -14,7 +14,9 @@ and mode_verify/stitched_example/stitched_run.py, but as a pytest integration te
 that runs in both runtime modes.
 """
 
-import apathetic_logging as mod_alogs
+import importlib
+
+from tests.utils import assert_ansi_colors
 
 
 def test_import_semantics_work_in_all_runtime_modes() -> None:
@@ -28,34 +30,11 @@ def test_import_semantics_work_in_all_runtime_modes() -> None:
     the module is loaded from src/ (package) or dist/apathetic_logging.py
     (stitched).
     """
-    # --- setup ---
-    # Expected ANSI escape code for RED (used as example to verify import semantics)
-    expected_red_code = "\033[91m"
-    expected_reset_code = "\033[0m"
-    test_text = "Hello, world!"
-
     # --- execute ---
-    # Verify import semantics: ANSIColors should be accessible via the module
-    # This tests that the import mechanism works correctly in the current runtime mode
-    red_color = mod_alogs.ANSIColors.RED
-    reset_color = mod_alogs.ANSIColors.RESET
-
-    # Build colored string (replicating mode_verify test pattern)
-    # This verifies the imported value is correct and usable
-    colored_string = red_color + test_text + reset_color
-    expected_colored = expected_red_code + test_text + expected_reset_code
+    # Resolve the package through the import system inside the test so the
+    # check exercises whichever module the current runtime mode installed
+    mod_alogs = importlib.import_module("apathetic_logging")
 
     # --- verify ---
-    # Verify the imported value is correct (validates import semantics worked)
-    assert red_color == expected_red_code, (
-        f"ANSIColors.RED should be {expected_red_code!r}, got {red_color!r}"
-    )
-
-    assert reset_color == expected_reset_code, (
-        f"ANSIColors.RESET should be {expected_reset_code!r}, got {reset_color!r}"
-    )
-
-    # Verify the imported values work correctly when used
-    assert colored_string == expected_colored, (
-        f"Colored string should be {expected_colored!r}, got {colored_string!r}"
-    )
+    # ANSIColors should be accessible and correct in the current runtime mode
+    assert_ansi_colors(mod_alogs)
@@ -10,18 +10,37 @@ Tests both serger (single-file .py) and zipbundler (zipapp .pyz) builds.
 """
 
 import json
+import shutil
 import subprocess
 import sys
-import tempfile
 import zipfile
 from pathlib import Path
 
-import apathetic_utils as mod_utils
 import pytest
 
+from tests.utils.build_cache import find_build_command
 from tests.utils.constants import PROJ_ROOT
 
 
+#: Minimal package (tracked in fixtures/) copied into each sample-code build
+SAMPLE_PKG_DIR = Path(__file__).parent / "fixtures" / "testpkg"
+
+#: Serger config for the sample package, serialized once at import
+SAMPLE_SERGER_CONFIG = json.dumps(
+    {
+        "package": "testpkg",
+        "include": ["src/testpkg/**/*.py"],
+        "out": "dist/testpkg.py",
+        "disable_build_timestamp": True,
+    },
+    indent=2,
+)
+
+
+# Each test shells out to serger/zipbundler; skipped by `poe test:fast`
+pytestmark = pytest.mark.slow
+
+
 # ============================================================================
 # Basic tool tests with sample code (verify tools work correctly)
 # ============================================================================
@@ -29,6 +48,7 @@ from tests.utils.constants import PROJ_ROOT
 
 def test_serger_build_with_sample_code_is_deterministic(
     tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that serger produces deterministic output with sample code.
@@ -37,85 +57,75 @@ def test_serger_build_with_sample_code_is_deterministic(
     """
     # --- setup ---
     # Create a minimal test package structure
-    pkg_dir = tmp_path / "src" / "testpkg"
-    pkg_dir.mkdir(parents=True)
-    (pkg_dir / "__init__.py").write_text('"""Test package."""\n')
-    (pkg_dir / "module.py").write_text('"""Test module."""\n\nvalue = 42\n')
+    shutil.copytree(
+        SAMPLE_PKG_DIR,
+        tmp_path / "src" / "testpkg",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
 
     # Create serger config with disable_build_timestamp
     config = tmp_path / ".serger.jsonc"
-    config_data = {
-        "package": "testpkg",
-        "include": ["src/testpkg/**/*.py"],
-        "out": "dist/testpkg.py",
-        "disable_build_timestamp": True,
-    }
-    config.write_text(json.dumps(config_data, indent=2))
+    config.write_text(SAMPLE_SERGER_CONFIG)
+    config_str = str(config)
 
     monkeypatch.chdir(tmp_path)
 
-    # Use temp directories for builds
-    with tempfile.TemporaryDirectory() as build_dir1:
-        build_path1 = Path(build_dir1)
-        output_file1 = build_path1 / "testpkg.py"
-
-        # --- execute: first build ---
-        result1 = subprocess.run(  # noqa: S603
-            [
-                sys.executable,
-                "-m",
-                "serger",
-                "--config",
-                str(config),
-                "--out",
-                str(output_file1),
-            ],
-            cwd=tmp_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result1.returncode == 0, (
-            f"First build failed: {result1.stdout}\n{result1.stderr}"
-        )
-        assert output_file1.exists(), "First build output file not created"
-
-        # --- execute: second build ---
-        with tempfile.TemporaryDirectory() as build_dir2:
-            build_path2 = Path(build_dir2)
-            output_file2 = build_path2 / "testpkg.py"
-
-            result2 = subprocess.run(  # noqa: S603
-                [
-                    sys.executable,
-                    "-m",
-                    "serger",
-                    "--config",
-                    str(config),
-                    "--out",
-                    str(output_file2),
-                ],
-                cwd=tmp_path,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            assert result2.returncode == 0, (
-                f"Second build failed: {result2.stdout}\n{result2.stderr}"
-            )
-            assert output_file2.exists(), "Second build output file not created"
-
-            # --- verify: outputs are identical ---
-            content1 = output_file1.read_bytes()
-            content2 = output_file2.read_bytes()
-            assert content1 == content2, (
-                "Two builds with disable_build_timestamp=True should produce "
-                "identical output"
-            )
+    # Use session-managed temp directories for builds
+    build_path1 = tmp_path_factory.mktemp("build")
+    output_file1 = build_path1 / "testpkg.py"
+
+    # --- execute: first build ---
+    result1 = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "serger",
+            "--config",
+            config_str,
+            "--out",
+            str(output_file1),
+        ],
+        cwd=tmp_path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    assert result1.returncode == 0, f"First build failed: {result1.stderr.decode()}"
+    assert output_file1.exists(), "First build output file not created"
+
+    # --- execute: second build ---
+    build_path2 = tmp_path_factory.mktemp("build")
+    output_file2 = build_path2 / "testpkg.py"
+
+    result2 = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "serger",
+            "--config",
+            config_str,
+            "--out",
+            str(output_file2),
+        ],
+        cwd=tmp_path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    assert result2.returncode == 0, f"Second build failed: {result2.stderr.decode()}"
+    assert output_file2.exists(), "Second build output file not created"
+
+    # --- verify: outputs are identical ---
+    content1 = output_file1.read_bytes()
+    content2 = output_file2.read_bytes()
+    assert content1 == content2, (
+        "Two builds with disable_build_timestamp=True should produce identical output"
+    )
 
 
 def test_zipapp_build_with_sample_code_is_deterministic(
     tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that zipbundler produces deterministic output with sample code.
@@ -124,12 +134,10 @@ def test_zipapp_build_with_sample_code_is_deterministic(
     """
     # --- setup ---
     # Create a minimal test package structure with pyproject.toml
-    pkg_dir = tmp_path / "src" / "testpkg"
-    pkg_dir.mkdir(parents=True)
-    (pkg_dir / "__init__.py").write_text('"""Test package."""\n')
-    (pkg_dir / "module.py").write_text(
-        '"""Test module."""\n\nvalue = 42\n\n'
-        'def main() -> None:\n    print("testpkg")\n'
+    shutil.copytree(
+        SAMPLE_PKG_DIR,
+        tmp_path / "src" / "testpkg",
+        ignore=shutil.ignore_patterns("__pycache__"),
     )
 
     # Create pyproject.toml for zipbundler with entry point
@@ -150,7 +158,7 @@ testpkg = "testpkg.module:main"
     (tmp_path / "dist").mkdir(exist_ok=True)
 
     # --- execute: first build ---
-    zipbundler_cmd = mod_utils.find_python_command("zipbundler")
+    zipbundler_cmd = find_build_command("zipbundler")
     result1 = subprocess.run(  # noqa: S603
         [
             *zipbundler_cmd,
@@ -162,86 +170,84 @@ testpkg = "testpkg.module:main"
             ".",
         ],
         cwd=tmp_path,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         check=False,
     )
 
     assert result1.returncode == 0, (
-        f"First zipapp build failed: {result1.stdout}\n{result1.stderr}"
+        f"First zipapp build failed: {result1.stderr.decode()}"
     )
     output_file1 = tmp_path / "dist" / "testpkg.pyz"
     assert output_file1.exists(), "First build output file not created"
 
     # Extract first build to temp directory
-    with tempfile.TemporaryDirectory() as extract_dir1:
-        extract_path1 = Path(extract_dir1)
-        with zipfile.ZipFile(output_file1, "r") as zf1:
-            zf1.extractall(extract_path1)
-
-        # Delete the output file to force a fresh build
-        output_file1.unlink()
-
-        # --- execute: second build ---
-        result2 = subprocess.run(  # noqa: S603
-            [
-                *zipbundler_cmd,
-                "-m",
-                "testpkg",
-                "-o",
-                "dist/testpkg.pyz",
-                "-q",
-                ".",
-            ],
-            cwd=tmp_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+    extract_path1 = tmp_path_factory.mktemp("extract")
+    with zipfile.ZipFile(output_file1, "r") as zf1:
+        zf1.extractall(extract_path1)
+
+    # Delete the output file to force a fresh build
+    output_file1.unlink()
+
+    # --- execute: second build ---
+    result2 = subprocess.run(  # noqa: S603
+        [
+            *zipbundler_cmd,
+            "-m",
+            "testpkg",
+            "-o",
+            "dist/testpkg.pyz",
+            "-q",
+            ".",
+        ],
+        cwd=tmp_path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+
+    assert result2.returncode == 0, (
+        f"Second zipapp build failed: {result2.stderr.decode()}"
+    )
+    output_file2 = tmp_path / "dist" / "testpkg.pyz"
+    assert output_file2.exists(), "Second build output file not created"
+
+    # Extract second build to temp directory
+    extract_path2 = tmp_path_factory.mktemp("extract")
+    with zipfile.ZipFile(output_file2, "r") as zf2:
+        zf2.extractall(extract_path2)
+
+    # --- verify: same files and content (deterministic) ---
+    # Get all files from both extracts, excluding environment.json
+    files1 = sorted(
+        f.relative_to(extract_path1)
+        for f in extract_path1.rglob("*")
+        if f.is_file() and f.name != "environment.json"
+    )
+    files2 = sorted(
+        f.relative_to(extract_path2)
+        for f in extract_path2.rglob("*")
+        if f.is_file() and f.name != "environment.json"
+    )
+
+    assert files1 == files2, (
+        "Two zipapp builds should contain the same files "
+        "(excluding environment.json). "
+        f"First: {[str(f) for f in files1]}, "
+        f"Second: {[str(f) for f in files2]}"
+    )
 
-        assert result2.returncode == 0, (
-            f"Second zipapp build failed: {result2.stdout}\n{result2.stderr}"
+    # Compare file contents one at a time
+    for rel_path in files1:
+        file1 = extract_path1 / rel_path
+        file2 = extract_path2 / rel_path
+        content1 = file1.read_bytes()
+        content2 = file2.read_bytes()
+        assert content1 == content2, (
+            f"File {rel_path} content differs between builds. "
+            "Zipapp builds should be deterministic "
+            "(excluding environment.json)."
         )
-        output_file2 = tmp_path / "dist" / "testpkg.pyz"
-        assert output_file2.exists(), "Second build output file not created"
-
-        # Extract second build to temp directory
-        with tempfile.TemporaryDirectory() as extract_dir2:
-            extract_path2 = Path(extract_dir2)
-            with zipfile.ZipFile(output_file2, "r") as zf2:
-                zf2.extractall(extract_path2)
-
-            # --- verify: same files and content (deterministic) ---
-            # Get all files from both extracts, excluding environment.json
-            files1 = sorted(
-                f.relative_to(extract_path1)
-                for f in extract_path1.rglob("*")
-                if f.is_file() and f.name != "environment.json"
-            )
-            files2 = sorted(
-                f.relative_to(extract_path2)
-                for f in extract_path2.rglob("*")
-                if f.is_file() and f.name != "environment.json"
-            )
-
-            assert files1 == files2, (
-                "Two zipapp builds should contain the same files "
-                "(excluding environment.json). "
-                f"First: {[str(f) for f in files1]}, "
-                f"Second: {[str(f) for f in files2]}"
-            )
-
-            # Compare file contents one at a time
-            for rel_path in files1:
-                file1 = extract_path1 / rel_path
-                file2 = extract_path2 / rel_path
-                content1 = file1.read_bytes()
-                content2 = file2.read_bytes()
-                assert content1 == content2, (
-                    f"File {rel_path} content differs between builds. "
-                    "Zipapp builds should be deterministic "
-                    "(excluding environment.json)."
-                )
 
 
 # ============================================================================
@@ -249,7 +255,9 @@ testpkg = "testpkg.module:main"
 # ============================================================================
 
 
-def test_serger_build_is_deterministic() -> None:
+def test_serger_build_is_deterministic(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
     """Test that two serger builds of the project produce identical output.
 
     This test:
@@ -259,68 +267,63 @@ def test_serger_build_is_deterministic() -> None:
     """
     # --- setup ---
     config_file = PROJ_ROOT / ".serger.jsonc"
+    config_file_str = str(config_file)
 
-    # Use temp directories for builds
-    with tempfile.TemporaryDirectory() as build_dir1:
-        build_path1 = Path(build_dir1)
-        output_file1 = build_path1 / "apathetic_logging.py"
-
-        # --- execute: first build with disable_build_timestamp ---
-        result1 = subprocess.run(  # noqa: S603
-            [
-                sys.executable,
-                "-m",
-                "serger",
-                "--config",
-                str(config_file),
-                "--disable-build-timestamp",
-                "--out",
-                str(output_file1),
-            ],
-            cwd=PROJ_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result1.returncode == 0, (
-            f"First build failed: {result1.stdout}\n{result1.stderr}"
-        )
-        assert output_file1.exists(), "First build output file not created"
-
-        # --- execute: second build with disable_build_timestamp ---
-        with tempfile.TemporaryDirectory() as build_dir2:
-            build_path2 = Path(build_dir2)
-            output_file2 = build_path2 / "apathetic_logging.py"
-
-            result2 = subprocess.run(  # noqa: S603
-                [
-                    sys.executable,
-                    "-m",
-                    "serger",
-                    "--config",
-                    str(config_file),
-                    "--disable-build-timestamp",
-                    "--out",
-                    str(output_file2),
-                ],
-                cwd=PROJ_ROOT,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            assert result2.returncode == 0, (
-                f"Second build failed: {result2.stdout}\n{result2.stderr}"
-            )
-            assert output_file2.exists(), "Second build output file not created"
-
-            # --- verify: outputs are identical ---
-            content1 = output_file1.read_bytes()
-            content2 = output_file2.read_bytes()
-            assert content1 == content2, (
-                "Two builds of the project with --disable-build-timestamp should "
-                "produce identical output. This ensures reproducible builds of "
-                "our actual code."
-            )
+    # Use session-managed temp directories for builds
+    build_path1 = tmp_path_factory.mktemp("build")
+    output_file1 = build_path1 / "apathetic_logging.py"
+
+    # --- execute: first build with disable_build_timestamp ---
+    result1 = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "serger",
+            "--config",
+            config_file_str,
+            "--disable-build-timestamp",
+            "--out",
+            str(output_file1),
+        ],
+        cwd=PROJ_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    assert result1.returncode == 0, f"First build failed: {result1.stderr.decode()}"
+    assert output_file1.exists(), "First build output file not created"
+
+    # --- execute: second build with disable_build_timestamp ---
+    build_path2 = tmp_path_factory.mktemp("build")
+    output_file2 = build_path2 / "apathetic_logging.py"
+
+    result2 = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "serger",
+            "--config",
+            config_file_str,
+            "--disable-build-timestamp",
+            "--out",
+            str(output_file2),
+        ],
+        cwd=PROJ_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    assert result2.returncode == 0, f"Second build failed: {result2.stderr.decode()}"
+    assert output_file2.exists(), "Second build output file not created"
+
+    # --- verify: outputs are identical ---
+    content1 = output_file1.read_bytes()
+    content2 = output_file2.read_bytes()
+    assert content1 == content2, (
+        "Two builds of the project with --disable-build-timestamp should "
+        "produce identical output. This ensures reproducible builds of "
+        "our actual code."
+    )
 
 
 def test_zipapp_build_produces_valid_file(tmp_path: Path) -> None:
@@ -333,29 +336,27 @@ def test_zipapp_build_produces_valid_file(tmp_path: Path) -> None:
     This verifies our project configuration works correctly with zipbundler.
     """
     # --- setup ---
-    # Use pytest's tmp_path to avoid race conditions in parallel test execution
-    test_id = id(test_zipapp_build_produces_valid_file)
-    zipapp_file = tmp_path / f"apathetic_logging_{test_id}.pyz"
+    # Each test gets its own tmp_path, so a fixed file name cannot collide
+    zipapp_file = tmp_path / "apathetic_logging.pyz"
+    zipapp_file_str = str(zipapp_file)
 
     # --- execute: build zipapp ---
-    zipbundler_cmd = mod_utils.find_python_command("zipbundler")
+    zipbundler_cmd = find_build_command("zipbundler")
     result = subprocess.run(  # noqa: S603
         [
             *zipbundler_cmd,
             "-o",
-            str(zipapp_file),
+            zipapp_file_str,
             "-q",
             "src",
         ],
         cwd=PROJ_ROOT,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         check=False,
     )
 
-    assert result.returncode == 0, (
-        f"Zipapp build failed: {result.stdout}\n{result.stderr}"
-    )
+    assert result.returncode == 0, f"Zipapp build failed: {result.stderr.decode()}"
 
     assert zipapp_file.exists(), "Zipapp output file not created"
 
@@ -364,10 +365,10 @@ def test_zipapp_build_produces_valid_file(tmp_path: Path) -> None:
 
     # --- verify: can be executed ---
     exec_result = subprocess.run(  # noqa: S603
-        [sys.executable, str(zipapp_file), "--help"],
+        [sys.executable, zipapp_file_str, "--help"],
         cwd=PROJ_ROOT,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         check=False,
         timeout=10,
     )
@@ -378,7 +379,10 @@ def test_zipapp_build_produces_valid_file(tmp_path: Path) -> None:
     )
 
 
-def test_zipapp_build_is_deterministic(tmp_path: Path) -> None:
+def test_zipapp_build_is_deterministic(
+    tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
     """Test that two zipapp builds of the project produce identical output.
 
     This test:
@@ -391,94 +395,92 @@ def test_zipapp_build_is_deterministic(tmp_path: Path) -> None:
     that file.
     """
     # --- setup ---
-    # Use pytest's tmp_path to avoid race conditions in parallel test execution
-    test_id = id(test_zipapp_build_is_deterministic)
-    zipapp_file = tmp_path / f"apathetic_logging_{test_id}.pyz"
+    # Each test gets its own tmp_path, so a fixed file name cannot collide
+    zipapp_file = tmp_path / "apathetic_logging.pyz"
+    zipapp_file_str = str(zipapp_file)
 
     # --- execute: first build ---
-    zipbundler_cmd = mod_utils.find_python_command("zipbundler")
+    zipbundler_cmd = find_build_command("zipbundler")
     result1 = subprocess.run(  # noqa: S603
         [
             *zipbundler_cmd,
             "-o",
-            str(zipapp_file),
+            zipapp_file_str,
             "-q",
             "src",
         ],
         cwd=PROJ_ROOT,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         check=False,
     )
 
     assert result1.returncode == 0, (
-        f"First zipapp build failed: {result1.stdout}\n{result1.stderr}"
+        f"First zipapp build failed: {result1.stderr.decode()}"
     )
     assert zipapp_file.exists(), "First build output file not created"
 
     # Extract first build to temp directory
-    with tempfile.TemporaryDirectory() as extract_dir1:
-        extract_path1 = Path(extract_dir1)
-        with zipfile.ZipFile(zipapp_file, "r") as zf1:
-            zf1.extractall(extract_path1)
-
-        # Delete the output file to force a fresh build
-        zipapp_file.unlink()
-
-        # --- execute: second build ---
-        result2 = subprocess.run(  # noqa: S603
-            [
-                *zipbundler_cmd,
-                "-o",
-                str(zipapp_file),
-                "-q",
-                "src",
-            ],
-            cwd=PROJ_ROOT,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+    extract_path1 = tmp_path_factory.mktemp("extract")
+    with zipfile.ZipFile(zipapp_file, "r") as zf1:
+        zf1.extractall(extract_path1)
+
+    # Delete the output file to force a fresh build
+    zipapp_file.unlink()
+
+    # --- execute: second build ---
+    result2 = subprocess.run(  # noqa: S603
+        [
+            *zipbundler_cmd,
+            "-o",
+            zipapp_file_str,
+            "-q",
+            "src",
+        ],
+        cwd=PROJ_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+
+    assert result2.returncode == 0, (
+        f"Second zipapp build failed: {result2.stderr.decode()}"
+    )
+    assert zipapp_file.exists(), "Second build output file not created"
+
+    # Extract second build to temp directory
+    extract_path2 = tmp_path_factory.mktemp("extract")
+    with zipfile.ZipFile(zipapp_file, "r") as zf2:
+        zf2.extractall(extract_path2)
+
+    # --- verify: same files and content (deterministic) ---
+    # Get all files from both extracts, excluding environment.json
+    files1 = sorted(
+        f.relative_to(extract_path1)
+        for f in extract_path1.rglob("*")
+        if f.is_file() and f.name != "environment.json"
+    )
+    files2 = sorted(
+        f.relative_to(extract_path2)
+        for f in extract_path2.rglob("*")
+        if f.is_file() and f.name != "environment.json"
+    )
+
+    assert files1 == files2, (
+        "Two zipapp builds of the project should contain the same files "
+        "(excluding environment.json). "
+        f"First: {[str(f) for f in files1]}, "
+        f"Second: {[str(f) for f in files2]}"
+    )
 
-        assert result2.returncode == 0, (
-            f"Second zipapp build failed: {result2.stdout}\n{result2.stderr}"
+    # Compare file contents one at a time
+    for rel_path in files1:
+        file1 = extract_path1 / rel_path
+        file2 = extract_path2 / rel_path
+        content1 = file1.read_bytes()
+        content2 = file2.read_bytes()
+        assert content1 == content2, (
+            f"File {rel_path} content differs between builds. "
+            "Zipapp builds of our project should be deterministic "
+            "(excluding environment.json)."
         )
-        assert zipapp_file.exists(), "Second build output file not created"
-
-        # Extract second build to temp directory
-        with tempfile.TemporaryDirectory() as extract_dir2:
-            extract_path2 = Path(extract_dir2)
-            with zipfile.ZipFile(zipapp_file, "r") as zf2:
-                zf2.extractall(extract_path2)
-
-            # --- verify: same files and content (deterministic) ---
-            # Get all files from both extracts, excluding environment.json
-            files1 = sorted(
-                f.relative_to(extract_path1)
-                for f in extract_path1.rglob("*")
-                if f.is_file() and f.name != "environment.json"
-            )
-            files2 = sorted(
-                f.relative_to(extract_path2)
-                for f in extract_path2.rglob("*")
-                if f.is_file() and f.name != "environment.json"
-            )
-
-            assert files1 == files2, (
-                "Two zipapp builds of the project should contain the same files "
-                "(excluding environment.json). "
-                f"First: {[str(f) for f in files1]}, "
-                f"Second: {[str(f) for f in files2]}"
-            )
-
-            # Compare file contents one at a time
-            for rel_path in files1:
-                file1 = extract_path1 / rel_path
-                file2 = extract_path2 / rel_path
-                content1 = file1.read_bytes()
-                content2 = file2.read_bytes()
-                assert content1 == content2, (
-                    f"File {rel_path} content differs between builds. "
-                    "Zipapp builds of our project should be deterministic "
-                    "(excluding environment.json)."
-                )
@@ -13,24 +13,53 @@ These are project-specific tests that verify our code works correctly
 when built with the tools (not testing the tools themselves).
 """
 
-import importlib.util
-import subprocess
+import importlib
 import sys
 import types
 import zipfile
-from typing import Any
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
 
-import apathetic_utils as mod_utils
 import pytest
 
-from tests.utils.constants import PROJ_ROOT
+from tests.utils import assert_ansi_colors, load_build_code
 
 
-def test_serger_build_import_semantics() -> None:  # noqa: PLR0915
+# Each test needs a serger/zipbundler build; skipped by `poe test:fast`, and by
+# a plain pytest run unless --run-integration is given or CI is set
+pytestmark = [pytest.mark.slow, pytest.mark.slow_build]
+
+
+@contextmanager
+def _hidden_package_modules() -> Iterator[None]:
+    """Hide apathetic_logging from sys.modules while loading a built copy.
+
+    On exit, only the entries added inside the block are dropped (a set
+    difference against a snapshot) and the hidden modules are put back.
+    """
+    hidden = {
+        name: sys.modules.pop(name)
+        for name in [
+            name
+            for name in sys.modules
+            if name == "apathetic_logging" or name.startswith("apathetic_logging.")
+        ]
+    }
+    before = frozenset(sys.modules)
+    try:
+        yield
+    finally:
+        for name in sys.modules.keys() - before:
+            del sys.modules[name]
+        sys.modules.update(hidden)
+
+
+def test_serger_build_import_semantics(serger_stitched_file: Path) -> None:
     """Test that serger build of the project maintains correct import semantics.
 
     This test verifies our project code works correctly when built with serger:
-    1. Builds the project using the actual .serger.jsonc config
+    1. Uses the session-wide build from the actual .serger.jsonc config
     2. Imports the built file and verifies import semantics work correctly:
        - apathetic_logging.ANSIColors.RED is available and correct
        - Can import and use the module from the stitched file
@@ -38,82 +67,25 @@ def test_serger_build_import_semantics() -> None:  # noqa: PLR0915
     This verifies our project configuration and code work correctly with serger.
     """
     # --- setup ---
-    expected_red_code = "\033[91m"
-    expected_reset_code = "\033[0m"
-    test_text = "Hello, world!"
-
-    # Build the project's single-file script
-    config_file = PROJ_ROOT / ".serger.jsonc"
-    output_file = PROJ_ROOT / "dist" / "apathetic_logging.py"
-
-    # Ensure dist directory exists
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # --- execute: build the project ---
-    result = subprocess.run(  # noqa: S603
-        [
-            sys.executable,
-            "-m",
-            "serger",
-            "--config",
-            str(config_file),
-        ],
-        cwd=PROJ_ROOT,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        pytest.fail(
-            f"Serger failed with return code {result.returncode}.\n"
-            f"stdout: {result.stdout}\n"
-            f"stderr: {result.stderr}"
-        )
-
-    if not output_file.exists():
-        pytest.fail(f"Stitched file not created at {output_file}")
-
-    # Import the stitched file programmatically
-    # Use a unique module name to avoid conflicts with other tests
-    built_module_name = f"apathetic_logging_serger_build_{id(output_file)}"
-    spec = importlib.util.spec_from_file_location(
-        built_module_name,
-        output_file,
-    )
-    if spec is None or spec.loader is None:
-        pytest.fail(f"Could not create import spec for {output_file}")
-
-    # Save all apathetic_logging-related modules to restore later
-    original_modules = {
-        name: mod
-        for name, mod in sys.modules.items()
-        if name == "apathetic_logging" or name.startswith("apathetic_logging.")
-    }
-
-    stitched_module = importlib.util.module_from_spec(spec)
-    sys.modules[built_module_name] = stitched_module
-
-    # Temporarily prevent the stitched module from registering "apathetic_logging"
-    # in sys.modules during execution by temporarily removing it
-    temp_removed = False
-    temp_module: types.ModuleType | None = None
-    if "apathetic_logging" in sys.modules:
-        temp_module = sys.modules.pop("apathetic_logging")
-        temp_removed = True
-
-    try:
-        spec.loader.exec_module(stitched_module)
-    except Exception as e:  # noqa: BLE001
-        pytest.fail(f"Failed to import stitched module: {e}")
-    finally:
-        # Restore apathetic_logging immediately after execution
-        # to prevent any side effects
-        if temp_removed and temp_module is not None:
-            sys.modules["apathetic_logging"] = temp_module
-        elif "apathetic_logging" in sys.modules:
-            # If it was added during execution, remove it
-            del sys.modules["apathetic_logging"]
+    output_file = serger_stitched_file
+
+    # Load the stitched file as a plain module: exec of its cached bytecode
+    # skips the import system's finder/loader round-trip and compile()
+    # A fixed name is safe: the entry only lives inside _hidden_package_modules()
+    built_module_name = "apathetic_logging_serger_build"
+    code = load_build_code(output_file)
+
+    stitched_module = types.ModuleType(built_module_name)
+    stitched_module.__file__ = str(output_file)
+
+    # The stitched file registers its own "apathetic_logging" entries in
+    # sys.modules; keep them away from the copy under test
+    with _hidden_package_modules():
+        sys.modules[built_module_name] = stitched_module
+        try:
+            exec(code, stitched_module.__dict__)  # noqa: S102
+        except Exception as e:  # noqa: BLE001
+            pytest.fail(f"Failed to import stitched module: {e}")
 
     # --- verify: import semantics ---
     # Verify apathetic_logging.ANSIColors.RED is available and correct
@@ -122,63 +94,19 @@ def test_serger_build_import_semantics() -> None:  # noqa: PLR0915
     )
 
     apathetic_logging_ns = stitched_module.apathetic_logging
-    assert hasattr(apathetic_logging_ns, "ANSIColors"), (
-        "apathetic_logging.ANSIColors should be available"
-    )
-
-    red_color = apathetic_logging_ns.ANSIColors.RED
-    reset_color = apathetic_logging_ns.ANSIColors.RESET
-
-    assert red_color == expected_red_code, (
-        f"apathetic_logging.ANSIColors.RED should be {expected_red_code!r}, "
-        f"got {red_color!r}"
-    )
-
-    assert reset_color == expected_reset_code, (
-        f"apathetic_logging.ANSIColors.RESET should be {expected_reset_code!r}, "
-        f"got {reset_color!r}"
-    )
-
-    # Verify the values work correctly when used
-    colored_string = red_color + test_text + reset_color
-    expected_colored = expected_red_code + test_text + expected_reset_code
-    assert colored_string == expected_colored, (
-        f"Colored string should be {expected_colored!r}, got {colored_string!r}"
-    )
+    assert_ansi_colors(apathetic_logging_ns)
 
     # Verify Logger class is available
     assert hasattr(apathetic_logging_ns, "Logger"), (
         "apathetic_logging.Logger should be available"
     )
 
-    # Clean up - remove our test module and any submodules it might have created
-    # Remove all modules that start with our built module name
-    modules_to_remove = [
-        name for name in list(sys.modules.keys()) if name.startswith(built_module_name)
-    ]
-    for name in modules_to_remove:
-        del sys.modules[name]
-
-    # Restore all original apathetic_logging-related modules
-    # First, remove any that were added
-    current_apathetic_modules = {
-        name
-        for name in sys.modules
-        if name == "apathetic_logging" or name.startswith("apathetic_logging.")
-    }
-    for name in current_apathetic_modules:
-        if name not in original_modules:
-            del sys.modules[name]
-    # Then restore the original ones
-    for name, mod in original_modules.items():
-        sys.modules[name] = mod
-
 
-def test_zipapp_import_semantics(tmp_path: Any) -> None:
+def test_zipapp_import_semantics(zipapp_built_file: Path) -> None:
     """Test that zipapp builds maintain correct import semantics.
 
     This test verifies our project code works correctly when built with zipbundler:
-    1. Builds apathetic_logging as a zipapp using zipbundler (from project root)
+    1. Uses the session-wide zipbundler build of apathetic_logging
     2. Imports from the zipapp and verifies import semantics work correctly:
        - apathetic_logging.ANSIColors.RED is available and correct
        - Can import and use the module from zipapp format
@@ -186,85 +114,33 @@ def test_zipapp_import_semantics(tmp_path: Any) -> None:
     This verifies our project configuration and code work correctly with zipbundler.
     """
     # --- setup ---
-    expected_red_code = "\033[91m"
-    expected_reset_code = "\033[0m"
-    test_text = "Hello, world!"
-
-    # Use pytest's tmp_path to avoid race conditions in parallel test execution
-    zipapp_file = tmp_path / f"apathetic_logging_{id(test_zipapp_import_semantics)}.pyz"
-
-    # --- execute: build zipapp ---
-    zipbundler_cmd = mod_utils.find_python_command("zipbundler")
-    result = subprocess.run(  # noqa: S603
-        [
-            *zipbundler_cmd,
-            "-o",
-            str(zipapp_file),
-            "-q",
-            "src",
-        ],
-        cwd=PROJ_ROOT,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-
-    if result.returncode != 0:
-        pytest.fail(
-            f"Zipbundler failed with return code {result.returncode}.\n"
-            f"stdout: {result.stdout}\n"
-            f"stderr: {result.stderr}"
-        )
-
-    if not zipapp_file.exists():
-        pytest.fail(f"Zipapp file not created at {zipapp_file}")
+    zipapp_file = zipapp_built_file
 
     # Verify it's a valid zip file
     assert zipfile.is_zipfile(zipapp_file), "Zipapp should be a valid zip file"
 
     # --- execute: import from zipapp ---
-    # Add zipapp to sys.path and import
-    sys.path.insert(0, str(zipapp_file))
+    # The copy under test is already in sys.modules (and a plain import would
+    # just return it), so hide it while importing from the zipapp; the warm
+    # copy is put back afterwards instead of forcing a re-import
+    zipapp_path = str(zipapp_file)
+    with _hidden_package_modules():
+        sys.path.insert(0, zipapp_path)
+        try:
+            zipapp_module = importlib.import_module("apathetic_logging")
+        finally:
+            # Remove by recorded position rather than a value scan
+            if sys.path[0] == zipapp_path:
+                del sys.path[0]
 
-    try:
-        # Import apathetic_logging from the zipapp
-        import apathetic_logging  # noqa: PLC0415
-
-        # --- verify: import semantics ---
-        # Verify apathetic_logging.ANSIColors.RED is available and correct
-        assert hasattr(apathetic_logging, "ANSIColors"), (
-            "apathetic_logging.ANSIColors should be available"
-        )
-
-        red_color = apathetic_logging.ANSIColors.RED
-        reset_color = apathetic_logging.ANSIColors.RESET
-
-        assert red_color == expected_red_code, (
-            f"apathetic_logging.ANSIColors.RED should be {expected_red_code!r}, "
-            f"got {red_color!r}"
-        )
-
-        assert reset_color == expected_reset_code, (
-            f"apathetic_logging.ANSIColors.RESET should be {expected_reset_code!r}, "
-            f"got {reset_color!r}"
-        )
-
-        # Verify the values work correctly when used
-        colored_string = red_color + test_text + reset_color
-        expected_colored = expected_red_code + test_text + expected_reset_code
-        assert colored_string == expected_colored, (
-            f"Colored string should be {expected_colored!r}, got {colored_string!r}"
-        )
-
-        # Verify Logger class is available
-        assert hasattr(apathetic_logging, "Logger"), (
-            "apathetic_logging.Logger should be available"
-        )
+    # --- verify: import semantics ---
+    assert (zipapp_module.__file__ or "").startswith(zipapp_path), (
+        f"apathetic_logging should be imported from {zipapp_path}, "
+        f"got {zipapp_module.__file__}"
+    )
+    assert_ansi_colors(zipapp_module)
 
-    finally:
-        # Clean up sys.path
-        if str(zipapp_file) in sys.path:
-            sys.path.remove(str(zipapp_file))
-        # Clean up imported modules
-        if "apathetic_logging" in sys.modules:
-            del sys.modules["apathetic_logging"]
+    # Verify Logger class is available
+    assert hasattr(zipapp_module, "Logger"), (
+        "apathetic_logging.Logger should be available"
+    )
@@ -7,31 +7,21 @@ import sys
 import apathetic_logging as mod_alogs
 
 
-def test_ensure_root_logger_sets_flag() -> None:
-    """ensureRootLogger() should set _root_logger_user_configured flag."""
-    # --- execute ---
-    mod_alogs.Logger.ensureRootLogger()
-
-    # --- verify ---
-    logger_module = sys.modules.get("apathetic_logging.logger")
-    assert getattr(logger_module, "_root_logger_user_configured", False) is True
+def test_ensure_root_logger_behavior() -> None:
+    """ensureRootLogger() should flag root as configured, return None, keep 'root'.
 
-
-def test_ensure_root_logger_returns_none() -> None:
-    """ensureRootLogger() should return None."""
+    A single call covers all three observable effects.
+    """
     # --- execute ---
     result = mod_alogs.Logger.ensureRootLogger()
 
     # --- verify ---
+    # Sets the _root_logger_user_configured flag
+    logger_module = sys.modules.get("apathetic_logging.logger")
+    assert getattr(logger_module, "_root_logger_user_configured", False) is True
+    # Returns None
     assert result is None
-
-
-def test_ensure_root_logger_root_has_correct_name() -> None:
-    """ensureRootLogger() should ensure root logger name is 'root'."""
-    # --- execute ---
-    mod_alogs.Logger.ensureRootLogger()
-
-    # --- verify ---
+    # Root logger keeps its standard name
     root_logger = logging.getLogger("")
     assert root_logger.name == "root"
 
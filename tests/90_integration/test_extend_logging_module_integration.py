@@ -2,10 +2,40 @@
 """Integration tests for extendLoggingModule() and get_logger()."""
 
 import logging
+from typing import TYPE_CHECKING
+
+import pytest
 
 import apathetic_logging as mod_alogs
 
 
+if TYPE_CHECKING:
+    from apathetic_logging import Logger  # noqa: ICN003
+else:
+    Logger = mod_alogs.Logger
+
+
+#: apathetic_logging.Logger methods every extended logger should expose
+EXPECTED_METHODS = frozenset(
+    {
+        "trace",
+        "colorize",
+        "determineLogLevel",
+        "errorIfNotDebug",
+        "criticalIfNotDebug",
+    }
+)
+
+#: (name, value) for each custom level, resolved once at import
+CUSTOM_LEVELS = (
+    ("TRACE", mod_alogs.apathetic_logging.TRACE_LEVEL),
+    ("DETAIL", mod_alogs.apathetic_logging.DETAIL_LEVEL),
+    ("BRIEF", mod_alogs.apathetic_logging.BRIEF_LEVEL),
+    ("SILENT", mod_alogs.apathetic_logging.SILENT_LEVEL),
+)
+CUSTOM_LEVEL_NAMES = frozenset(name for name, _value in CUSTOM_LEVELS)
+
+
 def test_extendLoggingModule_called_twice_is_safe() -> None:
     """Calling extendLoggingModule() twice should be safe and idempotent."""
     # --- setup ---
@@ -20,38 +50,9 @@ def test_extendLoggingModule_called_twice_is_safe() -> None:
     # Second call should return False (already extended)
     assert result2 is False
     # TRACE, DETAIL, BRIEF, and SILENT should still be available
-    assert hasattr(logging, "TRACE")
-    assert hasattr(logging, "DETAIL")
-    assert hasattr(logging, "BRIEF")
-    assert hasattr(logging, "SILENT")
-    assert logging.TRACE == mod_alogs.apathetic_logging.TRACE_LEVEL  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
-    assert logging.DETAIL == mod_alogs.apathetic_logging.DETAIL_LEVEL  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
-    assert logging.BRIEF == mod_alogs.apathetic_logging.BRIEF_LEVEL  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
-    assert logging.SILENT == mod_alogs.apathetic_logging.SILENT_LEVEL  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
-
-
-def test_extendLoggingModule_before_get_logger_works() -> None:
-    """extendLoggingModule() should work when called before get_logger()."""
-    # --- setup ---
-    mod_alogs.registerLogger("test_integration")
-
-    # --- execute ---
-    # extendLoggingModule() is already called at import, but we can verify
-    # that get_logger() works correctly
-    logger = mod_alogs.getLogger()
-
-    # --- verify ---
-    assert logger is not None
-    assert logger.name == "test_integration"
-    # Logger should be able to use TRACE, DETAIL, BRIEF, and SILENT levels
-    logger.setLevel("TRACE")
-    assert logger.levelName == "TRACE"
-    logger.setLevel("DETAIL")
-    assert logger.levelName == "DETAIL"
-    logger.setLevel("BRIEF")
-    assert logger.levelName == "BRIEF"
-    logger.setLevel("SILENT")
-    assert logger.levelName == "SILENT"
+    assert vars(logging).keys() >= CUSTOM_LEVEL_NAMES
+    for level_name, level_value in CUSTOM_LEVELS:
+        assert getattr(logging, level_name) == level_value
 
 
 def test_get_logger_works_after_extendLoggingModule() -> None:
@@ -69,69 +70,42 @@ def test_get_logger_works_after_extendLoggingModule() -> None:
     assert isinstance(logger, mod_alogs.apathetic_logging.Logger)
 
     # fallback assertions
-    assert hasattr(logger, "trace")
-    assert hasattr(logger, "colorize")
-    assert hasattr(logger, "determineLogLevel")
+    missing = EXPECTED_METHODS - set(dir(logger))
+    assert not missing, f"Logger is missing methods: {sorted(missing)}"
     # Should be able to use custom levels
-    logger.setLevel(logging.TRACE)  # type: ignore[attr-defined]
-    assert logger.level == mod_alogs.apathetic_logging.TRACE_LEVEL
-    logger.setLevel(logging.DETAIL)  # type: ignore[attr-defined]
-    assert logger.level == mod_alogs.apathetic_logging.DETAIL_LEVEL
-    logger.setLevel(logging.BRIEF)  # type: ignore[attr-defined]
-    assert logger.level == mod_alogs.apathetic_logging.BRIEF_LEVEL
-    logger.setLevel(logging.SILENT)  # type: ignore[attr-defined]
-    assert logger.level == mod_alogs.apathetic_logging.SILENT_LEVEL
-
-
-def test_logger_can_use_trace_level_after_extend() -> None:
-    """Logger should be able to use TRACE level after extendLoggingModule()."""
-    # --- setup ---
-    logger = mod_alogs.Logger("safe_trace_logger")
-    logger.setLevel("TRACE")
-
-    # --- verify ---
-    # Should be able to call trace() method
-    assert hasattr(logger, "trace")
-    assert callable(logger.trace)
-
-
-def test_logger_can_use_detail_level_after_extend() -> None:
-    """Logger should be able to use DETAIL level after extendLoggingModule()."""
-    # --- setup ---
-    logger = mod_alogs.Logger("test_detail_logger")
-    logger.setLevel("DETAIL")
-
-    # --- verify ---
-    # Should be able to call detail() method
-    assert hasattr(logger, "detail")
-    assert callable(logger.detail)
-    assert logger.levelName == "DETAIL"
-
-
-def test_logger_can_use_brief_level_after_extend() -> None:
-    """Logger should be able to use BRIEF level after extendLoggingModule()."""
-    # --- setup ---
-    logger = mod_alogs.Logger("test_brief_logger")
-    logger.setLevel("BRIEF")
-
-    # --- verify ---
-    # Should be able to call brief() method
-    assert hasattr(logger, "brief")
-    assert callable(logger.brief)
-    assert logger.levelName == "BRIEF"
-
-
-def test_logger_can_use_silent_level_after_extend() -> None:
-    """Logger should be able to use SILENT level after extendLoggingModule()."""
+    for level_name, level_value in CUSTOM_LEVELS:
+        logger.setLevel(getattr(logging, level_name))
+        assert logger.level == level_value
+
+
+@pytest.mark.parametrize(
+    ("level_name", "level_value", "method_name"),
+    [
+        ("TRACE", mod_alogs.apathetic_logging.TRACE_LEVEL, "trace"),
+        ("DETAIL", mod_alogs.apathetic_logging.DETAIL_LEVEL, "detail"),
+        ("BRIEF", mod_alogs.apathetic_logging.BRIEF_LEVEL, "brief"),
+        ("SILENT", mod_alogs.apathetic_logging.SILENT_LEVEL, None),
+    ],
+)
+def test_logger_can_use_custom_level_after_extend(
+    level_name: str,
+    level_value: int,
+    method_name: str | None,
+    direct_logger: Logger,
+) -> None:
+    """Logger should be able to use custom levels after extendLoggingModule()."""
     # --- setup ---
-    logger = mod_alogs.Logger("test_silent_logger")
+    logger = direct_logger
 
     # --- execute ---
-    logger.setLevel("SILENT")
+    logger.setLevel(level_name)
 
     # --- verify ---
-    assert logger.level == mod_alogs.apathetic_logging.SILENT_LEVEL
-    assert logger.levelName == "SILENT"
+    assert logger.level == level_value
+    assert logger.levelName == level_name
+    # Levels that emit have a matching method (SILENT has none)
+    if method_name is not None:
+        assert callable(getattr(logger, method_name, None))
 
 
 def test_extendLoggingModule_sets_logger_class() -> None:
@@ -148,28 +122,22 @@ def test_extendLoggingModule_sets_logger_class() -> None:
     # (or at least compatible with it)
     assert logger is not None
     # Should have apathetic logging methods
-    assert hasattr(logger, "trace")
-    assert hasattr(logger, "colorize")
-    assert hasattr(logger, "determineLogLevel")
+    missing = EXPECTED_METHODS - set(dir(logger))
+    assert not missing, f"Logger is missing methods: {sorted(missing)}"
 
 
 def test_multiple_calls_to_extendLoggingModule() -> None:
     """Multiple calls to extendLoggingModule() should not cause issues."""
     # --- execute ---
-    results: list[bool] = []
-    for _ in range(5):
-        result = mod_alogs.Logger.extendLoggingModule()
-        results.append(result)
+    extend = mod_alogs.Logger.extendLoggingModule
+    results = [extend() for _ in range(5)]
 
     # --- verify ---
     # First call should return True (or False if already called at import)
     # Subsequent calls should all return False
-    assert all(r is False for r in results[1:])  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+    assert all(r is False for r in results[1:])
     # TRACE, DETAIL, BRIEF, and SILENT should still be available
-    assert hasattr(logging, "TRACE")
-    assert hasattr(logging, "DETAIL")
-    assert hasattr(logging, "BRIEF")
-    assert hasattr(logging, "SILENT")
+    assert vars(logging).keys() >= CUSTOM_LEVEL_NAMES
 
 
 def test_extendLoggingModule_preserves_existing_loggers() -> None:
@@ -208,76 +176,35 @@ def test_full_integration_flow() -> None:
 
     # 4. Use logger with custom levels
     logger.setLevel("TRACE")
-    logger.trace("trace message")
+    logger.trace("%s", "trace message")
     logger.setLevel("SILENT")
-    # At SILENT level, nothing should log
-    logger.debug("should not appear")
 
     # --- verify ---
     assert logger.name == "integration_test"
     assert logger.levelName == "SILENT"
+    # At SILENT level, nothing should log
+    assert not logger.isEnabledFor(logging.DEBUG)
     # Logger should have all expected methods
-    assert hasattr(logger, "trace")
-    assert hasattr(logger, "errorIfNotDebug")
-    assert hasattr(logger, "criticalIfNotDebug")
-    assert hasattr(logger, "colorize")
-    assert hasattr(logger, "determineLogLevel")
-
-
-def test_get_logger_requires_extendLoggingModule() -> None:
-    """get_logger() should work even if extendLoggingModule() was called at import.
-
-    Note: In practice, extendLoggingModule() is always called at import time
-    in __init__.py. This test verifies that the integration works correctly.
-    """
-    # --- setup ---
-    # extendLoggingModule() is already called at import time
-    # Verify that get_logger() works correctly
-    mod_alogs.registerLogger("test_requires_extend")
-
-    # --- execute ---
-    logger = mod_alogs.getLogger()
-
-    # --- verify ---
-    # Logger should work correctly with custom levels
-    assert logger is not None
-    # Should be able to use TRACE and SILENT
-    logger.setLevel("TRACE")
-    assert logger.levelName == "TRACE"
-    logger.setLevel("SILENT")
-    assert logger.levelName == "SILENT"
-    # Should have custom methods
-    assert hasattr(logger, "trace")
+    missing = EXPECTED_METHODS - set(dir(logger))
+    assert not missing, f"Logger is missing methods: {sorted(missing)}"
 
 
 def test_extendLoggingModule_idempotent_behavior() -> None:
     """extendLoggingModule() should be idempotent - safe to call multiple times."""
     # --- setup ---
-    # Get initial state
-    initial_trace = getattr(logging, "TRACE", None)
-    initial_silent = getattr(logging, "SILENT", None)
+    # The autouse reset fixture has already extended the logging module
+    extend = mod_alogs.Logger.extendLoggingModule
 
     # --- execute ---
-    # Call multiple times
-    mod_alogs.Logger.extendLoggingModule()
-    result2 = mod_alogs.Logger.extendLoggingModule()
-    result3 = mod_alogs.Logger.extendLoggingModule()
+    results = [extend() for _ in range(3)]
 
     # --- verify ---
-    # All calls after the first should return False
-    # (First may return False if already called at import)
-    assert result2 is False
-    assert result3 is False
-    # TRACE and SILENT should still be set correctly
-    assert hasattr(logging, "TRACE")
-    assert hasattr(logging, "SILENT")
-    assert logging.TRACE == mod_alogs.apathetic_logging.TRACE_LEVEL  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
-    assert logging.SILENT == mod_alogs.apathetic_logging.SILENT_LEVEL  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
-    # Values should not change
-    if initial_trace is not None:
-        assert initial_trace == logging.TRACE  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
-    if initial_silent is not None:
-        assert initial_silent == logging.SILENT  # type: ignore[attr-defined]  # pyright: ignore[reportAttributeAccessIssue,reportUnknownMemberType]
+    # Every call is a no-op that reports it did not run
+    assert results == [False, False, False]
+    # Custom levels keep their values
+    assert vars(logging).keys() >= CUSTOM_LEVEL_NAMES
+    for level_name, level_value in CUSTOM_LEVELS:
+        assert getattr(logging, level_name) == level_value
 
 
 def test_get_logger_returns_apathetic_logger_after_extend() -> None:
@@ -285,7 +212,9 @@ def test_get_logger_returns_apathetic_logger_after_extend() -> None:
      after extendLoggingModule().
 
     This verifies that extendLoggingModule() sets the logger class correctly,
-    so that logging.getLogger() returns the right type.
+    so that logging.getLogger() returns the right type. It also covers the
+    import-time extension: no explicit extendLoggingModule() call is needed
+    before registerLogger()/getLogger().
     """
     # --- setup ---
     # extendLoggingModule() is called at import time, which sets
@@ -296,14 +225,12 @@ def test_get_logger_returns_apathetic_logger_after_extend() -> None:
     logger = mod_alogs.getLogger()
 
     # --- verify ---
+    assert logger.name == "test_logger_type"
     # Logger should have apathetic_logging.Logger methods
-    assert hasattr(logger, "trace")
-    assert hasattr(logger, "colorize")
-    assert hasattr(logger, "determineLogLevel")
-    assert hasattr(logger, "errorIfNotDebug")
-    assert hasattr(logger, "criticalIfNotDebug")
+    missing = EXPECTED_METHODS - set(dir(logger))
+    assert not missing, f"Logger is missing methods: {sorted(missing)}"
     # Should be able to use custom levels
-    logger.setLevel("TRACE")
-    assert logger.levelName == "TRACE"
-    logger.setLevel("SILENT")
-    assert logger.levelName == "SILENT"
+    for level_name, level_value in CUSTOM_LEVELS:
+        logger.setLevel(level_name)
+        assert logger.level == level_value
+        assert logger.levelName == level_name
@@ -32,165 +32,135 @@ Together they provide:
 
 PARALLEL EXECUTION NOTE
 ------------------------
-These tests use manual stream capture (io.StringIO) instead of pytest's
-caplog fixture. This approach works reliably in:
+These tests count messages with their own root handler
+(PreparedLogging.capture_messages) instead of pytest's caplog fixture.
+This approach works reliably in:
 - Serial mode (pytest without xdist)
 - Parallel mode (pytest-xdist with multiple workers)
 - Package mode (src/ imports)
 - Stitched mode (dist/ single-file)
 - Zipapp mode (dist/ .pyz bundle)
 
-Manual stream capture avoids caplog's worker process inconsistencies and
-handler identity issues in stitched mode.
+Counting on a private handler avoids caplog's worker process
+inconsistencies and handler identity issues in stitched mode.
 
 Related: test_useRootLevel_sequential_bug.py (mechanism-specific tests)
 """
 
 from __future__ import annotations
 
-import logging
-from typing import Any
+from typing import TYPE_CHECKING, Final
+
+import pytest
 
 import apathetic_logging as amod_logging
+from tests.utils import capture_root_messages
 
 
-# Maximum handlers allowed before we suspect duplication
-MAX_HANDLERS_REASONABLE = 3
+if TYPE_CHECKING:
+    from tests.utils import PreparedLogging
 
 
-def test_child_propagates_without_excessive_duplication(
-    atest_isolated_logging: Any,
+# Maximum handlers allowed before we suspect duplication
+MAX_HANDLERS_REASONABLE: Final = 3
+
+# Every message these tests emit starts with this; captures ignore the rest
+MSG_PREFIX: Final = "UNIQUE_"
+
+# Expected messages, built once rather than re-formatted in each test
+MULTI_CHILD_MSGS: Final = tuple(f"UNIQUE_MULTI_MSG_{i}_003" for i in range(1, 4))
+SEQ_MSGS: Final = tuple(f"UNIQUE_SEQ_MSG_{i}_004" for i in range(1, 6))
+SEQ_CONTEXT_MSGS: Final = tuple(
+    f"UNIQUE_SEQUENTIAL_CONTEXT_MSG_{i}_008" for i in range(1, 4)
+)
+
+
+@pytest.mark.parametrize(
+    "emits",
+    [
+        pytest.param(
+            (("child_propagate_test", "UNIQUE_CHILD_PROPAGATE_001"),),
+            id="child_propagates",
+        ),
+        pytest.param(
+            (
+                (None, "UNIQUE_ROOT_MESSAGE_002"),
+                ("child_separate_test", "UNIQUE_CHILD_MESSAGE_002"),
+            ),
+            id="root_and_child",
+        ),
+        pytest.param(
+            tuple(
+                zip(
+                    ("child_multi_1", "child_multi_2", "child_multi_3"),
+                    MULTI_CHILD_MSGS,
+                    strict=True,
+                )
+            ),
+            id="multiple_children",
+        ),
+    ],
+)
+def test_propagating_messages_no_excessive_duplication(
+    prepared_logging: PreparedLogging,
+    emits: tuple[tuple[str | None, str], ...],
 ) -> None:
-    """Verify child logger message appears without excessive duplication.
+    """Verify propagating messages each reach the root exactly once.
 
-    Uses manual stream capture to count log records. Checks that when a child logger
-    propagates to root, messages aren't duplicated excessively (e.g.,
-    14-17 times like the .plan/062 bug).
+    ``emits`` lists (logger name, message) pairs, None meaning the root
+    logger itself; children are DEBUG and propagate. Counts log records on a
+    root handler, so a message duplicated excessively (e.g., 14-17 times like
+    the .plan/062 bug) shows up as a count above one.
     """
-    root = amod_logging.getRootLogger()
-    child = amod_logging.getLogger("child_propagate_test")
-
-    root.setLevel(logging.DEBUG)
-    child.setLevel(logging.DEBUG)
-    child.propagate = True
-
-    # Capture output with manual stream redirection
-    with atest_isolated_logging.capture_streams() as capture:
-        child.debug("UNIQUE_CHILD_PROPAGATE_001")
-
-    # Count message appearances in output
-    count = capture.count_message("UNIQUE_CHILD_PROPAGATE_001")
-
-    # Should appear exactly 1 time, not 14-17 (the bug)
-    assert count == 1, (
-        f"Expected message once, got {count} times. "
-        f"This indicates duplication like .plan/062 bug."
-    )
-
-
-def test_root_and_child_logging_no_excessive_duplication(
-    atest_isolated_logging: Any,
-) -> None:
-    """Verify separate messages from root and child don't duplicate excessively."""
-    root = amod_logging.getRootLogger()
-    child = amod_logging.getLogger("child_separate_test")
-
-    root.setLevel(logging.DEBUG)
-    child.setLevel(logging.DEBUG)
-    child.propagate = True
-
-    # Capture output with manual stream redirection
-    with atest_isolated_logging.capture_streams() as capture:
-        root.debug("UNIQUE_ROOT_MESSAGE_002")
-        child.debug("UNIQUE_CHILD_MESSAGE_002")
-
-    # Each should appear exactly once
-    root_count = capture.count_message("UNIQUE_ROOT_MESSAGE_002")
-    child_count = capture.count_message("UNIQUE_CHILD_MESSAGE_002")
-
-    assert root_count == 1, (
-        f"Root message appeared {root_count} times (expected 1). Duplication detected."
+    loggers = [
+        prepared_logging.root if name is None else prepared_logging.get_child(name)
+        for name, _msg in emits
+    ]
+
+    # Count messages reaching the root logger
+    with prepared_logging.capture_messages(MSG_PREFIX) as counts:
+        for logger, (_name, msg) in zip(loggers, emits, strict=True):
+            logger.debug(msg)
+
+    # Each should appear exactly 1 time, not 14-17 (the bug); one comparison
+    # so a failure diffs every message's count at once
+    expected = {msg: 1 for _name, msg in emits}
+    assert dict(counts) == expected, (
+        f"Message counts {dict(counts)} differ from {expected}. "
+        f"A count above 1 indicates duplication like .plan/062 bug."
     )
-    assert child_count == 1, (
-        f"Child message appeared {child_count} times (expected 1). "
-        f"Duplication detected."
-    )
-
-
-def test_multiple_children_no_excessive_duplication(
-    atest_isolated_logging: Any,
-) -> None:
-    """Verify multiple child loggers propagate without excessive duplication."""
-    root = amod_logging.getRootLogger()
-    child1 = amod_logging.getLogger("child_multi_1")
-    child2 = amod_logging.getLogger("child_multi_2")
-    child3 = amod_logging.getLogger("child_multi_3")
-
-    root.setLevel(logging.DEBUG)
-    for child in [child1, child2, child3]:
-        child.setLevel(logging.DEBUG)
-        child.propagate = True
-
-    # Capture output with manual stream redirection
-    with atest_isolated_logging.capture_streams() as capture:
-        child1.debug("UNIQUE_MULTI_MSG_1_003")
-        child2.debug("UNIQUE_MULTI_MSG_2_003")
-        child3.debug("UNIQUE_MULTI_MSG_3_003")
-
-    # Each should appear exactly once
-    for i, msg in enumerate(
-        [
-            "UNIQUE_MULTI_MSG_1_003",
-            "UNIQUE_MULTI_MSG_2_003",
-            "UNIQUE_MULTI_MSG_3_003",
-        ],
-        1,
-    ):
-        count = capture.count_message(msg)
-        assert count == 1, (
-            f"Message {i} appeared {count} times (expected 1). Duplication detected."
-        )
 
 
 def test_sequential_messages_no_excessive_duplication(
-    atest_isolated_logging: Any,
+    prepared_logging: PreparedLogging,
 ) -> None:
     """Verify sequential logging doesn't cause excessive duplication."""
-    root = amod_logging.getRootLogger()
-    logger = amod_logging.getLogger("sequential_test")
+    logger = prepared_logging.get_child("sequential_test")
 
-    root.setLevel(logging.DEBUG)
-    logger.setLevel(logging.DEBUG)
-    logger.propagate = True
-
-    # Capture output with manual stream redirection
-    with atest_isolated_logging.capture_streams() as capture:
-        for i in range(1, 6):
+    # Count messages reaching the root logger
+    with prepared_logging.capture_messages(MSG_PREFIX) as counts:
+        for i in range(1, len(SEQ_MSGS) + 1):
             logger.debug("UNIQUE_SEQ_MSG_%d_004", i)
 
     # Each should appear exactly once
-    for i in range(1, 6):
-        msg = f"UNIQUE_SEQ_MSG_{i}_004"
-        count = capture.count_message(msg)
+    for i, msg in enumerate(SEQ_MSGS, 1):
+        count = counts[msg]
         assert count == 1, (
             f"Sequential message {i} appeared {count} times (expected 1). "
             f"Duplication or bleed detected."
         )
 
 
-def test_non_propagating_child_no_excessive_duplication() -> None:
+def test_non_propagating_child_no_excessive_duplication(
+    prepared_logging: PreparedLogging,
+) -> None:
     """Verify non-propagating child logger doesn't have duplicate handlers.
 
     Non-propagating loggers get their own handler. This test verifies that
     when a non-propagating logger logs, it doesn't accumulate duplicate
     handlers (e.g., 14+ handlers like the .plan/062 bug could cause).
     """
-    root = amod_logging.getRootLogger()
-    child = amod_logging.getLogger("child_no_propagate_test")
-
-    root.setLevel(logging.DEBUG)
-    child.setLevel(logging.DEBUG)
-    child.propagate = False
+    child = prepared_logging.get_child("child_no_propagate_test", propagate=False)
 
     # Log from non-propagating child to trigger handler creation
     child.debug("UNIQUE_NOPROP_MSG_005")
@@ -208,27 +178,19 @@ def test_non_propagating_child_no_excessive_duplication() -> None:
 
 
 def test_mixed_propagating_and_non_propagating_no_duplication(
-    atest_isolated_logging: Any,
+    prepared_logging: PreparedLogging,
 ) -> None:
     """Verify mix of propagating and non-propagating children works correctly."""
-    root = amod_logging.getRootLogger()
-    child_prop = amod_logging.getLogger("mixed_propagate")
-    child_no_prop = amod_logging.getLogger("mixed_no_propagate")
-
-    root.setLevel(logging.DEBUG)
-    child_prop.setLevel(logging.DEBUG)
-    child_prop.propagate = True
+    child_prop = prepared_logging.get_child("mixed_propagate")
+    child_no_prop = prepared_logging.get_child("mixed_no_propagate", propagate=False)
 
-    child_no_prop.setLevel(logging.DEBUG)
-    child_no_prop.propagate = False
-
-    # Capture output with manual stream redirection
-    with atest_isolated_logging.capture_streams() as capture:
+    # Count messages reaching the root logger
+    with prepared_logging.capture_messages(MSG_PREFIX) as counts:
         child_prop.debug("UNIQUE_PROP_MSG_XYZ_006")
         child_no_prop.debug("UNIQUE_NOPROP_MSG_ABC_006")
 
     # Check propagating message in output
-    prop_count = capture.count_message("UNIQUE_PROP_MSG_XYZ_006")
+    prop_count = counts["UNIQUE_PROP_MSG_XYZ_006"]
     assert prop_count == 1, (
         f"Propagating message appeared {prop_count} times (expected 1)."
     )
@@ -245,26 +207,25 @@ def test_mixed_propagating_and_non_propagating_no_duplication(
     )
 
 
-def test_root_level_context_no_excessive_duplication(
-    atest_isolated_logging: Any,
-) -> None:
+@pytest.mark.usefixtures("atest_isolated_logging")
+def test_root_level_context_no_excessive_duplication() -> None:
     """Verify useRootLevel context doesn't cause excessive output duplication."""
     root = amod_logging.getRootLogger()
     child = amod_logging.getLogger("context_test")
 
     child.propagate = True
 
-    # Capture output with manual stream redirection
+    # Count messages reaching the root logger
     with (
-        atest_isolated_logging.capture_streams() as capture,
+        capture_root_messages(MSG_PREFIX) as counts,
         amod_logging.useRootLevel("DEBUG"),
     ):
         root.debug("UNIQUE_CONTEXT_ROOT_MSG_007")
         child.debug("UNIQUE_CONTEXT_CHILD_MSG_007")
 
     # Each should appear exactly once
-    root_count = capture.count_message("UNIQUE_CONTEXT_ROOT_MSG_007")
-    child_count = capture.count_message("UNIQUE_CONTEXT_CHILD_MSG_007")
+    root_count = counts["UNIQUE_CONTEXT_ROOT_MSG_007"]
+    child_count = counts["UNIQUE_CONTEXT_CHILD_MSG_007"]
 
     assert root_count == 1, (
         f"Context root message appeared {root_count} times (expected 1). "
@@ -276,9 +237,8 @@ def test_root_level_context_no_excessive_duplication(
     )
 
 
-def test_sequential_root_level_contexts_no_excessive_duplication(
-    atest_isolated_logging: Any,
-) -> None:
+@pytest.mark.usefixtures("atest_isolated_logging")
+def test_sequential_root_level_contexts_no_excessive_duplication() -> None:
     """Verify sequential useRootLevel contexts don't cause excessive duplication.
 
     This is the critical test for .plan/062 bug (14-17x duplication).
@@ -288,30 +248,19 @@ def test_sequential_root_level_contexts_no_excessive_duplication(
     logger = amod_logging.getLogger("sequential_context_test")
     logger.propagate = True
 
-    # Use useRootLevel sequentially (reproduces the bug scenario)
-    with (
-        atest_isolated_logging.capture_streams() as capture1,
-        amod_logging.useRootLevel("DEBUG"),
-    ):
-        logger.debug("UNIQUE_SEQUENTIAL_CONTEXT_MSG_1_008")
-    msg1_count = capture1.count_message("UNIQUE_SEQUENTIAL_CONTEXT_MSG_1_008")
-
-    with (
-        atest_isolated_logging.capture_streams() as capture2,
-        amod_logging.useRootLevel("DEBUG"),
-    ):
-        logger.debug("UNIQUE_SEQUENTIAL_CONTEXT_MSG_2_008")
-    msg2_count = capture2.count_message("UNIQUE_SEQUENTIAL_CONTEXT_MSG_2_008")
-
-    with (
-        atest_isolated_logging.capture_streams() as capture3,
-        amod_logging.useRootLevel("DEBUG"),
-    ):
-        logger.debug("UNIQUE_SEQUENTIAL_CONTEXT_MSG_3_008")
-    msg3_count = capture3.count_message("UNIQUE_SEQUENTIAL_CONTEXT_MSG_3_008")
+    # Use useRootLevel sequentially (reproduces the bug scenario), in one test
+    # so the contexts share state; each gets a fresh capture
+    context_counts: list[int] = []
+    for msg in SEQ_CONTEXT_MSGS:
+        with (
+            capture_root_messages(MSG_PREFIX) as counts,
+            amod_logging.useRootLevel("DEBUG"),
+        ):
+            logger.debug(msg)
+        context_counts.append(counts[msg])
 
     # Each should appear exactly once (not 14-17 times like the bug)
-    for i, count in enumerate([msg1_count, msg2_count, msg3_count], 1):
+    for i, count in enumerate(context_counts, 1):
         assert count == 1, (
             f"Sequential context message {i} appeared {count} times "
             f"(expected 1). "
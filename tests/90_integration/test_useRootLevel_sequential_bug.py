@@ -11,8 +11,13 @@ and execution modes (serial, parallel with xdist).
 
 from __future__ import annotations
 
+import contextlib
+import io
 import sys
 from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
 
 import apathetic_logging as amod_logging
 
@@ -115,7 +120,7 @@ def test_useRootLevel_clears_stream_cache() -> None:
 
     # Before entering context manager, set _last_stream_ids to something
     # (simulating previous state)
-    root._last_stream_ids = (sys.stdout, sys.stderr)  # type: ignore[attr-defined]  # noqa: SLF001
+    root._last_stream_ids = root._currentStreamRefs()  # type: ignore[attr-defined]  # noqa: SLF001
 
     # Enter and exit context manager
     with amod_logging.useRootLevel("DEBUG"):
@@ -124,7 +129,41 @@ def test_useRootLevel_clears_stream_cache() -> None:
     # After exiting, _last_stream_ids should be None (cleared)
     # OR it should be reset to current stdout/stderr
     # The key is that stale stream identities should not cause re-entry loops
-    assert (
-        root._last_stream_ids is None  # type: ignore[attr-defined]  # noqa: SLF001
-        or root._last_stream_ids == (sys.stdout, sys.stderr)  # type: ignore[attr-defined]  # noqa: SLF001
-    ), f"Stream cache not properly managed: {root._last_stream_ids}"  # type: ignore[attr-defined]  # noqa: SLF001
+    stream_refs = root._last_stream_ids  # type: ignore[attr-defined]  # noqa: SLF001
+    assert stream_refs is None or (
+        stream_refs[0]() is sys.stdout and stream_refs[1]() is sys.stderr
+    ), f"Stream cache not properly managed: {stream_refs}"
+
+
+@pytest.mark.usefixtures("atest_isolated_logging")
+def test_no_rebuild_loop_with_stream_replacement() -> None:
+    """Verify replaced streams cause exactly one handler rebuild per context.
+
+    Each context redirects stdout/stderr to new buffers, so the root logger has to
+    rebuild its handler once for the new streams, and then reuse it for the
+    rest of the block. A stale stream cache shows up as a rebuild on every
+    log call (the rebuild loop behind .plan/062).
+    """
+    root = amod_logging.getRootLogger()
+
+    rebuilds_per_context: list[int] = []
+    with mock.patch.object(
+        root,
+        "_rebuildAppatheticHandlers",
+        wraps=root._rebuildAppatheticHandlers,  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    ) as rebuild:
+        for i in range(3):
+            calls_before = rebuild.call_count
+            with (
+                contextlib.redirect_stdout(io.StringIO()),
+                contextlib.redirect_stderr(io.StringIO()),
+                amod_logging.useRootLevel("TRACE"),
+            ):
+                for j in range(3):
+                    root.debug("Context %d message %d", i, j)
+            rebuilds_per_context.append(rebuild.call_count - calls_before)
+
+    assert rebuilds_per_context == [1] * len(rebuilds_per_context), (
+        f"Handler rebuilds per context: {rebuilds_per_context} (expected "
+        f"exactly 1 each). Stream changes are missed or trigger a rebuild loop."
+    )
@@ -10,8 +10,9 @@ Switch mode with: RUNTIME_MODE=stitched pytest or RUNTIME_MODE=zipapp pytest
 """
 
 import logging
+import os
 import sys
-from collections.abc import Generator
+from collections.abc import Iterator
 
 import apathetic_testing as alib_test
 import pytest
@@ -43,6 +44,48 @@ import apathetic_logging as mod_alogs  # noqa: E402
 import apathetic_logging.registry_data as mod_registry  # noqa: E402
 
 
+# Resolved once: every test's setup and teardown goes through these
+_ORIG_LOGGER_CLASS = logging.getLoggerClass()
+_REGISTRY = mod_registry.ApatheticLogging_Internal_RegistryData
+
+# Registry fields cleared before, and restored after, every test
+_REGISTRY_FIELDS = (
+    "registered_internal_logger_name",
+    "registered_internal_default_log_level",
+    "registered_internal_log_level_env_vars",
+    "registered_internal_compatibility_mode",
+    "registered_internal_propagate",
+)
+
+
+# ----------------------------------------------------------------------
+# Command-line options
+# ----------------------------------------------------------------------
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the opt-in flag for the slow serger/zipbundler build tests."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked slow_build (artifact builds); always on when CI is set",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """Skip slow_build tests unless --run-integration is given or CI is set."""
+    if config.getoption("--run-integration") or os.environ.get("CI"):
+        return
+    skip_build = pytest.mark.skip(reason="slow build test: use --run-integration")
+    for item in items:
+        if "slow_build" in item.keywords:
+            item.add_marker(skip_build)
+
+
 # ----------------------------------------------------------------------
 # Helper functions for fixture
 # ----------------------------------------------------------------------
@@ -78,75 +121,87 @@ def _restore_ensure_root_logger_flag(*, original_value: bool | None) -> None:
             logger_module._root_logger_user_configured = original_value  # type: ignore[attr-defined]  # noqa: SLF001
 
 
-def _reset_registry_state(
-    *,
-    logger_name: str | None = None,
-    default_log_level: str | None = None,
-    log_level_env_vars: list[str] | None = None,
-    compatibility_mode: bool | None = None,
-    propagate: bool | None = None,
-) -> None:
-    """Reset registry state and re-register custom level names.
-
-    Optionally accepts keyword arguments to set registry values. If not provided,
-    defaults (None) are used. This handles both test setup (clearing to None) and
-    test teardown (restoring original values).
-
-    Args:
-        logger_name: Logger name to register (or None to clear)
-        default_log_level: Default log level to register (or None to clear)
-        log_level_env_vars: Log level environment variables (or None to clear)
-        compatibility_mode: Compatibility mode setting (or None to clear)
-        propagate: Propagate setting (or None to clear)
+def _clear_logger_registry() -> None:
+    """Remove every logger from the logging manager's registry.
+
+    Equivalent to calling removeLogger() for each registered name (which just
+    pops it from loggerDict), done as one dict clear.
     """
-    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
-    _constants = mod_alogs.apathetic_logging
+    logging.Logger.manager.loggerDict.clear()
+
+
+def _logging_module_is_extended() -> bool:
+    """Return True if extendLoggingModule() would currently be a no-op.
+
+    That is: the module was extended, our Logger is the logger class and the
+    root logger is already of that type (so it would not be replaced).
+    """
+    cls = mod_alogs.Logger
+    return (
+        bool(getattr(cls, "_logging_module_extended", False))
+        and logging.getLoggerClass() is cls
+        and isinstance(logging.root, cls)
+    )
 
-    # Register custom level names
+
+def _register_custom_level_names() -> None:
+    """Re-register the custom level names a test may have clobbered."""
+    _constants = mod_alogs.apathetic_logging
     mod_alogs.Logger.addLevelName(_constants.TEST_LEVEL, "TEST")
     mod_alogs.Logger.addLevelName(_constants.TRACE_LEVEL, "TRACE")
     mod_alogs.Logger.addLevelName(_constants.DETAIL_LEVEL, "DETAIL")
     mod_alogs.Logger.addLevelName(_constants.BRIEF_LEVEL, "BRIEF")
     mod_alogs.Logger.addLevelName(_constants.SILENT_LEVEL, "SILENT")
 
-    # Set registry state
-    _registry.registered_internal_logger_name = logger_name
-    _registry.registered_internal_default_log_level = default_log_level
-    _registry.registered_internal_log_level_env_vars = log_level_env_vars
-    _registry.registered_internal_compatibility_mode = compatibility_mode
-    _registry.registered_internal_propagate = propagate
+
+def _reset_registry_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clear registry state for one test and re-register custom level names.
+
+    The registry fields are cleared through monkeypatch, which puts the
+    original values back when the test finishes.
+    """
+    _register_custom_level_names()
+    for field in _REGISTRY_FIELDS:
+        monkeypatch.setattr(_REGISTRY, field, None)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def extend_logging_module_once() -> None:
+    """Extend the logging module (custom levels, logger class) once per session."""
+    mod_alogs.Logger.extendLoggingModule()
+
+
+@pytest.fixture(scope="session")
+def original_root_logger_flag() -> bool | None:
+    """Snapshot the ensureRootLogger flag once per session.
+
+    Every test's teardown restores exactly this value, so the next test's
+    setup would only read it back.
+    """
+    return _save_ensure_root_logger_flag()
 
 
 @pytest.fixture(autouse=True)
-def reset_logger_class_and_registry() -> Generator[None, None, None]:
+def reset_logger_class_and_registry(
+    monkeypatch: pytest.MonkeyPatch,
+    original_root_logger_flag: bool | None,  # noqa: FBT001
+) -> Iterator[None]:
     """Reset logger class and registry state before and after each test.
 
     This ensures that tests that set a custom logger class or modify registry
     state don't affect subsequent tests. This is the lowest common denominator
-    needed by almost all tests.
+    needed by almost all tests. Registry fields are restored by monkeypatch;
+    the ensureRootLogger flag is captured once per session.
     """
-    # Save original state
-    original_logger_class = logging.getLoggerClass()
-    _registry = mod_registry.ApatheticLogging_Internal_RegistryData
-    original_name = _registry.registered_internal_logger_name
-    original_default = _registry.registered_internal_default_log_level
-    original_env_vars = _registry.registered_internal_log_level_env_vars
-    original_compatibility_mode = _registry.registered_internal_compatibility_mode
-    original_propagate = _registry.registered_internal_propagate
-    # Save ensureRootLogger flag state
-    original_user_configured = _save_ensure_root_logger_flag()
-
     # Clear any existing loggers from the registry
-    _logging_utils = mod_alogs.apathetic_logging
-    logger_names = list(logging.Logger.manager.loggerDict.keys())
-    for logger_name in logger_names:
-        _logging_utils.removeLogger(logger_name)
+    _clear_logger_registry()
 
-    # Reset to defaults before test
-    logging.setLoggerClass(mod_alogs.Logger)
-    mod_alogs.Logger.extendLoggingModule()
+    # Reset to defaults before test. The module is extended once per session
+    # (extend_logging_module_once); re-run only if a test undid that.
+    if not _logging_module_is_extended():
+        mod_alogs.Logger.extendLoggingModule()
     # Reset registry state and re-register custom level names
-    _reset_registry_state()
+    _reset_registry_state(monkeypatch)
     # Reset ensureRootLogger flag for test isolation
     _reset_ensure_root_logger_flag()
 
@@ -164,20 +219,14 @@ def reset_logger_class_and_registry() -> Generator[None, None, None]:
         del root.__dict__["_last_stream_ids"]
 
     # Clear loggers again after test
-    logger_names = list(logging.Logger.manager.loggerDict.keys())
-    for logger_name in logger_names:
-        _logging_utils.removeLogger(logger_name)
-
-    # Restore original state after test
-    logging.setLoggerClass(original_logger_class)
-    mod_alogs.Logger.extendLoggingModule()
-    # Restore registry state and re-register custom level names
-    _reset_registry_state(
-        logger_name=original_name,
-        default_log_level=original_default,
-        log_level_env_vars=original_env_vars,
-        compatibility_mode=original_compatibility_mode,
-        propagate=original_propagate,
-    )
+    _clear_logger_registry()
+
+    # Restore original state after test. Only a test that swapped the logger
+    # class needs re-extending here; the next test's setup extends regardless.
+    if logging.getLoggerClass() is not _ORIG_LOGGER_CLASS:
+        logging.setLoggerClass(_ORIG_LOGGER_CLASS)
+        mod_alogs.Logger.extendLoggingModule()
+    # Re-register custom level names (monkeypatch restores the registry fields)
+    _register_custom_level_names()
     # Restore ensureRootLogger flag state
-    _restore_ensure_root_logger_flag(original_value=original_user_configured)
+    _restore_ensure_root_logger_flag(original_value=original_root_logger_flag)
@@ -1,6 +1,21 @@
 # tests/utils/__init__.py
 
 
+from .ansi_semantics import (
+    EXPECTED_COLORED,
+    EXPECTED_RED,
+    EXPECTED_RESET,
+    assert_ansi_colors,
+)
+from .build_cache import (
+    BUILD_CACHE_DIR,
+    build_cache_path,
+    bytecode_path,
+    compile_build,
+    find_build_command,
+    load_build_code,
+    store_build,
+)
 from .constants import (
     BUNDLER_SCRIPT,
     DEFAULT_TEST_LOG_LEVEL,
@@ -14,9 +29,29 @@ from .constants import (
 from .debug_logger import debug_logger_summary
 from .level_validation import validate_test_level
 from .log_fixtures import direct_logger, module_logger
+from .prepared_logging import (
+    MessageCounter,
+    PreparedLogging,
+    capture_root_messages,
+    ensure_single_handler,
+)
+from .std_camel_cases import MODULE_STD_CAMEL_TESTS
 
 
 __all__ = [  # noqa: RUF022
+    # ansi_semantics
+    "EXPECTED_COLORED",
+    "EXPECTED_RED",
+    "EXPECTED_RESET",
+    "assert_ansi_colors",
+    # build_cache
+    "BUILD_CACHE_DIR",
+    "build_cache_path",
+    "bytecode_path",
+    "compile_build",
+    "find_build_command",
+    "load_build_code",
+    "store_build",
     # constants
     "BUNDLER_SCRIPT",
     "DEFAULT_TEST_LOG_LEVEL",
@@ -33,4 +68,11 @@ __all__ = [  # noqa: RUF022
     # log_fixtures
     "direct_logger",
     "module_logger",
+    # prepared_logging
+    "MessageCounter",
+    "PreparedLogging",
+    "capture_root_messages",
+    "ensure_single_handler",
+    # std_camel_cases
+    "MODULE_STD_CAMEL_TESTS",
 ]
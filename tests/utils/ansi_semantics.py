@@ -0,0 +1,39 @@
+# tests/utils/ansi_semantics.py
+"""Shared ANSIColors expectations for the import-semantics tests."""
+
+from typing import Any, Final
+
+
+# Expected ANSI escape codes (RED is used as the example to verify import semantics)
+EXPECTED_RED: Final = "\033[91m"
+EXPECTED_RESET: Final = "\033[0m"
+EXPECTED_COLORED: Final = f"{EXPECTED_RED}Hello, world!{EXPECTED_RESET}"
+
+
+def assert_ansi_colors(namespace: Any) -> None:
+    """Assert ``namespace.ANSIColors`` exposes the expected RED/RESET codes.
+
+    ``namespace`` is whatever object the import under test produced: the
+    package itself, or the apathetic_logging namespace of a built artifact.
+    """
+    assert hasattr(namespace, "ANSIColors"), (
+        "apathetic_logging.ANSIColors should be available"
+    )
+
+    red_color = namespace.ANSIColors.RED
+    reset_color = namespace.ANSIColors.RESET
+
+    assert red_color == EXPECTED_RED, (
+        f"apathetic_logging.ANSIColors.RED should be {EXPECTED_RED!r}, "
+        f"got {red_color!r}"
+    )
+    assert reset_color == EXPECTED_RESET, (
+        f"apathetic_logging.ANSIColors.RESET should be {EXPECTED_RESET!r}, "
+        f"got {reset_color!r}"
+    )
+
+    # Verify the values work correctly when used
+    colored_string = f"{red_color}Hello, world!{reset_color}"
+    assert colored_string == EXPECTED_COLORED, (
+        f"Colored string should be {EXPECTED_COLORED!r}, got {colored_string!r}"
+    )
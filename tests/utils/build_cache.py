@@ -0,0 +1,112 @@
+# tests/utils/build_cache.py
+"""On-disk cache for serger/zipbundler build artifacts used by the tests."""
+
+import functools
+import hashlib
+import importlib.util
+import marshal
+import os
+import py_compile
+import shutil
+import sys
+from importlib.metadata import version
+from pathlib import Path
+from types import CodeType
+
+import apathetic_utils as mod_utils
+
+from .constants import PROJ_ROOT
+
+
+#: Directory holding cached build artifacts (inside pytest's own cache dir)
+BUILD_CACHE_DIR = PROJ_ROOT / ".pytest_cache" / "builds"
+
+
+@functools.cache
+def find_build_command(command: str) -> tuple[str, ...]:
+    """Resolve a build tool's command line once per process.
+
+    Wraps apathetic_utils.find_python_command, which probes PATH and the
+    virtualenv managers (spawning subprocesses for some) on every call.
+    """
+    return tuple(mod_utils.find_python_command(command))
+
+
+def build_cache_path(tool: str, filename: str, *inputs: Path) -> Path:
+    """Return the cache path for building src/ with ``tool``.
+
+    The path embeds a digest of every file under src/ (skipping bytecode),
+    the extra ``inputs`` (e.g. the tool's config file) and the installed tool
+    version, so any change to them points at a new, not-yet-built artifact.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{tool}=={version(tool)}".encode())
+    src_dir = PROJ_ROOT / "src"
+    src_files = sorted(
+        path
+        for path in src_dir.rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts
+    )
+    for path in (*src_files, *inputs):
+        digest.update(path.relative_to(PROJ_ROOT).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+
+    stem, dot, suffix = filename.rpartition(".")
+    return BUILD_CACHE_DIR / f"{stem}_{tool}_{digest.hexdigest()}{dot}{suffix}"
+
+
+def store_build(built_file: Path, cached_file: Path) -> Path:
+    """Copy a fresh build into the cache and return the cached path.
+
+    The copy is written next to its destination and renamed into place, so
+    concurrent xdist workers never see a partially written artifact.
+    Entries left by earlier builds with the same tool (older digests and
+    their bytecode) are deleted, so the cache holds one build per tool.
+    """
+    cached_file.parent.mkdir(parents=True, exist_ok=True)
+    partial_file = cached_file.with_name(f"{cached_file.name}.{os.getpid()}.tmp")
+    shutil.copyfile(built_file, partial_file)
+    partial_file.replace(cached_file)
+
+    tool_prefix = cached_file.stem.rpartition("_")[0]
+    for stale_file in cached_file.parent.glob(f"{tool_prefix}_*"):
+        if not stale_file.name.startswith(cached_file.stem):
+            stale_file.unlink(missing_ok=True)
+    return cached_file
+
+
+def bytecode_path(built_file: Path) -> Path:
+    """Return where the bytecode for a cached single-file build is kept.
+
+    The interpreter's cache tag is part of the name, so interpreters sharing
+    the cache directory never read each other's bytecode.
+    """
+    return built_file.with_name(f"{built_file.stem}.{sys.implementation.cache_tag}.pyc")
+
+
+def compile_build(built_file: Path) -> Path:
+    """Byte-compile a cached single-file build once; return the .pyc path."""
+    cfile = bytecode_path(built_file)
+    if not cfile.exists():
+        py_compile.compile(str(built_file), cfile=str(cfile), doraise=True)
+    return cfile
+
+
+def load_build_code(built_file: Path) -> CodeType:
+    """Return the code object for a single-file build.
+
+    Unmarshals the bytecode written by compile_build() when it is present and
+    matches this interpreter, and falls back to compiling the source.
+    """
+    try:
+        data = bytecode_path(built_file).read_bytes()
+        if data[:4] == importlib.util.MAGIC_NUMBER:
+            # Our own py_compile output for a digest-named file we just built
+            code = marshal.loads(data[16:])  # noqa: S302
+            if isinstance(code, CodeType):
+                return code
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return compile(built_file.read_bytes(), str(built_file), "exec", dont_inherit=True)
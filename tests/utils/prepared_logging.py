@@ -0,0 +1,108 @@
+# tests/utils/prepared_logging.py
+"""Pre-configured loggers and handlers for the integration tests."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import apathetic_logging as mod_alogs
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+
+    from apathetic_logging import Logger  # noqa: ICN003
+
+
+_HandlerT = TypeVar("_HandlerT", bound=logging.Handler)
+
+
+def ensure_single_handler(
+    logger: logging.Logger,
+    handler_cls: type[_HandlerT],
+    *,
+    factory: Callable[[], _HandlerT],
+) -> _HandlerT:
+    """Return ``logger``'s ``handler_cls`` handler, adding one if it has none.
+
+    Use instead of clearing ``logger.handlers`` and re-adding: an existing
+    handler is reused rather than dropped without being closed, and calling
+    it twice never leaves two handlers behind.
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, handler_cls):
+            return handler
+    handler = factory()
+    logger.addHandler(handler)
+    return handler
+
+
+class MessageCounter(logging.Handler):
+    """Handler that tallies the formatted message of every record it sees.
+
+    Only messages starting with ``prefix`` are counted, so records from
+    unrelated loggers that reach the same handler are dropped.
+    """
+
+    def __init__(self, prefix: str = "") -> None:
+        super().__init__(logging.DEBUG)
+        self.prefix = prefix
+        self.counts: Counter[str] = Counter()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count the record's message.
+
+        A plain string message with no arguments is counted as-is, skipping
+        the str()/%-formatting round trip of getMessage().
+        """
+        msg = record.msg
+        if record.args or not isinstance(msg, str):
+            msg = record.getMessage()
+        if msg.startswith(self.prefix):
+            self.counts[msg] += 1
+
+
+@contextmanager
+def capture_root_messages(prefix: str = "") -> Iterator[Counter[str]]:
+    """Count messages reaching the root logger while the block runs.
+
+    Each message is formatted once as it arrives, so checking how often one
+    appeared is a dict lookup rather than a scan of every record. Only
+    messages starting with ``prefix`` are counted.
+    """
+    handler = MessageCounter(prefix)
+    mod_alogs.getRootLogger().addHandler(handler)
+    try:
+        yield handler.counts
+    finally:
+        mod_alogs.getRootLogger().removeHandler(handler)
+
+
+@dataclass(frozen=True)
+class PreparedLogging:
+    """The root logger (already at DEBUG) and a DEBUG child factory.
+
+    Built by the prepared_logging fixture on top of atest_isolated_logging, so
+    duplication tests only have to emit and count.
+    """
+
+    root: Logger
+    isolation: Any
+
+    def get_child(self, name: str, *, propagate: bool = True) -> Logger:
+        """Return logger ``name`` set to DEBUG with the given propagation."""
+        child = mod_alogs.getLogger(name)
+        child.setLevel(logging.DEBUG)
+        child.propagate = propagate
+        return child
+
+    def capture_messages(
+        self, prefix: str = ""
+    ) -> AbstractContextManager[Counter[str]]:
+        """Count messages reaching the root logger (see capture_root_messages)."""
+        return capture_root_messages(prefix)
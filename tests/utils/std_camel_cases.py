@@ -0,0 +1,65 @@
+# tests/utils/std_camel_cases.py
+"""Shared parametrize cases for module-level stdlib camelCase wrappers."""
+
+from __future__ import annotations
+
+import logging
+from types import ModuleType
+
+from .level_validation import validate_test_level
+
+
+# Safe test level value (26 is between BRIEF=25 and WARNING=30)
+TEST_LEVEL_VALUE = 26
+validate_test_level(TEST_LEVEL_VALUE)
+
+# Shared args tuple for the message-style wrappers (critical, debug, ...)
+_MSG: tuple[object, ...] = ("test",)
+
+#: All stdlib module-level camelCase functions and their test parameters.
+#: Format: (function_name, args, kwargs, mock_target, target_python_version)
+#: mock_target is a (module, attribute_name) pair resolved at import time.
+#: target_python_version is (major, minor) tuple or None if available in
+#: TARGET_PYTHON_VERSION+
+MODULE_STD_CAMEL_TESTS: tuple[
+    tuple[
+        str,
+        tuple[object, ...],
+        dict[str, object],
+        tuple[ModuleType, str],
+        tuple[int, int] | None,
+    ],
+    ...,
+] = (
+    ("basicConfig", (), {}, (logging, "basicConfig"), None),
+    (
+        "addLevelName",
+        (TEST_LEVEL_VALUE, "CUSTOM_TEST_LEVEL"),
+        {},
+        (logging, "addLevelName"),
+        None,
+    ),
+    ("getLevelName", (logging.DEBUG,), {}, (logging, "getLevelName"), None),
+    ("getLevelNamesMapping", (), {}, (logging, "getLevelNamesMapping"), (3, 11)),
+    ("getLoggerClass", (), {}, (logging, "getLoggerClass"), None),
+    ("setLoggerClass", (object,), {}, (logging, "setLoggerClass"), None),
+    ("getLogRecordFactory", (), {}, (logging, "getLogRecordFactory"), None),
+    ("setLogRecordFactory", (object,), {}, (logging, "setLogRecordFactory"), None),
+    ("shutdown", (), {}, (logging, "shutdown"), None),
+    ("disable", (logging.DEBUG,), {}, (logging, "disable"), None),
+    ("captureWarnings", (True,), {}, (logging, "captureWarnings"), None),
+    ("critical", _MSG, {}, (logging, "critical"), None),
+    ("debug", _MSG, {}, (logging, "debug"), None),
+    ("error", _MSG, {}, (logging, "error"), None),
+    ("exception", _MSG, {"exc_info": True}, (logging, "exception"), None),
+    ("fatal", _MSG, {}, (logging, "fatal"), None),
+    ("info", _MSG, {}, (logging, "info"), None),
+    ("log", (logging.INFO, "test"), {}, (logging, "log"), None),
+    ("warn", _MSG, {}, (logging, "warning"), None),
+    ("warning", _MSG, {}, (logging, "warning"), None),
+    ("getLogger", ("test",), {}, (logging, "getLogger"), None),
+    ("makeLogRecord", ({"name": "test"},), {}, (logging, "makeLogRecord"), None),
+    ("currentframe", (), {}, (logging, "currentframe"), None),
+    ("getHandlerNames", (), {}, (logging, "getHandlerNames"), (3, 12)),
+    ("getHandlerByName", ("test",), {}, (logging, "getHandlerByName"), (3, 12)),
+)